@@ -0,0 +1,147 @@
+"""Benchmark: Lesen von Sensordaten (pd.read_sql vs. COPY nach Arrow).
+
+Vergleicht den bisherigen Lesepfad (``pd.read_sql`` mit ``parse_dates`` und
+Umrechnung der Zeitzone je Wert per ``map(lambda x: x.tz_convert(...))``) mit
+``read_dataframe`` (``COPY ... TO STDOUT`` in den CSV-Parser von Arrow,
+vektorisierte Umrechnung per ``dt.tz_convert``). Gelesen wird die Abfrage aus
+``query_all_data`` über synthetische Messwerte.
+
+Benötigt eine erreichbare Datenbank aus ``config.yaml``. Geschrieben und
+anschließend wieder gelöscht werden nur Messwerte der Sensoren mit der Box-ID
+``BENCHMARK_BOX_ID``.
+
+Aufruf: ``uv run benchmarks/bench_arrow_read.py [num_rows]``
+"""
+
+import sys
+from pathlib import Path
+from timeit import default_timer as timer
+
+import pandas as pd
+from sqlalchemy import text
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.ffm_dashboard.db import (  # noqa: E402
+    DbCon,
+    SensorMetadata,
+    read_arrow,
+    read_dataframe,
+)
+from src.ffm_dashboard.db.sensor_data_db_service import (  # noqa: E402
+    PLOT_TIMEZONE,
+    _select_sensor_data_with_metadata,
+)
+
+BENCHMARK_BOX_ID = "benchmark-arrow-read"
+NUM_SENSORS = 6
+
+
+def insert_benchmark_rows(db_con: DbCon, num_rows: int) -> None:
+    """
+    Legt die Sensoren der Benchmark-Box an und schreibt ``num_rows`` Messwerte
+    im Abstand von drei Minuten.
+
+    :param db_con: Datenbankverbindung.
+    :type db_con: DbCon
+    :param num_rows: Anzahl der Messwerte.
+    :type num_rows: int
+    """
+
+    with db_con.engine.begin() as connection:
+        connection.execute(
+            text(
+                "INSERT INTO sensor_metadata "
+                "(sensor_id, box_id, unit, sensor_type, icon, title) "
+                "SELECT :box_id || '-' || i, :box_id, '°C', 'HDC1080', "
+                "'osem-thermometer', 'Temperatur' FROM generate_series(1, :num) i"
+            ),
+            {"box_id": BENCHMARK_BOX_ID, "num": NUM_SENSORS},
+        )
+        connection.execute(
+            text(
+                "INSERT INTO sensor_data (timestamp, measurement, sensor_key) "
+                "SELECT timestamp '2025-06-26' - i * interval '3 minutes', "
+                "20 + 5 * random(), sensor_key "
+                "FROM generate_series(1, :per_sensor) i, sensor_metadata "
+                "WHERE box_id = :box_id"
+            ),
+            {"box_id": BENCHMARK_BOX_ID, "per_sensor": num_rows // NUM_SENSORS},
+        )
+
+
+def delete_benchmark_rows(db_con: DbCon) -> None:
+    """Löscht alle vom Benchmark geschriebenen Messwerte und Sensoren."""
+
+    with db_con.engine.begin() as connection:
+        connection.execute(
+            text(
+                "DELETE FROM sensor_data WHERE sensor_key IN "
+                "(SELECT sensor_key FROM sensor_metadata WHERE box_id = :box_id)"
+            ),
+            {"box_id": BENCHMARK_BOX_ID},
+        )
+        connection.execute(
+            text("DELETE FROM sensor_metadata WHERE box_id = :box_id"),
+            {"box_id": BENCHMARK_BOX_ID},
+        )
+
+
+def read_legacy(db_con: DbCon, query) -> pd.DataFrame:
+    """Bisheriger Pfad aus ``query_all_data`` und ``query_plot_data``."""
+
+    df = pd.read_sql(query, db_con.engine, parse_dates=["timestamp"])
+    df["timestamp"] = df["timestamp"].map(lambda x: x.tz_convert(PLOT_TIMEZONE))
+    return df
+
+
+def read_copy(db_con: DbCon, query) -> pd.DataFrame:
+    """Neuer Pfad über COPY und Arrow."""
+
+    df = read_dataframe(db_con, query)
+    df["timestamp"] = df["timestamp"].dt.tz_convert(PLOT_TIMEZONE)
+    return df
+
+
+def main(num_rows: int = 1_000_000) -> None:
+    """
+    Führt den Benchmark aus und gibt die Laufzeit je Pfad aus.
+
+    :param num_rows: Anzahl der gelesenen Messwerte.
+    :type num_rows: int
+    """
+
+    db_con = DbCon()
+    delete_benchmark_rows(db_con)
+    insert_benchmark_rows(db_con, num_rows)
+    query = _select_sensor_data_with_metadata().where(
+        SensorMetadata.box_id == BENCHMARK_BOX_ID
+    )
+    try:
+        candidates: dict = {
+            "read_sql + map": lambda: read_legacy(db_con, query),
+            "copy -> arrow": lambda: read_arrow(db_con, query),
+            "copy -> pandas": lambda: read_copy(db_con, query),
+        }
+        results: dict[str, object] = {}
+        baseline: float | None = None
+        print(f"{num_rows} rows")
+        for name, func in candidates.items():
+            start = timer()
+            results[name] = func()
+            elapsed: float = timer() - start
+            baseline = baseline or elapsed
+            print(f"{name:<24} {elapsed:8.2f} s  ({baseline / elapsed:5.1f}x)")
+
+        # Ohne ORDER BY kann die Reihenfolge der Zeilen je Lauf abweichen
+        legacy, fast = (
+            results[name].sort_values(["sensor_id", "timestamp"], ignore_index=True)
+            for name in ("read_sql + map", "copy -> pandas")
+        )
+        print(f"identical result: {legacy.equals(fast)}")
+    finally:
+        delete_benchmark_rows(db_con)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,157 @@
+"""Benchmark: Massenimport historischer Parquet-Daten (to_sql vs. COPY).
+
+Vergleicht den bisherigen Pfad (``read_parquet`` + Pandantic +
+``to_sql(method="multi", chunksize=5000)``) mit dem ``SensorDataCopyLoader``
+(Row-Groups per ``COPY`` in eine Staging-Tabelle, danach
+``INSERT ... ON CONFLICT DO NOTHING``) anhand einer synthetischen Parquet-Datei.
+Zusätzlich wird die Datei ein zweites Mal per COPY geladen, um den
+idempotenten Wiederholungslauf zu messen.
+
+Benötigt eine erreichbare Datenbank aus ``config.yaml``. Geschrieben und
+anschließend wieder gelöscht werden nur Messwerte der Sensoren mit der Box-ID
+``BENCHMARK_BOX_ID``.
+
+Aufruf: ``uv run benchmarks/bench_bulk_load.py``
+"""
+
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from timeit import default_timer as timer
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pandantic import Pandantic
+from sqlalchemy import text
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.ffm_dashboard.datalake import SENSOR_DATA_SCHEMA  # noqa: E402
+from src.ffm_dashboard.db import (  # noqa: E402
+    DbCon,
+    SensorData,
+    SensorDataCopyLoader,
+    SensorKeyCache,
+)
+from src.ffm_dashboard.utils import SensorDataModel  # noqa: E402
+
+BENCHMARK_BOX_ID = "benchmark-bulk-load"
+
+
+def create_parquet_file(file_path: Path, num_rows: int) -> None:
+    """
+    Schreibt eine Parquet-Datei mit synthetischen Messwerten von sechs Sensoren.
+
+    :param file_path: Pfad der Parquet-Datei.
+    :type file_path: pathlib.Path
+    :param num_rows: Anzahl der Messwerte.
+    :type num_rows: int
+    """
+
+    num_sensors = 6
+    timestamps = pd.date_range(
+        end="2025-06-26", periods=num_rows // num_sensors + 1, freq="3min", tz="UTC"
+    )
+    df = pd.DataFrame(
+        {
+            "timestamp": np.repeat(timestamps, num_sensors)[:num_rows],
+            "measurement": np.random.default_rng(42).normal(20, 5, num_rows),
+            "box_id": BENCHMARK_BOX_ID,
+            "sensor_id": np.tile(
+                [f"sensor-{i}" for i in range(num_sensors)], len(timestamps)
+            )[:num_rows],
+            "title": "Temperatur",
+            "unit": "°C",
+            "sensor_type": "HDC1080",
+            "icon": "osem-thermometer",
+        }
+    )
+    pq.write_table(
+        pa.Table.from_pandas(df, schema=SENSOR_DATA_SCHEMA, preserve_index=False),
+        file_path,
+        row_group_size=128_000,
+    )
+
+
+def load_legacy(
+    db_con: DbCon, sensor_key_cache: SensorKeyCache, file_path: Path
+) -> None:
+    """Bisheriger Pfad aus ``bulk_write_sensor_data_to_db`` (mit Sensor-Schlüsseln)."""
+
+    df = pd.read_parquet(file_path)
+    df["measurement"] = pd.to_numeric(df["measurement"], errors="coerce")
+    validated_df = Pandantic(schema=SensorDataModel).validate(df, errors="skip")
+    sensor_keys = sensor_key_cache.get_sensor_keys(validated_df)
+    validated_df = validated_df.assign(
+        sensor_key=validated_df["sensor_id"].map(sensor_keys)
+    )[["timestamp", "measurement", "sensor_key"]]
+    with db_con.get_session()() as session:
+        validated_df.to_sql(
+            name=SensorData.__tablename__,
+            con=session.bind,
+            if_exists="append",
+            index=False,
+            chunksize=5000,
+            method="multi",
+        )
+
+
+def delete_benchmark_rows(db_con: DbCon, with_metadata: bool = False) -> None:
+    """Löscht alle vom Benchmark geschriebenen Messwerte (und Sensoren)."""
+
+    with db_con.engine.begin() as connection:
+        connection.execute(
+            text(
+                "DELETE FROM sensor_data WHERE sensor_key IN "
+                "(SELECT sensor_key FROM sensor_metadata WHERE box_id = :box_id)"
+            ),
+            {"box_id": BENCHMARK_BOX_ID},
+        )
+        if with_metadata:
+            connection.execute(
+                text("DELETE FROM sensor_metadata WHERE box_id = :box_id"),
+                {"box_id": BENCHMARK_BOX_ID},
+            )
+
+
+def main(num_rows: int = 300_000) -> None:
+    """
+    Führt den Benchmark aus und gibt die Laufzeit je Pfad aus.
+
+    :param num_rows: Anzahl der Messwerte in der Parquet-Datei.
+    :type num_rows: int
+    """
+
+    db_con = DbCon()
+    sensor_key_cache = SensorKeyCache(db_con)
+    copy_loader = SensorDataCopyLoader(db_con, sensor_key_cache)
+    with TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / "part-0.parquet"
+        create_parquet_file(file_path, num_rows)
+
+        candidates: dict = {
+            "legacy to_sql multi": lambda: load_legacy(
+                db_con, sensor_key_cache, file_path
+            ),
+            "copy + merge": lambda: copy_loader.load_file(file_path),
+        }
+        baseline: float | None = None
+        print(f"{num_rows} rows")
+        for name, func in candidates.items():
+            delete_benchmark_rows(db_con)
+            start = timer()
+            func()
+            elapsed: float = timer() - start
+            baseline = baseline or elapsed
+            print(f"{name:<24} {elapsed:8.2f} s  ({baseline / elapsed:5.1f}x)")
+
+        start = timer()
+        result = copy_loader.load_file(file_path)
+        print(f"{'copy + merge (rerun)':<24} {timer() - start:8.2f} s  {result}")
+        delete_benchmark_rows(db_con, with_metadata=True)
+
+
+if __name__ == "__main__":
+    main()
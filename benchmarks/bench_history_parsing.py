@@ -0,0 +1,93 @@
+"""Benchmark: Einlesen der historischen Sensordaten (JSON vs. CSV-Pfad).
+
+Vergleicht den bisherigen Pfad (``json_normalize`` + ``copy`` + ``dropna`` +
+``to_datetime``) mit den neuen Parsern des ``SenseBoxDataLoader`` anhand einer
+synthetischen Antwort mit der maximalen Zeilenanzahl des ``/data``-Endpunkts.
+
+Aufruf: ``uv run benchmarks/bench_history_parsing.py``
+"""
+
+import json
+import sys
+from pathlib import Path
+from timeit import repeat
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.ffm_dashboard.components.interval_planner import (  # noqa: E402
+    API_ROW_LIMIT,
+)
+from src.ffm_dashboard.components.sense_box_api import (  # noqa: E402
+    SenseBoxDataLoader,
+)
+
+
+def create_payloads(num_rows: int) -> tuple[bytes, bytes]:
+    """
+    Erzeugt eine JSON- und eine CSV-Antwort mit gleichem Inhalt.
+
+    :param num_rows: Anzahl der Messwerte.
+    :type num_rows: int
+    :return: Tupel aus JSON- und CSV-Rohdaten.
+    :rtype: tuple[bytes, bytes]
+    """
+
+    timestamps = pd.date_range(end="2025-06-26", periods=num_rows, freq="3min")[::-1]
+    created_at = timestamps.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    values = np.round(np.random.default_rng(42).normal(20, 5, num_rows), 2).astype(str)
+
+    json_payload = json.dumps(
+        [
+            {"value": value, "location": [8.68, 50.11], "createdAt": ts}
+            for value, ts in zip(values, created_at)
+        ]
+    ).encode()
+    csv_payload = (
+        "createdAt,value\n"
+        + "\n".join(f"{ts},{value}" for ts, value in zip(created_at, values))
+    ).encode()
+    return json_payload, csv_payload
+
+
+def parse_legacy(payload: bytes) -> pd.DataFrame:
+    """Bisheriger Pfad aus ``fetch_historical_data_for_one_sensor``."""
+
+    df = pd.json_normalize(json.loads(payload))
+    df = df.dropna(subset=["createdAt", "value"])
+    df_filtered = df.copy()
+    df_filtered["timestamp"] = pd.to_datetime(df_filtered["createdAt"])
+    return df_filtered[["timestamp", "value"]].rename(columns={"value": "measurement"})
+
+
+def main(num_rows: int = API_ROW_LIMIT, runs: int = 20) -> None:
+    """
+    Führt den Benchmark aus und gibt die beste Laufzeit je Pfad aus.
+
+    :param num_rows: Anzahl der Messwerte pro Antwort.
+    :type num_rows: int
+    :param runs: Anzahl der Wiederholungen pro Pfad.
+    :type runs: int
+    """
+
+    json_payload, csv_payload = create_payloads(num_rows)
+    candidates: dict = {
+        "legacy json_normalize": lambda: parse_legacy(json_payload),
+        "json from_records": lambda: SenseBoxDataLoader.parse_json_history(
+            json.loads(json_payload)
+        ),
+        "csv pyarrow": lambda: SenseBoxDataLoader.parse_csv_history(csv_payload),
+    }
+
+    baseline: float | None = None
+    print(f"{num_rows} rows, best of {runs} runs")
+    for name, func in candidates.items():
+        best: float = min(repeat(func, number=1, repeat=runs))
+        baseline = baseline or best
+        print(f"{name:<24} {best * 1000:8.2f} ms  ({baseline / best:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
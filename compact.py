@@ -0,0 +1,101 @@
+"""Compaction der historischen Parquet-Daten im Datenverzeichnis."""
+
+import argparse
+from pathlib import Path
+from typing import Final
+
+from loguru import logger
+
+from src.ffm_dashboard.datalake import PartitionCompactor
+from src.ffm_dashboard.datalake.compaction import DEFAULT_TARGET_ROWS_PER_FILE
+
+DATA_PATH: Final = Path(__file__).parent / "data"
+
+PARTITION_PREFIX: Final = "sensor_partition="
+"""Namensanfang der Sensor-Partitionen im Datenverzeichnis einer Box."""
+
+
+def find_box_dirs(data_path: Path) -> list[Path]:
+    """
+    Sucht die Datenverzeichnisse der einzelnen Boxen (``data/<box_id>``). Enthält
+    ``data_path`` selbst Sensor-Partitionen, wird nur dieses Verzeichnis
+    zurückgegeben.
+
+    :param data_path: Verzeichnis der historischen Parquet-Daten.
+    :type data_path: Path
+    :return: Datenverzeichnisse mit eigenem Checkpoint-Manifest.
+    :rtype: list[Path]
+    """
+
+    if any(data_path.glob(f"{PARTITION_PREFIX}*")):
+        return [data_path]
+    return sorted(
+        path
+        for path in data_path.iterdir()
+        if path.is_dir() and any(path.glob(f"{PARTITION_PREFIX}*"))
+    )
+
+
+def compact_data(
+    data_path: Path = DATA_PATH,
+    target_rows_per_file: int = DEFAULT_TARGET_ROWS_PER_FILE,
+    dry_run: bool = False,
+):
+    """
+    Fasst die kleinen Parquet-Dateien aller Partitionen zu größeren Dateien zusammen,
+    sortiert nach Zeitstempel und ohne doppelte Messwerte. Jede Box wird mit ihrem
+    eigenen Checkpoint-Manifest zusammengefasst, damit bereits geladene Dateien
+    als geladen markiert bleiben.
+
+    :param data_path: Verzeichnis der historischen Parquet-Daten (``data`` oder
+                      ``data/<box_id>``).
+    :type data_path: Path
+    :param target_rows_per_file: Angestrebte Zeilenanzahl einer Datei.
+    :type target_rows_per_file: int
+    :param dry_run: Nur anzeigen, welche Partitionen zusammengefasst würden.
+    :type dry_run: bool
+    """
+
+    if not data_path.exists():
+        logger.error("Datenverzeichnis '{}' existiert nicht.", data_path)
+        return
+
+    for box_dir in find_box_dirs(data_path):
+        compactor = PartitionCompactor(box_dir, target_rows_per_file)
+        results = compactor.compact(dry_run)
+        if not dry_run:
+            logger.info(
+                "'{}': {} Partitionen zusammengefasst: {} -> {} Dateien, "
+                "{} Duplikate entfernt.",
+                box_dir.name,
+                len(results),
+                sum(result.files_before for result in results),
+                sum(result.files_after for result in results),
+                sum(result.rows_before - result.rows_after for result in results),
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Fasst die Parquet-Dateien der historischen Daten zusammen"
+    )
+    parser.add_argument(
+        "--data-path",
+        type=Path,
+        default=DATA_PATH,
+        help="Verzeichnis der historischen Parquet-Daten (data oder data/<box_id>)",
+    )
+    parser.add_argument(
+        "--target-rows",
+        type=int,
+        default=DEFAULT_TARGET_ROWS_PER_FILE,
+        help="Angestrebte Anzahl Zeilen pro Datei",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Nur anzeigen, welche Partitionen zusammengefasst würden",
+    )
+    args = parser.parse_args()
+
+    compact_data(args.data_path, args.target_rows, args.dry_run)
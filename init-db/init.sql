@@ -1,37 +1,48 @@
 -- Ensure the timescaledb extension is available
 CREATE EXTENSION IF NOT EXISTS timescaledb CASCADE;
 
--- Create the sensor data table
-CREATE TABLE IF NOT EXISTS sensor_data (
-    timestamp   TIMESTAMPTZ       NOT NULL,
-    box_id      TEXT              NOT NULL,
-    sensor_id   TEXT              NOT NULL,
-    measurement DOUBLE PRECISION, -- Use DOUBLE PRECISION for floating point values
+-- Create sensor metadata table
+-- sensor_key is the compact key referenced by every reading in sensor_data
+CREATE TABLE IF NOT EXISTS sensor_metadata (
+    sensor_id   TEXT PRIMARY KEY,
+    sensor_key  INTEGER GENERATED BY DEFAULT AS IDENTITY UNIQUE,
+    box_id      TEXT,
     unit        TEXT,
     sensor_type TEXT,
     icon        TEXT,
-    title       TEXT,
-    -- Define composite primary key or unique constraint for ON CONFLICT
-    UNIQUE (timestamp, box_id, sensor_id)
+    title       TEXT
 );
 
--- Create sensor metadata table
--- CREATE TABLE IF NOT EXISTS sensor_metadata AS
--- 	SELECT DISTINCT
--- 		sensor_id
--- 		,unit
--- 		,sensor_type
--- 		,icon
--- 		,title
--- 	FROM sensor_data;
+-- Create the sensor data table
+-- Only the reading itself is stored; box_id, sensor_id and the descriptive
+-- fields are resolved via sensor_metadata. Columns are ordered by alignment
+-- (8 + 8 + 4 bytes) to avoid padding.
+CREATE TABLE IF NOT EXISTS sensor_data (
+    timestamp   TIMESTAMPTZ       NOT NULL,
+    measurement DOUBLE PRECISION, -- Use DOUBLE PRECISION for floating point values
+    sensor_key  INTEGER           NOT NULL REFERENCES sensor_metadata (sensor_key),
+    -- Unique constraint for ON CONFLICT, also serves per-sensor time range queries
+    CONSTRAINT sensor_data_sensor_key_timestamp_key UNIQUE (sensor_key, timestamp)
+);
 
 -- Create the TimescaleDB hypertable, partitioning by time
 -- if_not_exists prevents error if script is run multiple times
 SELECT create_hypertable('sensor_data', 'timestamp', if_not_exists => TRUE);
 
--- Optional: Add indexes for faster queries
-CREATE INDEX IF NOT EXISTS idx_sensor_data_box_id_ts ON sensor_data (box_id, timestamp DESC);
-CREATE INDEX IF NOT EXISTS idx_sensor_data_sensor_id_ts ON sensor_data (sensor_id, timestamp DESC);
+-- Readings with their sensor attributes (layout of the former sensor_data table)
+create view sensor_data_view
+as
+	select
+		d.timestamp
+		,m.box_id
+		,m.sensor_id
+		,d.measurement
+		,m.unit
+		,m.sensor_type
+		,m.icon
+		,m.title
+	from sensor_data d
+	join sensor_metadata m on m.sensor_key = d.sensor_key;
 
 -- Create views for sensor 
 create view temperature_view
@@ -40,7 +51,7 @@ as
 		timestamp
 		,measurement
 	from sensor_data
-	where sensor_id = '5d6d5269953683001ae46ae1'
+	where sensor_key = (select sensor_key from sensor_metadata where sensor_id = '5d6d5269953683001ae46ae1')
 	order by timestamp;
 
 create view pm10_view
@@ -49,7 +60,7 @@ as
 		timestamp
 		,measurement
 	from sensor_data
-	where sensor_id = '5d6d5269953683001ae46add'
+	where sensor_key = (select sensor_key from sensor_metadata where sensor_id = '5d6d5269953683001ae46add')
 	order by timestamp;
 
 create view pm25_view
@@ -58,7 +69,7 @@ as
 		timestamp
 		,measurement
 	from sensor_data
-	where sensor_id = '5d6d5269953683001ae46ade'
+	where sensor_key = (select sensor_key from sensor_metadata where sensor_id = '5d6d5269953683001ae46ade')
 	order by timestamp;
 
 create view airPressure_view
@@ -67,7 +78,7 @@ as
 		timestamp
 		,measurement
 	from sensor_data
-	where sensor_id = '607fe08260979a001bd13188'
+	where sensor_key = (select sensor_key from sensor_metadata where sensor_id = '607fe08260979a001bd13188')
 	order by timestamp;
 
 create view illuminance_view
@@ -76,7 +87,7 @@ as
 		timestamp
 		,measurement
 	from sensor_data
-	where sensor_id = '5e7f6fecf7afec001bf5b1a3'
+	where sensor_key = (select sensor_key from sensor_metadata where sensor_id = '5e7f6fecf7afec001bf5b1a3')
 	order by timestamp;
 
 create view humidity_view
@@ -85,117 +96,46 @@ as
 		timestamp
 		,measurement
 	from sensor_data
-	where sensor_id = '5d6d5269953683001ae46ae0'
+	where sensor_key = (select sensor_key from sensor_metadata where sensor_id = '5d6d5269953683001ae46ae0')
 	order by timestamp;
 
--- Create hourly aggregated views
-
-create view temperature_hourly_avg
-as
-	select 
-		date_trunc('hour', timestamp) as timestamp
-		,avg(measurement) as measurement
-	from temperature_view
-	group by date_trunc('hour', timestamp)
-	order by date_trunc('hour', timestamp);
-	
-create view pm10_hourly_avg
-as
-	select 
-		date_trunc('hour', timestamp) as timestamp
-		,avg(measurement) as measurement
-	from pm10_view
-	group by date_trunc('hour', timestamp)
-	order by date_trunc('hour', timestamp);
-	
-create view pm25_hourly_avg
-as
-	select 
-		date_trunc('hour', timestamp) as timestamp
-		,avg(measurement) as measurement
-	from pm25_view
-	group by date_trunc('hour', timestamp)
-	order by date_trunc('hour', timestamp);
-	
-create view airPressure_hourly_avg
-as
-	select 
-		date_trunc('hour', timestamp) as timestamp
+-- Continuous aggregates per sensor (avg/min/max/count per bucket)
+-- materialized_only = false adds the not yet materialized recent raw data
+create materialized view sensor_data_hourly
+with (timescaledb.continuous, timescaledb.materialized_only = false)
+as
+	select
+		time_bucket('1 hour', timestamp) as timestamp
+		,sensor_key
 		,avg(measurement) as measurement
-	from airPressure_view
-	group by date_trunc('hour', timestamp)
-	order by date_trunc('hour', timestamp);
-	
-create view illuminance_hourly_avg
-as
-	select 
-		date_trunc('hour', timestamp) as timestamp
-		,avg(measurement) as measurement
-	from illuminance_view
-	group by date_trunc('hour', timestamp)
-	order by date_trunc('hour', timestamp);
-	
-create view humidity_hourly_avg
-as
-	select 
-		date_trunc('hour', timestamp) as timestamp
-		,avg(measurement) as measurement
-	from humidity_view
-	group by date_trunc('hour', timestamp)
-	order by date_trunc('hour', timestamp);
-	
--- Create daily aggregated views
+		,min(measurement) as min_measurement
+		,max(measurement) as max_measurement
+		,count(measurement) as num_measurements
+	from sensor_data
+	group by time_bucket('1 hour', timestamp), sensor_key
+with no data;
 
-create view temperature_daily_avg
-as
-	select 
-		date_trunc('day', timestamp) as timestamp
-		,avg(measurement) as measurement
-	from temperature_view
-	group by date_trunc('day', timestamp)
-	order by date_trunc('day', timestamp);
-	
-create view pm10_daily_avg
-as
-	select 
-		date_trunc('day', timestamp) as timestamp
-		,avg(measurement) as measurement
-	from pm10_view
-	group by date_trunc('day', timestamp)
-	order by date_trunc('day', timestamp);
-	
-create view pm25_daily_avg
-as
-	select 
-		date_trunc('day', timestamp) as timestamp
-		,avg(measurement) as measurement
-	from pm25_view
-	group by date_trunc('day', timestamp)
-	order by date_trunc('day', timestamp);
-	
-create view airPressure_daily_avg
-as
-	select 
-		date_trunc('day', timestamp) as timestamp
-		,avg(measurement) as measurement
-	from airPressure_view
-	group by date_trunc('day', timestamp)
-	order by date_trunc('day', timestamp);
-	
-create view illuminance_daily_avg
-as
-	select 
-		date_trunc('day', timestamp) as timestamp
-		,avg(measurement) as measurement
-	from illuminance_view
-	group by date_trunc('day', timestamp)
-	order by date_trunc('day', timestamp);
-	
-create view humidity_daily_avg
+create materialized view sensor_data_daily
+with (timescaledb.continuous, timescaledb.materialized_only = false)
 as
-	select 
-		date_trunc('day', timestamp) as timestamp
+	select
+		time_bucket('1 day', timestamp) as timestamp
+		,sensor_key
 		,avg(measurement) as measurement
-	from humidity_view
-	group by date_trunc('day', timestamp)
-	order by date_trunc('day', timestamp);
\ No newline at end of file
+		,min(measurement) as min_measurement
+		,max(measurement) as max_measurement
+		,count(measurement) as num_measurements
+	from sensor_data
+	group by time_bucket('1 day', timestamp), sensor_key
+with no data;
+
+-- Refresh the last days regularly; older data is refreshed after a bulk import
+SELECT add_continuous_aggregate_policy('sensor_data_hourly',
+	start_offset => INTERVAL '3 days',
+	end_offset => INTERVAL '1 hour',
+	schedule_interval => INTERVAL '30 minutes');
+
+SELECT add_continuous_aggregate_policy('sensor_data_daily',
+	start_offset => INTERVAL '3 days',
+	end_offset => INTERVAL '1 day',
+	schedule_interval => INTERVAL '1 hour');
@@ -0,0 +1,147 @@
+-- Migrate an existing database to the normalized sensor_data schema of init.sql.
+--
+-- sensor_data only keeps (timestamp, measurement, sensor_key); box_id,
+-- sensor_id and the descriptive fields move to sensor_metadata.
+-- Scripts in this folder are not run by the container's init step, run once with:
+--   psql -U user -d env_monitoring -f init-db/migrations/001_normalize_sensor_data.sql
+
+BEGIN;
+
+-- 0. sensor_id as key of sensor_metadata
+-- The table was created by pandas (to_sql) without any constraint, so drop
+-- duplicate and empty sensor_ids and add the key ON CONFLICT (sensor_id) needs.
+DELETE FROM sensor_metadata a
+USING sensor_metadata b
+WHERE a.sensor_id = b.sensor_id
+  AND a.ctid > b.ctid;
+
+DELETE FROM sensor_metadata WHERE sensor_id IS NULL;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1
+        FROM pg_index i
+        JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = i.indkey[0]
+        WHERE i.indrelid = 'sensor_metadata'::regclass
+          AND i.indisunique
+          AND i.indnkeyatts = 1
+          AND i.indpred IS NULL
+          AND a.attname = 'sensor_id'
+    ) THEN
+        IF EXISTS (
+            SELECT 1 FROM pg_constraint
+            WHERE conrelid = 'sensor_metadata'::regclass AND contype = 'p'
+        ) THEN
+            ALTER TABLE sensor_metadata ADD UNIQUE (sensor_id);
+        ELSE
+            ALTER TABLE sensor_metadata ADD PRIMARY KEY (sensor_id);
+        END IF;
+    END IF;
+END
+$$;
+
+-- 1. Compact key and box_id in sensor_metadata
+ALTER TABLE sensor_metadata
+    ADD COLUMN IF NOT EXISTS sensor_key INTEGER GENERATED BY DEFAULT AS IDENTITY UNIQUE,
+    ADD COLUMN IF NOT EXISTS box_id TEXT;
+
+-- Sensors that only appear in sensor_data, and box_id for known sensors
+INSERT INTO sensor_metadata (sensor_id, box_id, unit, sensor_type, icon, title)
+SELECT DISTINCT ON (sensor_id) sensor_id, box_id, unit, sensor_type, icon, title
+FROM sensor_data
+ORDER BY sensor_id, timestamp DESC
+ON CONFLICT (sensor_id) DO UPDATE
+    SET box_id = EXCLUDED.box_id
+    WHERE sensor_metadata.box_id IS NULL;
+
+-- 2. New sensor_data table; existing views follow the renamed table
+ALTER TABLE sensor_data RENAME TO sensor_data_old;
+
+CREATE TABLE sensor_data (
+    timestamp   TIMESTAMPTZ       NOT NULL,
+    measurement DOUBLE PRECISION,
+    sensor_key  INTEGER           NOT NULL REFERENCES sensor_metadata (sensor_key),
+    CONSTRAINT sensor_data_sensor_key_timestamp_key UNIQUE (sensor_key, timestamp)
+);
+SELECT create_hypertable('sensor_data', 'timestamp');
+
+INSERT INTO sensor_data (timestamp, measurement, sensor_key)
+SELECT d.timestamp, d.measurement, m.sensor_key
+FROM sensor_data_old d
+JOIN sensor_metadata m ON m.sensor_id = d.sensor_id
+ON CONFLICT DO NOTHING;
+
+-- 3. Point the views at the new table (hourly/daily views build on these)
+create view sensor_data_view
+as
+	select
+		d.timestamp
+		,m.box_id
+		,m.sensor_id
+		,d.measurement
+		,m.unit
+		,m.sensor_type
+		,m.icon
+		,m.title
+	from sensor_data d
+	join sensor_metadata m on m.sensor_key = d.sensor_key;
+
+create or replace view temperature_view
+as
+	select
+		timestamp
+		,measurement
+	from sensor_data
+	where sensor_key = (select sensor_key from sensor_metadata where sensor_id = '5d6d5269953683001ae46ae1')
+	order by timestamp;
+
+create or replace view pm10_view
+as
+	select
+		timestamp
+		,measurement
+	from sensor_data
+	where sensor_key = (select sensor_key from sensor_metadata where sensor_id = '5d6d5269953683001ae46add')
+	order by timestamp;
+
+create or replace view pm25_view
+as
+	select
+		timestamp
+		,measurement
+	from sensor_data
+	where sensor_key = (select sensor_key from sensor_metadata where sensor_id = '5d6d5269953683001ae46ade')
+	order by timestamp;
+
+create or replace view airPressure_view
+as
+	select
+		timestamp
+		,measurement
+	from sensor_data
+	where sensor_key = (select sensor_key from sensor_metadata where sensor_id = '607fe08260979a001bd13188')
+	order by timestamp;
+
+create or replace view illuminance_view
+as
+	select
+		timestamp
+		,measurement
+	from sensor_data
+	where sensor_key = (select sensor_key from sensor_metadata where sensor_id = '5e7f6fecf7afec001bf5b1a3')
+	order by timestamp;
+
+create or replace view humidity_view
+as
+	select
+		timestamp
+		,measurement
+	from sensor_data
+	where sensor_key = (select sensor_key from sensor_metadata where sensor_id = '5d6d5269953683001ae46ae0')
+	order by timestamp;
+
+-- 4. Drop the old table (no view depends on it anymore)
+DROP TABLE sensor_data_old;
+
+COMMIT;
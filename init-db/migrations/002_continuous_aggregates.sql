@@ -0,0 +1,61 @@
+-- Replace the per-sensor hourly/daily views with the continuous aggregates
+-- sensor_data_hourly and sensor_data_daily of init.sql.
+--
+-- Requires the normalized schema (001_normalize_sensor_data.sql). Runs without
+-- an explicit transaction, since continuous aggregates cannot be created or
+-- refreshed inside one:
+--   psql -U user -d env_monitoring -f init-db/migrations/002_continuous_aggregates.sql
+
+-- 1. Plain views that re-aggregated all raw rows on every query
+DROP VIEW IF EXISTS
+	temperature_hourly_avg, pm10_hourly_avg, pm25_hourly_avg,
+	airPressure_hourly_avg, illuminance_hourly_avg, humidity_hourly_avg,
+	temperature_daily_avg, pm10_daily_avg, pm25_daily_avg,
+	airPressure_daily_avg, illuminance_daily_avg, humidity_daily_avg;
+
+-- 2. Continuous aggregates per sensor (avg/min/max/count per bucket), as in init.sql
+-- materialized_only = false adds the not yet materialized recent raw data
+create materialized view if not exists sensor_data_hourly
+with (timescaledb.continuous, timescaledb.materialized_only = false)
+as
+	select
+		time_bucket('1 hour', timestamp) as timestamp
+		,sensor_key
+		,avg(measurement) as measurement
+		,min(measurement) as min_measurement
+		,max(measurement) as max_measurement
+		,count(measurement) as num_measurements
+	from sensor_data
+	group by time_bucket('1 hour', timestamp), sensor_key
+with no data;
+
+create materialized view if not exists sensor_data_daily
+with (timescaledb.continuous, timescaledb.materialized_only = false)
+as
+	select
+		time_bucket('1 day', timestamp) as timestamp
+		,sensor_key
+		,avg(measurement) as measurement
+		,min(measurement) as min_measurement
+		,max(measurement) as max_measurement
+		,count(measurement) as num_measurements
+	from sensor_data
+	group by time_bucket('1 day', timestamp), sensor_key
+with no data;
+
+-- Refresh the last days regularly; older data is refreshed after a bulk import
+SELECT add_continuous_aggregate_policy('sensor_data_hourly',
+	start_offset => INTERVAL '3 days',
+	end_offset => INTERVAL '1 hour',
+	schedule_interval => INTERVAL '30 minutes',
+	if_not_exists => true);
+
+SELECT add_continuous_aggregate_policy('sensor_data_daily',
+	start_offset => INTERVAL '3 days',
+	end_offset => INTERVAL '1 day',
+	schedule_interval => INTERVAL '1 hour',
+	if_not_exists => true);
+
+-- 3. Materialize the existing history once
+CALL refresh_continuous_aggregate('sensor_data_hourly', NULL, NULL);
+CALL refresh_continuous_aggregate('sensor_data_daily', NULL, NULL);
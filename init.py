@@ -1,14 +1,22 @@
 """Initialisierung der App im Docker-Container."""
 
 import argparse
+from datetime import datetime
 from pathlib import Path
 from typing import Final
 
 from loguru import logger
 from sqlalchemy import text
-from sqlalchemy.exc import OperationalError
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
 
-from src.ffm_dashboard.app import DB_CON, DB_SERVICE, SENSE_BOX_API
+from src.ffm_dashboard.app import DB_CON, FLEET_SERVICE
+from src.ffm_dashboard.components import DEFAULT_BACKFILL_WORKERS
+from src.ffm_dashboard.db import (
+    DEFAULT_IMPORT_WORKERS,
+    StoragePolicies,
+    StoragePolicyService,
+    WriteResult,
+)
 
 DATA_PATH: Final = Path(__file__).parent / "data"
 
@@ -34,19 +42,65 @@ def is_database_ready():
         return False
 
 
-def load_and_store_historical_data():
+def apply_storage_policies():
+    """
+    Wendet die TimescaleDB-Speicherrichtlinien (Chunk-Intervall, Kompression,
+    Retention) aus der Konfiguration an. Fehler brechen den Start nicht ab.
+    """
+
+    try:
+        StoragePolicyService(DB_CON, StoragePolicies.from_yaml()).apply()
+    except (SQLAlchemyError, OSError, ValueError) as e:
+        logger.error("Speicherrichtlinien konnten nicht angewendet werden: {}", e)
+
+
+def refresh_continuous_aggregates(since: datetime | None = None):
+    """
+    Aktualisiert die stündlichen und täglichen Aggregate nach einem Import
+    historischer Daten bzw. ab dem frühesten beim Catch-Up geschriebenen
+    Messwert. Fehler brechen den Start nicht ab.
+
+    :param since: Frühester neu geschriebener Zeitstempel; None aktualisiert
+                  den gesamten Zeitraum.
+    :type since: datetime | None
+    """
+
+    try:
+        StoragePolicyService(
+            DB_CON, StoragePolicies.from_yaml()
+        ).refresh_continuous_aggregates(since)
+    except (SQLAlchemyError, OSError) as e:
+        logger.error("Aggregate konnten nicht aktualisiert werden: {}", e)
+
+
+def load_and_store_historical_data(
+    max_workers: int = DEFAULT_BACKFILL_WORKERS,
+    retry_failed: bool = False,
+    import_workers: int = DEFAULT_IMPORT_WORKERS,
+):
     """
     Lädt historische Sensordaten von der SenseBox API und speichert sie in die Datenbank.
 
-    1. Holt alle historischen Daten von einer SenseBox.
-    2. Speichert die Daten in der Datenbank via Bulk-Insertion.
+    1. Holt alle historischen Daten aller SenseBoxen (parallel) nach `DATA_PATH/<box_id>`.
+    2. Speichert die Daten in der Datenbank via Bulk-Insertion (Partitionen parallel).
+
+    Beide Schritte werden im Checkpoint-Manifest der jeweiligen Box festgehalten,
+    sodass ein abgebrochener Import beim nächsten Start fortgesetzt wird.
 
     Achtung:
         Dieser Vorgang kann je nach Datenmenge mehrere Minuten bis Stunden dauern.
+
+    :param max_workers: Maximale Anzahl gleichzeitiger API-Abfragen pro Box.
+    :type max_workers: int
+    :param retry_failed: Nur leere oder fehlgeschlagene Intervalle erneut abfragen.
+    :type retry_failed: bool
+    :param import_workers: Anzahl parallel importierter Sensor-Partitionen pro Box.
+    :type import_workers: int
     """
 
-    SENSE_BOX_API.fetch_all_historical_data_for_one_box(DATA_PATH)
-    DB_SERVICE.bulk_write_sensor_data_to_db(DATA_PATH)
+    FLEET_SERVICE.load_historical_data(
+        DATA_PATH, max_workers, retry_failed, import_workers
+    )
 
 
 def start_app():
@@ -56,8 +110,12 @@ def start_app():
     Schritte:
         1. Prüft, ob die Datenbank erreichbar ist.
         2. Liest Kommandozeilenargumente ein.
-        3. Schreibt Metadaten der Sensoren in die Datenbank.
-        4. Optional: Lädt historische Daten und schreibt sie in die Datenbank.
+        3. Wendet die Speicherrichtlinien der Messwert-Tabelle an.
+        4. Schreibt Metadaten der Sensoren in die Datenbank.
+        5. Optional: Lädt historische Daten und schreibt sie in die Datenbank.
+        6. Lädt fehlende Messwerte seit dem letzten gespeicherten Zeitstempel nach.
+        7. Aktualisiert die Aggregate: nach einem Import historischer Daten
+           vollständig, sonst ab dem frühesten nachgeladenen Messwert.
     """
 
     if not is_database_ready():
@@ -69,16 +127,50 @@ def start_app():
         action="store_true",
         help="Zusätzlich zu den Metadaten auch historische Daten laden",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_BACKFILL_WORKERS,
+        help="Anzahl paralleler API-Abfragen beim Laden der historischen Daten",
+    )
+    parser.add_argument(
+        "--import-workers",
+        type=int,
+        default=DEFAULT_IMPORT_WORKERS,
+        help="Anzahl parallel in die Datenbank importierter Sensor-Partitionen",
+    )
+    parser.add_argument(
+        "--retry-failed",
+        action="store_true",
+        help="Nur leere oder fehlgeschlagene Intervalle des letzten Imports erneut laden",
+    )
     args = parser.parse_args()
 
-    DB_SERVICE.write_sensor_metadata()
+    apply_storage_policies()
+    FLEET_SERVICE.write_sensor_metadata()
 
     if args.with_historical:
         logger.warning(
-            "Alle historischen Daten der SenseBox werden geladen"
+            "Alle historischen Daten der SenseBoxen werden geladen"
             "und in DB geschrieben. Kann bis zu 1h oder länger dauern!"
         )
-        load_and_store_historical_data()
+        load_and_store_historical_data(
+            args.workers, args.retry_failed, args.import_workers
+        )
+
+    result: WriteResult = FLEET_SERVICE.sync_missing_sensor_data()
+    logger.info(
+        "Catch-up sync wrote {} missing readings ({} already existing).",
+        result.inserted,
+        result.skipped,
+    )
+
+    # Die Refresh-Policies decken nur die letzten Tage ab, ältere nachgeladene
+    # Messwerte fehlen sonst dauerhaft in den Aggregaten
+    if args.with_historical:
+        refresh_continuous_aggregates()
+    elif result.earliest_inserted is not None:
+        refresh_continuous_aggregates(result.earliest_inserted)
 
 
 if __name__ == "__main__":
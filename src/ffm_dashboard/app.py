@@ -12,11 +12,21 @@ from src.ffm_dashboard.callbacks import (
     register_home_callbacks,
     register_sensors_callbacks,
 )
-from src.ffm_dashboard.components import SenseBoxApi
-from src.ffm_dashboard.db import DbCon, SensorDataDbService
+from src.ffm_dashboard.components import (
+    SenseBoxApi,
+    SenseBoxFleet,
+    get_box_ids_from_env,
+)
+from src.ffm_dashboard.db import (
+    DbCon,
+    FleetIngestionService,
+    QueryResultCache,
+    SensorDataDbService,
+)
 from src.ffm_dashboard.elements import create_header, create_navbar
 
 SENSE_BOX_ID: Final = "5d6d5269953683001ae46adc"
+SENSE_BOX_IDS: Final = get_box_ids_from_env(SENSE_BOX_ID)
 
 dmc.add_figure_templates(default="mantine_light")
 
@@ -56,10 +66,15 @@ app.layout = dmc.MantineProvider(
 
 SENSE_BOX_API: Final = SenseBoxApi(SENSE_BOX_ID)
 DB_CON: Final = DbCon()
-DB_SERVICE: Final = SensorDataDbService(DB_CON, box_id=SENSE_BOX_ID)
+QUERY_CACHE: Final = QueryResultCache()
+DB_SERVICE: Final = SensorDataDbService(
+    DB_CON, box_id=SENSE_BOX_ID, query_cache=QUERY_CACHE
+)
+SENSE_BOX_FLEET: Final = SenseBoxFleet(SENSE_BOX_IDS, SENSE_BOX_API.http_client)
+FLEET_SERVICE: Final = FleetIngestionService(DB_CON, SENSE_BOX_FLEET, QUERY_CACHE)
 
 # Register callbacks
 register_app_callbacks(app)
 register_home_callbacks(app, SENSE_BOX_API)
-register_sensors_callbacks(app, SENSE_BOX_API, DB_SERVICE)
+register_sensors_callbacks(app, FLEET_SERVICE, DB_SERVICE)
 register_forecast_callbacks(app, SENSE_BOX_API)
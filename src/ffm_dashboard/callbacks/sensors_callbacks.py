@@ -8,21 +8,25 @@ import pandas as pd
 from dash import Dash, Input, Output, ctx, dcc
 from loguru import logger
 
-from src.ffm_dashboard.components import SenseBoxApi
-from src.ffm_dashboard.db import SensorDataDbService
+from src.ffm_dashboard.db import (
+    FleetIngestionService,
+    SensorDataDbService,
+    WriteResult,
+)
 from src.ffm_dashboard.plots import Plot2D, PlotType2D
 
 
 def register_sensors_callbacks(
-    app: Dash, sense_box_api: SenseBoxApi, db_service: SensorDataDbService
+    app: Dash, fleet_service: FleetIngestionService, db_service: SensorDataDbService
 ) -> None:
     """
     Registriert alle notwendigen Callback-Funktionen für die Sensor-Page.
 
     :param app: Die Instanz der Dash-Anwendung, zu der die Callbacks hinzugefügt werden sollen.
     :type app: Dash
-    :param sense_box_api: Eine Instanz der SenseBoxApi zum Abrufen der Sensordaten
-    :type sense_box_api: SenseBoxApi
+    :param fleet_service: Eine Instanz des FleetIngestionService zum Abrufen und
+                          Speichern der aktuellen Sensordaten aller SenseBoxen
+    :type fleet_service: FleetIngestionService
     :param db_service: Eine Instanz des SensorDataDbService zum Schreiben und Lesen auf die DB
     :type db_service: SensorDataDbService
     """
@@ -58,15 +62,17 @@ def register_sensors_callbacks(
                 "Fetch button clicked ({} times). Fetching data from API...", n_clicks
             )
 
-        data: pd.DataFrame = sense_box_api.fetch_new_sensor_data_for_one_box()
+        result: WriteResult | None = fleet_service.write_new_sensor_data()
 
-        if data is not None and not data.empty:
-            inserted_cols = db_service.write_new_sensor_data(data)
+        if result is not None:
             return dmc.Notification(
                 title="Daten geladen!",
                 autoClose=5000,
                 action="show",
-                message=f"API Fetch successful. Processed {inserted_cols} readings.",
+                message=(
+                    f"API Fetch successful. Inserted {result.inserted} new readings, "
+                    f"skipped {result.skipped} existing readings."
+                ),
                 position="bottom-left",
             ), {"status": "success", "new_data": True}
         else:
@@ -1,5 +1,25 @@
 """Modul für verschiedene Komponenten."""
 
-from src.ffm_dashboard.components.sense_box_api import SenseBoxApi
+from src.ffm_dashboard.components.backfill_checkpoint import (
+    BackfillCheckpoint,
+    WindowStatus,
+)
+from src.ffm_dashboard.components.http_client import SenseBoxHttpClient
+from src.ffm_dashboard.components.sense_box_api import (
+    DEFAULT_BACKFILL_WORKERS,
+    SenseBoxApi,
+)
+from src.ffm_dashboard.components.sense_box_fleet import (
+    SenseBoxFleet,
+    get_box_ids_from_env,
+)
 
-__all__: list[str] = ["SenseBoxApi"]
+__all__: list[str] = [
+    "SenseBoxApi",
+    "SenseBoxFleet",
+    "get_box_ids_from_env",
+    "SenseBoxHttpClient",
+    "BackfillCheckpoint",
+    "WindowStatus",
+    "DEFAULT_BACKFILL_WORKERS",
+]
@@ -0,0 +1,211 @@
+"""Checkpoint-Manifest für den wiederaufnehmbaren Import historischer Daten."""
+
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+from enum import Enum
+from pathlib import Path
+from typing import Final
+
+from loguru import logger
+
+from src.ffm_dashboard.components.interval_planner import TIME_FORMAT
+
+CHECKPOINT_FILE_NAME: Final = "_backfill_checkpoint.json"
+"""Dateiname des Manifests (beginnt mit '_', damit pyarrow die Datei ignoriert)."""
+
+
+class WindowStatus(str, Enum):
+    """
+    Ergebnis einer (Sensor, Intervall)-Abfrage.
+
+    - DONE: Daten wurden geladen und gespeichert
+    - EMPTY: Die API lieferte keine Daten (NoDataFoundError)
+    - FAILED: Die Abfrage ist fehlgeschlagen (z.B. Timeout)
+    """
+
+    DONE = "done"
+    EMPTY = "empty"
+    FAILED = "failed"
+
+
+class BackfillCheckpoint:
+    """
+    Manifest, das abgeschlossene (Sensor, Intervall)-Abfragen und bereits in die
+    Datenbank geladene Parquet-Dateien festhält. Ein abgebrochener Import kann
+    dadurch an der Stelle fortgesetzt werden, an der er gestoppt wurde.
+
+    Das Manifest liegt als JSON-Datei im Datenverzeichnis und wird nach jeder
+    Änderung atomar (temporäre Datei + ``os.replace``) geschrieben.
+
+    :param data_dir_path: Verzeichnis der historischen Parquet-Daten.
+    :type data_dir_path: pathlib.Path
+    """
+
+    def __init__(self, data_dir_path: Path) -> None:
+        self.path: Path = data_dir_path / CHECKPOINT_FILE_NAME
+        self._lock = threading.Lock()
+        self._windows: dict[str, dict[str, dict]] = {}
+        self._loaded_files: set[str] = set()
+
+        if self.path.exists():
+            with self.path.open("r", encoding="utf-8") as f:
+                manifest: dict = json.load(f)
+            self._windows = manifest.get("windows", {})
+            self._loaded_files = set(manifest.get("loaded_files", []))
+            logger.info(
+                "Resuming from checkpoint '{}' ({} windows, {} loaded files).",
+                self.path,
+                sum(len(windows) for windows in self._windows.values()),
+                len(self._loaded_files),
+            )
+
+    def get_window_status(self, sensor_id: str, from_date: str) -> WindowStatus | None:
+        """
+        Gibt den gespeicherten Status eines Intervalls zurück. Intervalle werden
+        über ihren Startzeitpunkt identifiziert, da das letzte Intervall eines
+        Imports immer beim Zeitpunkt des Aufrufs endet.
+
+        :param sensor_id: Die Sensor-ID.
+        :type sensor_id: str
+        :param from_date: Startzeitpunkt im ISO-Format.
+        :type from_date: str
+        :return: Status des Intervalls oder None, falls es noch nicht abgefragt wurde.
+        :rtype: WindowStatus | None
+        """
+
+        with self._lock:
+            entry: dict | None = self._windows.get(sensor_id, {}).get(from_date)
+        return WindowStatus(entry["status"]) if entry else None
+
+    def get_resume_point(
+        self, sensor_id: str, from_date: str, to_date: str
+    ) -> str | None:
+        """
+        Ermittelt, ab wann ein Zeitraum eines Sensors noch nicht abgefragt wurde.
+        Dazu wird die Kette lückenlos aneinander anschließender Intervalle ab
+        ``from_date`` verfolgt.
+
+        :param sensor_id: Die Sensor-ID.
+        :type sensor_id: str
+        :param from_date: Beginn des Zeitraums im ISO-Format.
+        :type from_date: str
+        :param to_date: Ende des Zeitraums im ISO-Format.
+        :type to_date: str
+        :return: Startzeitpunkt des ersten fehlenden Intervalls oder None, wenn der
+                 Zeitraum vollständig abgedeckt ist.
+        :rtype: str | None
+        """
+
+        with self._lock:
+            windows: dict = dict(self._windows.get(sensor_id, {}))
+
+        current: str = from_date
+        while current in windows:
+            window_end: str = windows[current]["to"]
+            if window_end >= to_date:
+                return None
+            current = (
+                datetime.strptime(window_end, TIME_FORMAT) + timedelta(seconds=1)
+            ).strftime(TIME_FORMAT)
+        return current
+
+    def get_failed_windows(self, sensor_id: str) -> list[tuple[str, str]]:
+        """
+        Gibt alle Intervalle eines Sensors zurück, die leer oder fehlgeschlagen sind.
+
+        :param sensor_id: Die Sensor-ID.
+        :type sensor_id: str
+        :return: Liste von Tupeln mit Start- und Endzeitpunkten.
+        :rtype: list[tuple[str, str]]
+        """
+
+        with self._lock:
+            windows: dict = dict(self._windows.get(sensor_id, {}))
+        return sorted(
+            (from_date, entry["to"])
+            for from_date, entry in windows.items()
+            if entry["status"] != WindowStatus.DONE.value
+        )
+
+    def record_windows(
+        self,
+        sensor_id: str,
+        windows: list[tuple[tuple[str, str], WindowStatus, int]],
+    ) -> None:
+        """
+        Hält das Ergebnis mehrerer Intervalle eines Sensors fest und speichert das Manifest.
+
+        :param sensor_id: Die Sensor-ID.
+        :type sensor_id: str
+        :param windows: Liste aus ((Start, Ende), Status, Zeilenanzahl).
+        :type windows: list[tuple[tuple[str, str], WindowStatus, int]]
+        """
+
+        with self._lock:
+            sensor_windows: dict = self._windows.setdefault(sensor_id, {})
+            for (from_date, to_date), status, num_rows in windows:
+                sensor_windows[from_date] = {
+                    "to": to_date,
+                    "status": status.value,
+                    "rows": num_rows,
+                }
+            self._save()
+
+    def is_file_loaded(self, file_name: str) -> bool:
+        """
+        Prüft, ob eine Parquet-Datei bereits in die Datenbank geladen wurde.
+
+        :param file_name: Pfad der Datei relativ zum Datenverzeichnis.
+        :type file_name: str
+        :return: True, wenn die Datei bereits geladen wurde, sonst False.
+        :rtype: bool
+        """
+
+        with self._lock:
+            return file_name in self._loaded_files
+
+    def mark_file_loaded(self, file_name: str) -> None:
+        """
+        Markiert eine Parquet-Datei als in die Datenbank geladen und speichert das Manifest.
+
+        :param file_name: Pfad der Datei relativ zum Datenverzeichnis.
+        :type file_name: str
+        """
+
+        with self._lock:
+            self._loaded_files.add(file_name)
+            self._save()
+
+    def replace_loaded_files(
+        self, old_file_names: list[str], new_file_names: list[str]
+    ) -> None:
+        """
+        Ersetzt geladene Dateien durch neue Dateien mit denselben Daten (z.B. nach
+        einer Compaction), damit diese nicht erneut in die Datenbank geladen werden.
+
+        :param old_file_names: Pfade der ersetzten Dateien relativ zum Datenverzeichnis.
+        :type old_file_names: list[str]
+        :param new_file_names: Pfade der neuen Dateien relativ zum Datenverzeichnis.
+        :type new_file_names: list[str]
+        """
+
+        with self._lock:
+            self._loaded_files.difference_update(old_file_names)
+            self._loaded_files.update(new_file_names)
+            self._save()
+
+    def _save(self) -> None:
+        """Schreibt das Manifest atomar auf die Festplatte (Lock muss gehalten werden)."""
+
+        tmp_path: Path = self.path.with_name(f".{self.path.name}.tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "windows": self._windows,
+                    "loaded_files": sorted(self._loaded_files),
+                },
+                f,
+            )
+        os.replace(tmp_path, self.path)
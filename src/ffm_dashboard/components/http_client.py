@@ -0,0 +1,239 @@
+"""HTTP-Client mit Connection-Pooling und Backoff für die openSenseMap API."""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from timeit import default_timer as timer
+from typing import Final
+from urllib.parse import urlsplit
+
+import requests
+from loguru import logger
+from requests import Response
+from requests.adapters import HTTPAdapter
+
+RETRY_STATUS_CODES: Final = frozenset({429, 500, 502, 503, 504})
+"""HTTP-Statuscodes, bei denen eine Anfrage wiederholt wird."""
+
+DEFAULT_POOL_SIZE: Final = 16
+"""Anzahl offen gehaltener Verbindungen pro Host (>= Anzahl Backfill-Worker einer Box)."""
+
+
+class RequestBudget:
+    """
+    Token-Bucket, der die Anzahl der Anfragen pro Sekunde an einen Host begrenzt.
+    Die Klasse ist thread-safe, sodass sich alle Worker eines Thread-Pools
+    ein gemeinsames Budget teilen.
+
+    :param requests_per_second: Dauerhaft erlaubte Anfragen pro Sekunde.
+    :type requests_per_second: float
+    :param burst: Maximale Anzahl direkt aufeinanderfolgender Anfragen.
+    :type burst: int
+    """
+
+    def __init__(self, requests_per_second: float, burst: int) -> None:
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self._tokens: float = float(burst)
+        self._last_refill: float = timer()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Blockiert, bis ein Token für die nächste Anfrage verfügbar ist."""
+
+        while True:
+            with self._lock:
+                now: float = timer()
+                self._tokens = min(
+                    self.burst,
+                    self._tokens + (now - self._last_refill) * self.requests_per_second,
+                )
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait: float = (1 - self._tokens) / self.requests_per_second
+            time.sleep(wait)
+
+
+class SenseBoxHttpClient:
+    """
+    Gemeinsamer HTTP-Client für alle Abfragen der openSenseMap API.
+
+    Nutzt eine ``requests.Session`` mit Keep-Alive-Connection-Pool und gzip,
+    wiederholt fehlgeschlagene Anfragen mit exponentiellem Backoff inkl. Jitter,
+    beachtet den ``Retry-After``-Header und begrenzt die Anfragen pro Host über
+    ein :class:`RequestBudget`.
+
+    :param pool_size: Anzahl offen gehaltener Verbindungen pro Host; sollte der
+                      Anzahl gleichzeitig anfragender Threads entsprechen
+                      (siehe :meth:`ensure_pool_size`).
+    :type pool_size: int
+    :param timeout: Timeout einer Anfrage in Sekunden.
+    :type timeout: float
+    :param max_retries: Maximale Anzahl an Versuchen pro Anfrage.
+    :type max_retries: int
+    :param backoff_base: Basiswartezeit in Sekunden für den exponentiellen Backoff.
+    :type backoff_base: float
+    :param backoff_max: Obergrenze der Wartezeit in Sekunden.
+    :type backoff_max: float
+    :param requests_per_second: Erlaubte Anfragen pro Sekunde und Host.
+    :type requests_per_second: float
+    :param burst: Maximale Anzahl direkt aufeinanderfolgender Anfragen pro Host.
+    :type burst: int
+    """
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: float = 15,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+        requests_per_second: float = 20.0,
+        burst: int = 20,
+    ) -> None:
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+
+        self.session = requests.Session()
+        self.session.headers.update({"Accept-Encoding": "gzip, deflate"})
+        self.pool_size: int = 0
+        self._pool_lock = threading.Lock()
+        self.ensure_pool_size(pool_size)
+
+        self._budgets: dict[str, RequestBudget] = {}
+        self._budgets_lock = threading.Lock()
+
+    def ensure_pool_size(self, pool_size: int) -> None:
+        """
+        Vergrößert den Connection-Pool pro Host auf mindestens ``pool_size``
+        Verbindungen. Fragen mehr Threads gleichzeitig an, als der Pool Verbindungen
+        hält, verwirft urllib3 die überzähligen Verbindungen ("Connection pool is
+        full") und baut für jede Anfrage eine neue TLS-Verbindung auf.
+
+        :param pool_size: Benötigte Anzahl Verbindungen pro Host.
+        :type pool_size: int
+        """
+
+        with self._pool_lock:
+            if pool_size <= self.pool_size:
+                return
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+            if self.pool_size:
+                logger.debug(
+                    "HTTP connection pool resized from {} to {}.",
+                    self.pool_size,
+                    pool_size,
+                )
+            self.pool_size = pool_size
+
+    def get_budget(self, host: str) -> RequestBudget:
+        """
+        Gibt das Anfrage-Budget für einen Host zurück und legt es bei Bedarf an.
+
+        :param host: Hostname (inkl. Port) der Ziel-URL.
+        :type host: str
+        :return: Das Budget des Hosts.
+        :rtype: RequestBudget
+        """
+
+        with self._budgets_lock:
+            if host not in self._budgets:
+                self._budgets[host] = RequestBudget(
+                    self.requests_per_second, self.burst
+                )
+            return self._budgets[host]
+
+    def backoff_delay(self, attempt: int) -> float:
+        """
+        Berechnet die Wartezeit vor dem nächsten Versuch ("Full Jitter").
+
+        :param attempt: Index des fehlgeschlagenen Versuchs (beginnend bei 0).
+        :type attempt: int
+        :return: Wartezeit in Sekunden.
+        :rtype: float
+        """
+
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    @staticmethod
+    def retry_after_delay(response: Response) -> float | None:
+        """
+        Liest den ``Retry-After``-Header (Sekunden oder HTTP-Datum) einer Antwort.
+
+        :param response: Die HTTP-Antwort.
+        :type response: Response
+        :return: Wartezeit in Sekunden oder None, falls kein gültiger Header vorhanden ist.
+        :rtype: float | None
+        """
+
+        retry_after: str | None = response.headers.get("Retry-After")
+        if not retry_after:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            retry_at: datetime = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def get(self, url: str, params: dict | None = None) -> Response | None:
+        """
+        Führt eine GET-Anfrage über den gemeinsamen Connection-Pool aus.
+
+        :param url: Die Ziel-URL der API.
+        :type url: str
+        :param params: Optionale Parameter für den API-Call.
+        :type params: dict | None
+        :return: Die erfolgreiche HTTP-Antwort oder None, wenn alle Versuche fehlschlagen.
+        :rtype: Response | None
+        """
+
+        budget: RequestBudget = self.get_budget(urlsplit(url).netloc)
+        for attempt in range(self.max_retries):
+            budget.acquire()
+            delay: float | None = None
+            try:
+                response: Response = self.session.get(
+                    url, params=params, timeout=self.timeout
+                )
+                if response.status_code in RETRY_STATUS_CODES:
+                    delay = self.retry_after_delay(response)
+                    logger.error(
+                        "API request failed (attempt {}): status {} for {}",
+                        attempt + 1,
+                        response.status_code,
+                        response.url,
+                    )
+                else:
+                    response.raise_for_status()
+                    return response
+            except requests.exceptions.HTTPError as e:
+                logger.error("API request failed without retry: {}", e)
+                return None
+            except requests.exceptions.RequestException as e:
+                logger.error("API request failed (attempt {}): {}", attempt + 1, e)
+
+            if attempt + 1 < self.max_retries:
+                if delay is None:
+                    delay = self.backoff_delay(attempt)
+                time.sleep(min(delay, self.backoff_max))
+
+        return None
+
+    def close(self) -> None:
+        """Schließt alle offenen Verbindungen des Pools."""
+
+        self.session.close()
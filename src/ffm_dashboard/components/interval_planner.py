@@ -0,0 +1,123 @@
+"""Adaptive Planung der Abfragefenster für historische Sensordaten."""
+
+from datetime import datetime, timedelta
+from typing import Final
+
+from loguru import logger
+
+API_ROW_LIMIT: Final = 10000
+"""Maximale Anzahl Messwerte, die der ``/data``-Endpunkt pro Anfrage zurückgibt."""
+
+TIME_FORMAT: Final = "%Y-%m-%dT%H:%M:%SZ"
+"""Zeitformat der Intervallgrenzen (wie in ``create_time_intervals``)."""
+
+
+class AdaptiveIntervalPlanner:
+    """
+    Plant die Abfragefenster eines Sensors adaptiv anhand der tatsächlich
+    zurückgegebenen Zeilenanzahl.
+
+    - Erreicht eine Antwort das Zeilenlimit der API, wurde sie abgeschnitten:
+      Das Fenster wird verworfen, halbiert und erneut abgefragt.
+    - Sonst wird das nächste Fenster so gewählt, dass es voraussichtlich
+      ``target_fill`` des Limits enthält. Bei dünn besetzten Zeiträumen wachsen
+      die Fenster, bei dichten Sensoren schrumpfen sie.
+
+    Die Fenster schließen lückenlos aneinander an: das nächste Fenster beginnt
+    eine Sekunde nach dem Ende des vorherigen, wie bei ``create_time_intervals``.
+
+    :param start: Beginn des zu ladenden Zeitraums.
+    :type start: datetime
+    :param end: Ende des zu ladenden Zeitraums (inklusive).
+    :type end: datetime
+    :param initial_step: Länge des ersten Fensters.
+    :type initial_step: timedelta
+    :param min_step: Minimale Fensterlänge; kleinere Fenster werden nicht geteilt.
+    :type min_step: timedelta
+    :param max_step: Maximale Fensterlänge.
+    :type max_step: timedelta
+    :param row_limit: Zeilenlimit der API pro Anfrage.
+    :type row_limit: int
+    :param target_fill: Angestrebter Anteil des Zeilenlimits pro Fenster.
+    :type target_fill: float
+    """
+
+    def __init__(
+        self,
+        start: datetime,
+        end: datetime,
+        initial_step: timedelta = timedelta(days=10),
+        min_step: timedelta = timedelta(minutes=10),
+        max_step: timedelta = timedelta(days=365),
+        row_limit: int = API_ROW_LIMIT,
+        target_fill: float = 0.8,
+    ) -> None:
+        self.current = start
+        self.end = end
+        self.step = initial_step
+        self.min_step = min_step
+        self.max_step = max_step
+        self.row_limit = row_limit
+        self.target_fill = target_fill
+
+    def next_window(self) -> tuple[str, str] | None:
+        """
+        Gibt das nächste abzufragende Fenster zurück.
+
+        :return: Tupel mit Start- und Endzeitpunkt im ISO-Format oder None, wenn
+                 der Zeitraum vollständig abgedeckt ist.
+        :rtype: tuple[str, str] | None
+        """
+
+        if self.current > self.end:
+            return None
+        window_end: datetime = min(
+            self.current + self.step - timedelta(seconds=1), self.end
+        )
+        return self.current.strftime(TIME_FORMAT), window_end.strftime(TIME_FORMAT)
+
+    def skip(self, window: tuple[str, str]) -> None:
+        """
+        Überspringt ein fehlgeschlagenes Fenster, ohne die Fenstergröße anzupassen.
+
+        :param window: Das fehlgeschlagene Fenster (Start, Ende) im ISO-Format.
+        :type window: tuple[str, str]
+        """
+
+        self.current = datetime.strptime(window[1], TIME_FORMAT) + timedelta(seconds=1)
+
+    def report(self, window: tuple[str, str], num_rows: int) -> bool:
+        """
+        Meldet die Zeilenanzahl eines abgefragten Fensters und passt die Fenstergröße an.
+
+        :param window: Das abgefragte Fenster (Start, Ende) im ISO-Format.
+        :type window: tuple[str, str]
+        :param num_rows: Anzahl der von der API gelieferten Zeilen.
+        :type num_rows: int
+        :return: True, wenn das Fenster übernommen wird; False, wenn es abgeschnitten
+                 war und geteilt erneut abgefragt werden muss.
+        :rtype: bool
+        """
+
+        window_start: datetime = datetime.strptime(window[0], TIME_FORMAT)
+        window_end: datetime = datetime.strptime(window[1], TIME_FORMAT)
+        duration: timedelta = window_end - window_start + timedelta(seconds=1)
+
+        if num_rows >= self.row_limit:
+            if duration > self.min_step:
+                self.step = max(self.min_step, duration / 2)
+                return False
+            logger.warning(
+                "Window {} - {} hit the API row limit at minimal size, "
+                "data may be truncated.",
+                *window,
+            )
+
+        self.current = window_end + timedelta(seconds=1)
+        target_rows: float = self.row_limit * self.target_fill
+        if num_rows == 0:
+            next_step: timedelta = duration * 4
+        else:
+            next_step = duration * min(4.0, max(0.25, target_rows / num_rows))
+        self.step = min(self.max_step, max(self.min_step, next_step))
+        return True
@@ -1,19 +1,56 @@
 """SenseBoxAPI-Klasse für die Abfragen der Sensordaten."""
 
-import gc
+import io
 import json
 import os
-import time
+import queue
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from timeit import default_timer as timer
+from typing import Final, Literal
 
 import pandas as pd
-import requests
+import polars as pl
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 from loguru import logger
 from requests import Response
 from requests.models import PreparedRequest
 
+from src.ffm_dashboard.components.backfill_checkpoint import (
+    BackfillCheckpoint,
+    WindowStatus,
+)
+from src.ffm_dashboard.components.http_client import SenseBoxHttpClient
+from src.ffm_dashboard.components.interval_planner import (
+    TIME_FORMAT,
+    AdaptiveIntervalPlanner,
+)
+from src.ffm_dashboard.datalake.parquet_writer import (
+    DEFAULT_MAX_ROWS_PER_FILE,
+    SensorPartitionWriter,
+    get_sensor_partition_path,
+)
+from src.ffm_dashboard.utils.polars_engine import use_polars
+
+DEFAULT_BACKFILL_WORKERS: Final = 8
+"""Standardanzahl paralleler API-Abfragen beim Laden der historischen Daten."""
+
+HISTORY_CSV_COLUMN_TYPES: Final = {
+    "createdAt": pa.timestamp("ms", tz="UTC"),
+    "value": pa.float64(),
+}
+"""Spaltentypen der CSV-Antwort des ``/data``-Endpunkts."""
+
+DEFAULT_SEGMENT_DAYS: Final = 90
+"""Länge der parallel geladenen Segmente beim historischen Import in Tagen."""
+
+DEFAULT_SYNC_LOOKBACK: Final = timedelta(days=2)
+"""Zeitraum, der beim Nachladen für Sensoren ohne gespeicherte Daten abgefragt wird."""
+
 
 class NoDataFoundError(Exception):
     """Exception, falls ein API-Call keine Daten zurückliefert"""
@@ -34,11 +71,23 @@ class SenseBoxDataLoader:
     :type base_url: str
     :param box_id: Die eindeutige ID der SenseBox.
     :type box_id: str
+    :param http_client: Gemeinsamer HTTP-Client; ohne Angabe wird ein eigener erstellt.
+    :type http_client: SenseBoxHttpClient | None
+    :param response_format: Format der historischen Daten ('csv' oder 'json').
+    :type response_format: Literal["csv", "json"]
     """
 
-    def __init__(self, base_url: str, box_id: str) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        box_id: str,
+        http_client: SenseBoxHttpClient | None = None,
+        response_format: Literal["csv", "json"] = "csv",
+    ) -> None:
         self.base_url = base_url
         self.box_id = box_id
+        self.http_client = http_client or SenseBoxHttpClient()
+        self.response_format = response_format
 
     @staticmethod
     def create_time_intervals(
@@ -80,8 +129,8 @@ class SenseBoxDataLoader:
 
     def get_response(self, url: str, params: dict = None) -> dict | None:
         """
-        Führt eine GET-Anfrage aus und gibt das JSON-Ergebnis zurück,
-        mit bis zu 3 Wiederholungen bei Fehlern.
+        Führt eine GET-Anfrage über den gemeinsamen HTTP-Client aus und gibt das
+        JSON-Ergebnis zurück. Wiederholungen mit Backoff übernimmt der Client.
 
         :param url: Die Ziel-URL der API.
         :type url: str
@@ -91,24 +140,36 @@ class SenseBoxDataLoader:
         :rtype: dict | None
         """
 
-        for attempt in range(3):
-            try:
-                response: Response = requests.get(url, params=params, timeout=15)
-                response.raise_for_status()
-                data: dict = response.json()
-                if not data:
-                    logger.warning("No data found for box_id {}", self.box_id)
-                    raise NoDataFoundError(url, params)
-                return data
-
-            except requests.exceptions.RequestException as e:
-                logger.error("API request failed (attempt {}): {}", attempt + 1, e)
-                time.sleep(10)
-            except (json.JSONDecodeError, KeyError, TypeError) as e:  # Added TypeError
-                logger.error("Failed to parse or process API response: {}", e)
-                return None
-
-        return None
+        response: Response | None = self.http_client.get(url, params=params)
+        if response is None:
+            return None
+
+        try:
+            data: dict = response.json()
+        except (json.JSONDecodeError, KeyError, TypeError) as e:  # Added TypeError
+            logger.error("Failed to parse or process API response: {}", e)
+            return None
+
+        if not data:
+            logger.warning("No data found for box_id {}", self.box_id)
+            raise NoDataFoundError(url, params)
+        return data
+
+    def get_raw_response(self, url: str, params: dict = None) -> bytes | None:
+        """
+        Führt eine GET-Anfrage über den gemeinsamen HTTP-Client aus und gibt den
+        (dekomprimierten) Inhalt der Antwort unverarbeitet zurück.
+
+        :param url: Die Ziel-URL der API.
+        :type url: str
+        :param params: Optionale Parameter für den API-Call.
+        :type params: dict | None
+        :return: Inhalt der API-Antwort oder None bei Fehler.
+        :rtype: bytes | None
+        """
+
+        response: Response | None = self.http_client.get(url, params=params)
+        return None if response is None else response.content
 
     def get_box_information(self) -> dict | None:
         """
@@ -233,22 +294,54 @@ class SenseBoxDataLoader:
         :rtype: pd.DataFrame | None
         """
 
+        sensor_data, _ = self._fetch_historical_window(sensor_id, from_date, to_date)
+        return sensor_data
+
+    def _fetch_historical_window(
+        self, sensor_id: str, from_date: str, to_date: str
+    ) -> tuple[pd.DataFrame | None, int | None]:
+        """
+        Fragt ein Zeitfenster eines Sensors ab und gibt neben den aufbereiteten
+        Daten auch die Anzahl der von der API gelieferten Zeilen zurück. Diese wird
+        für die adaptive Fensterplanung benötigt, um abgeschnittene Antworten zu erkennen.
+
+        :param sensor_id: Die Sensor-ID.
+        :type sensor_id: str
+        :param from_date: Startzeitpunkt im ISO-Format.
+        :type from_date: str
+        :param to_date: Endzeitpunkt im ISO-Format.
+        :type to_date: str
+        :return: Tupel aus DataFrame (oder None) und Zeilenanzahl der Antwort
+                 (None, wenn die Anfrage fehlgeschlagen ist).
+        :rtype: tuple[pd.DataFrame | None, int | None]
+        """
+
         url: str = f"{self.base_url}/data/{sensor_id}"
         params: dict = {"from-date": from_date, "to-date": to_date}
 
-        data: dict = self.get_response(url, params)
-        df: pd.DataFrame = pd.json_normalize(data)
-
-        if "createdAt" not in df.columns:
-            logger.warning(
-                "Field 'createdAt' not found for sensor {} in box_id {}.",
-                sensor_id,
-                self.box_id,
+        df: pd.DataFrame | None = None
+        if self.response_format == "csv":
+            content: bytes | None = self.get_raw_response(
+                url, params | {"format": "csv"}
             )
-            return None
+            if content is None:
+                return None, None
+            try:
+                df, num_rows = self.parse_csv_history(content)
+            except (pa.ArrowInvalid, KeyError) as e:
+                logger.warning(
+                    "Failed to parse CSV response, falling back to JSON: {}", e
+                )
+
+        if df is None:
+            data: list | None = self.get_response(url, params)
+            if data is None:
+                return None, None
+            df, num_rows = self.parse_json_history(data)
+
+        if num_rows == 0:
+            raise NoDataFoundError(url, params)
 
-        # Filter out rows where timestamp or value might be missing *before* processing
-        df = df.dropna(subset=["createdAt", "value"])
         if df.empty:
             logger.warning(
                 "No valid sensor data for sensor {} of box_id {} from {} to {}.",
@@ -257,30 +350,171 @@ class SenseBoxDataLoader:
                 from_date,
                 to_date,
             )
-            return None
+            return None, num_rows
 
-        df_filtered = df.copy()
-        df_filtered["timestamp"] = pd.to_datetime(df_filtered["createdAt"])
+        return df.assign(box_id=self.box_id, sensor_id=sensor_id), num_rows
 
-        required_cols = {"timestamp": "timestamp", "value": "measurement"}
-        cols_to_select = {
-            k: v for k, v in required_cols.items() if k in df_filtered.columns
-        }
-        df_final = df_filtered[list(cols_to_select.keys())].rename(
-            columns=cols_to_select
+    @staticmethod
+    def parse_csv_history(content: bytes) -> tuple[pd.DataFrame, int]:
+        """
+        Liest eine CSV-Antwort des ``/data``-Endpunkts direkt in typisierte
+        Arrow-Spalten und wandelt sie ohne Zwischenschritte in einen DataFrame um.
+
+        :param content: Rohdaten der CSV-Antwort.
+        :type content: bytes
+        :return: Tupel aus DataFrame mit den Spalten 'timestamp' und 'measurement'
+                 (ohne ungültige Zeilen) und der Zeilenanzahl der Antwort.
+        :rtype: tuple[pd.DataFrame, int]
+        """
+
+        if not content.strip():
+            return pd.DataFrame(columns=["timestamp", "measurement"]), 0
+
+        convert_options = pa_csv.ConvertOptions(
+            include_columns=["createdAt", "value"],
+            column_types=HISTORY_CSV_COLUMN_TYPES,
         )
+        try:
+            table: pa.Table = pa_csv.read_csv(
+                io.BytesIO(content), convert_options=convert_options
+            )
+        except pa.ArrowInvalid:
+            # Nicht-numerische Messwerte: wie im JSON-Pfad zu NaN umwandeln
+            convert_options.column_types = {
+                "createdAt": HISTORY_CSV_COLUMN_TYPES["createdAt"],
+                "value": pa.string(),
+            }
+            table = pa_csv.read_csv(
+                io.BytesIO(content), convert_options=convert_options
+            )
+            table = table.set_column(
+                1,
+                "value",
+                pa.array(
+                    pd.to_numeric(table["value"].to_pandas(), errors="coerce"),
+                    type=pa.float64(),
+                ),
+            )
 
-        df_final = df_final.assign(box_id=self.box_id, sensor_id=sensor_id)
+        num_rows: int = table.num_rows
+        df: pd.DataFrame = (
+            table.drop_null()
+            .rename_columns(["timestamp", "measurement"])
+            .to_pandas(coerce_temporal_nanoseconds=True)
+        )
+        return df, num_rows
 
-        return df_final
+    @staticmethod
+    def parse_json_history(data: list[dict]) -> tuple[pd.DataFrame, int]:
+        """
+        Wandelt eine JSON-Antwort des ``/data``-Endpunkts in einen DataFrame um.
+        Es werden nur die benötigten Felder übernommen (ohne ``json_normalize``).
+
+        :param data: Liste der Messwerte aus der JSON-Antwort.
+        :type data: list[dict]
+        :return: Tupel aus DataFrame mit den Spalten 'timestamp' und 'measurement'
+                 (ohne ungültige Zeilen) und der Zeilenanzahl der Antwort.
+        :rtype: tuple[pd.DataFrame, int]
+        """
+
+        raw_df: pd.DataFrame = pd.DataFrame.from_records(
+            data, columns=["createdAt", "value"]
+        )
+        df = pd.DataFrame(
+            {
+                "timestamp": pd.to_datetime(
+                    raw_df["createdAt"], utc=True, format="ISO8601"
+                ),
+                "measurement": pd.to_numeric(raw_df["value"], errors="coerce"),
+            }
+        ).dropna()
+        return df, len(raw_df)
+
+    def _fetch_window_chain(
+        self,
+        sensor_id: str,
+        from_date: str,
+        to_date: str,
+        emit: Callable[[str, tuple[str, str], WindowStatus, pd.DataFrame | None], None],
+    ) -> None:
+        """
+        Lädt einen Zeitraum eines Sensors in adaptiv geplanten, lückenlos
+        aneinander anschließenden Fenstern (siehe :class:`AdaptiveIntervalPlanner`).
+        Jedes abgeschlossene Fenster wird in Reihenfolge über ``emit`` gemeldet.
+        Wird parallel im Thread-Pool ausgeführt.
 
-    def fetch_all_historical_data_for_one_box(self, output_dir_path: Path):
+        :param sensor_id: Die Sensor-ID.
+        :type sensor_id: str
+        :param from_date: Beginn des Zeitraums im ISO-Format.
+        :type from_date: str
+        :param to_date: Ende des Zeitraums im ISO-Format.
+        :type to_date: str
+        :param emit: Callback, der (Sensor-ID, Fenster, Status, DataFrame) erhält.
+        :type emit: Callable
+        """
+
+        planner = AdaptiveIntervalPlanner(
+            datetime.strptime(from_date, TIME_FORMAT),
+            datetime.strptime(to_date, TIME_FORMAT),
+        )
+        while (window := planner.next_window()) is not None:
+            try:
+                sensor_data, num_rows = self._fetch_historical_window(
+                    sensor_id, *window
+                )
+            except NoDataFoundError as e:
+                logger.debug(e)
+                planner.report(window, 0)
+                emit(sensor_id, window, WindowStatus.EMPTY, None)
+                continue
+
+            if num_rows is None:
+                planner.skip(window)
+                emit(sensor_id, window, WindowStatus.FAILED, None)
+            elif planner.report(window, num_rows):
+                status: WindowStatus = (
+                    WindowStatus.EMPTY if sensor_data is None else WindowStatus.DONE
+                )
+                emit(sensor_id, window, status, sensor_data)
+            else:
+                logger.debug(
+                    "Window {} - {} of sensor {} hit the row limit, splitting.",
+                    *window,
+                    sensor_id,
+                )
+
+    def fetch_all_historical_data_for_one_box(
+        self,
+        output_dir_path: Path,
+        max_workers: int = DEFAULT_BACKFILL_WORKERS,
+        retry_failed: bool = False,
+        max_rows_per_file: int = DEFAULT_MAX_ROWS_PER_FILE,
+    ) -> None:
         """
         Lädt alle historischen Daten für alle Sensoren einer SenseBox
-        und speichert sie partitioniert als Parquet-Dateien.
+        und speichert sie als Parquet-Dateien, partitioniert nach Sensor, Jahr und
+        Monat (``sensor_partition=<id>/year=<YYYY>/month=<M>``).
+
+        Der Zeitraum seit Erstellung der Box wird in Segmente von
+        ``DEFAULT_SEGMENT_DAYS`` Tagen geteilt. Jedes (Sensor, Segment)-Paar wird
+        parallel in einem Thread-Pool mit begrenzter Größe in adaptiv geplanten
+        Fenstern geladen. Jedes Fenster wird sofort über einen
+        :class:`SensorPartitionWriter` als Row-Group in die Partition des Sensors
+        geschrieben, sodass der Speicherbedarf unabhängig vom Alter der Box bleibt.
+        Sobald eine Parquet-Datei nach ``max_rows_per_file`` Zeilen abgeschlossen
+        wird, werden ihre Fenster im Checkpoint-Manifest festgehalten. Ein
+        erneuter Aufruf setzt jedes Segment nach dem letzten festgehaltenen Fenster
+        fort; mit ``retry_failed`` werden ausschließlich leere oder fehlgeschlagene
+        Fenster erneut abgefragt.
 
         :param output_dir_path: Verzeichnis, in dem die Daten gespeichert werden.
         :type output_dir_path: pathlib.Path
+        :param max_workers: Maximale Anzahl gleichzeitiger API-Abfragen.
+        :type max_workers: int
+        :param retry_failed: Nur leere oder fehlgeschlagene Fenster erneut abfragen.
+        :type retry_failed: bool
+        :param max_rows_per_file: Maximale Zeilenanzahl pro Parquet-Datei.
+        :type max_rows_per_file: int
         """
 
         sensors_info: pd.DataFrame = self.get_sensors_information_for_box()
@@ -290,60 +524,286 @@ class SenseBoxDataLoader:
             .strftime("%Y-%m-%dT%H:%M:%S.%fZ")
         )
         sensors: set = set(sensors_info["sensor_id"])
-        time_intervals: list = self.create_time_intervals(box_creation_date)
+        segments: list = self.create_time_intervals(
+            box_creation_date, day_step=DEFAULT_SEGMENT_DAYS
+        )
 
         os.makedirs(output_dir_path, exist_ok=True)
+        checkpoint = BackfillCheckpoint(output_dir_path)
+        # Nicht abgeschlossene Dateien eines abgebrochenen Imports verwerfen
+        for tmp_path in output_dir_path.rglob(".part-*.parquet.tmp"):
+            tmp_path.unlink()
 
-        logger.debug("Start fetching all historical data for box {}", self.box_id)
-        start = timer()
+        tasks: list[tuple[str, str, str]] = []
         for sensor in sensors:
-            logger.debug("Start fetching historical data for sensor {}", sensor)
-            sensor_dfs: list = []
-            for i, (start_date, end_date) in enumerate(time_intervals):
-                if i % 10 == 0:
-                    logger.debug(
-                        "{}th of {} iterations for sensor {}",
-                        i,
-                        len(time_intervals),
-                        sensor,
+            if retry_failed:
+                tasks.extend(
+                    (sensor, start_date, end_date)
+                    for start_date, end_date in checkpoint.get_failed_windows(sensor)
+                )
+                continue
+            for start_date, end_date in segments:
+                resume_date: str | None = checkpoint.get_resume_point(
+                    sensor, start_date, end_date
+                )
+                if resume_date is not None:
+                    tasks.append((sensor, resume_date, end_date))
+
+        if not tasks:
+            logger.info("No historical data left to fetch for box {}", self.box_id)
+            return
+
+        num_chains: int = len(tasks)
+        chains_left: Counter = Counter(sensor for sensor, _, _ in tasks)
+        sensors_metadata: dict[str, dict] = (
+            sensors_info.drop_duplicates("sensor_id")
+            .set_index("sensor_id")
+            .to_dict("index")
+        )
+        writers: dict[str, SensorPartitionWriter] = {
+            sensor: SensorPartitionWriter(
+                get_sensor_partition_path(output_dir_path, sensor),
+                sensors_metadata.get(sensor, {}),
+                on_commit=lambda records, sensor=sensor: checkpoint.record_windows(
+                    sensor, records
+                ),
+                max_rows_per_file=max_rows_per_file,
+            )
+            for sensor in chains_left
+        }
+        results: queue.Queue = queue.Queue()
+        num_windows: int = 0
+        num_rows: int = 0
+
+        def run_chain(sensor_id: str, from_date: str, to_date: str) -> None:
+            try:
+                self._fetch_window_chain(
+                    sensor_id, from_date, to_date, lambda *item: results.put(item)
+                )
+            finally:
+                results.put((sensor_id, None, None, None))
+
+        logger.debug(
+            "Start fetching historical data for box {} ({} segments, {} workers)",
+            self.box_id,
+            num_chains,
+            max_workers,
+        )
+        start = timer()
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="backfill"
+        ) as executor:
+            futures: list = [
+                executor.submit(run_chain, sensor, start_date, end_date)
+                for sensor, start_date, end_date in tasks
+            ]
+            num_chains_done: int = 0
+            while num_chains_done < num_chains:
+                sensor, window, status, sensor_data = results.get()
+                if window is None:
+                    num_chains_done += 1
+                    chains_left[sensor] -= 1
+                else:
+                    num_windows += 1
+                    num_window_rows: int = (
+                        0 if sensor_data is None else len(sensor_data)
                     )
-                try:
-                    sensor_data: pd.DataFrame = (
-                        self.fetch_historical_data_for_one_sensor(
-                            sensor, start_date, end_date
-                        )
+                    num_rows += num_window_rows
+                    writers[sensor].write(
+                        sensor_data, (window, status, num_window_rows)
                     )
-                    sensor_dfs.append(sensor_data)
-                except NoDataFoundError as e:
-                    logger.warning(e)
-
-            if sensor_dfs:
-                df: pd.DataFrame = pd.concat(sensor_dfs, ignore_index=True)
-                sensor_info: pd.DataFrame = sensors_info[
-                    sensors_info["sensor_id"] == sensor
-                ]
-                df = df.merge(sensor_info, on="sensor_id")
-
-                df["sensor_partition"] = sensor
-
-                df.to_parquet(
-                    output_dir_path,
-                    engine="pyarrow",
-                    compression="snappy",
-                    index=False,
-                    partition_cols=["sensor_partition"],
-                )
 
-                del df, sensor_dfs
-                gc.collect()
+                    if num_windows % 50 == 0:
+                        elapsed: float = timer() - start
+                        logger.debug(
+                            "{}/{} segments done ({:.1f}%), {} windows, "
+                            "{:.1f} windows/s, {} rows",
+                            num_chains_done,
+                            num_chains,
+                            100 * num_chains_done / num_chains,
+                            num_windows,
+                            num_windows / elapsed if elapsed else 0.0,
+                            num_rows,
+                        )
+
+                if window is None and chains_left[sensor] == 0:
+                    writers[sensor].close()
+                    logger.debug("Wrote historical data for sensor {}", sensor)
+
+            for future in futures:
+                future.result()
 
         end = timer()
         logger.debug(
-            "Fetched all historical data for box {}. Took {}s. Saved data at {}",
+            "Fetched historical data for box {}. Took {}s ({} windows, {} rows, "
+            "{:.1f} rows/s). Saved data at {}",
             self.box_id,
             end - start,
+            num_windows,
+            num_rows,
+            num_rows / (end - start) if end > start else 0.0,
             output_dir_path,
         )
+        failed: int = sum(
+            len(checkpoint.get_failed_windows(sensor)) for sensor in sensors
+        )
+        if failed:
+            logger.warning(
+                "{} windows returned no data or failed. "
+                "Use --retry-failed to fetch them again.",
+                failed,
+            )
+
+    def fetch_missing_sensor_data_for_one_box(
+        self,
+        last_timestamps: dict[str, datetime],
+        max_workers: int = DEFAULT_BACKFILL_WORKERS,
+        max_lookback: timedelta = DEFAULT_SYNC_LOOKBACK,
+    ) -> pd.DataFrame | None:
+        """
+        Lädt für alle Sensoren die Messwerte nach, die seit dem letzten gespeicherten
+        Zeitstempel angefallen sind (inkrementeller Catch-Up).
+
+        Für jeden Sensor wird nur das fehlende Zeitfenster vom letzten gespeicherten
+        Zeitstempel bis jetzt über den ``/data/{sensor_id}``-Endpunkt abgefragt.
+        Sensoren ohne gespeicherte Daten werden für ``max_lookback`` nachgeladen;
+        für die komplette Historie ist der historische Import zuständig.
+
+        :param last_timestamps: Letzter gespeicherter Zeitstempel je Sensor-ID.
+        :type last_timestamps: dict[str, datetime]
+        :param max_workers: Maximale Anzahl gleichzeitiger API-Abfragen.
+        :type max_workers: int
+        :param max_lookback: Zeitraum für Sensoren ohne gespeicherte Daten.
+        :type max_lookback: timedelta
+        :return: DataFrame mit den fehlenden Messwerten oder None, falls keine fehlen.
+        :rtype: pd.DataFrame | None
+        """
+
+        sensors_info: pd.DataFrame = self.get_sensors_information_for_box()
+        fallback_start: pd.Timestamp = pd.Timestamp.now(tz="UTC") - max_lookback
+
+        now: str = pd.Timestamp.now(tz="UTC").strftime(TIME_FORMAT)
+        tasks: list[tuple[str, str]] = []
+        for sensor in sensors_info["sensor_id"]:
+            last_timestamp: datetime | None = last_timestamps.get(sensor)
+            from_ts: pd.Timestamp = (
+                fallback_start
+                if last_timestamp is None
+                else pd.Timestamp(last_timestamp).tz_convert("UTC")
+            )
+            tasks.append((sensor, from_ts.strftime(TIME_FORMAT)))
+
+        logger.info("Catching up sensor data for box {}.", self.box_id)
+        sensor_dfs: list[pd.DataFrame] = []
+
+        def collect(
+            sensor_id: str,
+            window: tuple[str, str],
+            status: WindowStatus,
+            sensor_data: pd.DataFrame | None,
+        ) -> None:
+            if status == WindowStatus.FAILED:
+                logger.warning(
+                    "Catch-up for sensor {} from {} to {} failed.", sensor_id, *window
+                )
+            elif sensor_data is not None:
+                sensor_dfs.append(sensor_data)
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="catch-up"
+        ) as executor:
+            futures: list = [
+                executor.submit(
+                    self._fetch_window_chain, sensor, from_date, now, collect
+                )
+                for sensor, from_date in tasks
+            ]
+            for future in futures:
+                future.result()
+
+        if not sensor_dfs:
+            logger.info("No missing sensor data for box {}.", self.box_id)
+            return None
+
+        df: pd.DataFrame = self.combine_missing_sensor_data(
+            sensor_dfs, sensors_info, last_timestamps
+        )
+        logger.info("Fetched {} missing sensor readings.", len(df))
+        return df
+
+    @staticmethod
+    def combine_missing_sensor_data(
+        sensor_dfs: list[pd.DataFrame],
+        sensors_info: pd.DataFrame,
+        last_timestamps: dict[str, datetime],
+        polars: bool | None = None,
+    ) -> pd.DataFrame:
+        """
+        Fügt die nachgeladenen Messwerte aller Sensoren zusammen, ergänzt die
+        Sensor-Metadaten und verwirft ungültige sowie bereits gespeicherte
+        Messwerte. Mit Polars werden die Schritte lazy und auf mehreren Kernen
+        ausgeführt (siehe ``use_polars``).
+
+        :param sensor_dfs: Nachgeladene Messwerte je Sensor und Zeitfenster.
+        :type sensor_dfs: list[pd.DataFrame]
+        :param sensors_info: Metadaten der Sensoren der Box.
+        :type sensors_info: pd.DataFrame
+        :param last_timestamps: Letzter gespeicherter Zeitstempel je Sensor-ID.
+        :type last_timestamps: dict[str, datetime]
+        :param polars: Polars statt pandas verwenden; None liest ``USE_POLARS``.
+        :type polars: bool | None
+        :return: DataFrame mit den fehlenden Messwerten.
+        :rtype: pd.DataFrame
+        """
+
+        # Zeitstempel, die bereits in der DB liegen (Sekunden-Rundung der Intervalle)
+        last_ts_by_sensor: dict[str, pd.Timestamp] = {
+            sensor: pd.Timestamp(ts).tz_convert("UTC")
+            for sensor, ts in last_timestamps.items()
+            if ts is not None
+        }
+
+        if use_polars(polars):
+            last_ts_lf = pl.LazyFrame(
+                {
+                    "sensor_id": list(last_ts_by_sensor),
+                    "last_timestamp": list(last_ts_by_sensor.values()),
+                },
+                schema={
+                    "sensor_id": pl.String,
+                    "last_timestamp": pl.Datetime("ns", "UTC"),
+                },
+            )
+            return (
+                pl.concat(
+                    [pl.from_pandas(sensor_df).lazy() for sensor_df in sensor_dfs],
+                    how="diagonal_relaxed",
+                )
+                .join(
+                    pl.from_pandas(sensors_info).lazy(),
+                    on="sensor_id",
+                    maintain_order="left",
+                )
+                .with_columns(pl.col("measurement").cast(pl.Float64, strict=False))
+                .filter(pl.col("measurement").is_not_null())
+                .join(last_ts_lf, on="sensor_id", how="left", maintain_order="left")
+                .filter(
+                    pl.col("last_timestamp").is_null()
+                    | (pl.col("timestamp") > pl.col("last_timestamp"))
+                )
+                .drop("last_timestamp")
+                .collect()
+                .to_pandas()
+            )
+
+        df: pd.DataFrame = pd.concat(sensor_dfs, ignore_index=True).merge(
+            sensors_info, on="sensor_id"
+        )
+        df["measurement"] = pd.to_numeric(df["measurement"], errors="coerce")
+        df = df.dropna(subset=["measurement"])
+        last_ts_series: pd.Series = df["sensor_id"].map(last_ts_by_sensor)
+        df = df[last_ts_series.isna() | (df["timestamp"] > last_ts_series)]
+        return df.reset_index(drop=True)
 
     def fetch_temp_data_for_forecast(self) -> pd.DataFrame:
         """
@@ -369,7 +829,7 @@ class SenseBoxDataLoader:
         )
 
         df["measurement"] = df["measurement"].astype(float)
-        df["timestamp"] = df["timestamp"].map(lambda x: x.tz_convert("Europe/Berlin"))
+        df["timestamp"] = df["timestamp"].dt.tz_convert("Europe/Berlin")
         return df
 
 
@@ -380,13 +840,20 @@ class SenseBoxApi:
 
     :param box_id: Die eindeutige ID der SenseBox.
     :type box_id: str
+    :param http_client: Gemeinsamer HTTP-Client; ohne Angabe wird ein eigener erstellt.
+    :type http_client: SenseBoxHttpClient | None
     """
 
-    def __init__(self, box_id: str) -> None:
+    def __init__(
+        self, box_id: str, http_client: SenseBoxHttpClient | None = None
+    ) -> None:
         self.box_id = box_id
         self.base_url = f"https://api.opensensemap.org/boxes/{self.box_id}"
+        self.http_client = http_client or SenseBoxHttpClient()
 
-        self.data_loader = SenseBoxDataLoader(self.base_url, self.box_id)
+        self.data_loader = SenseBoxDataLoader(
+            self.base_url, self.box_id, self.http_client
+        )
 
     # Fetch new data from a sense box
     def fetch_new_sensor_data_for_one_box(self) -> pd.DataFrame:
@@ -401,9 +868,26 @@ class SenseBoxApi:
             sensor_id, from_date, to_date
         )
 
-    def fetch_all_historical_data_for_one_box(self, output_dir_path: Path) -> None:
+    def fetch_all_historical_data_for_one_box(
+        self,
+        output_dir_path: Path,
+        max_workers: int = DEFAULT_BACKFILL_WORKERS,
+        retry_failed: bool = False,
+    ) -> None:
+        """Methode wird oben beschrieben."""
+        return self.data_loader.fetch_all_historical_data_for_one_box(
+            output_dir_path, max_workers, retry_failed
+        )
+
+    def fetch_missing_sensor_data_for_one_box(
+        self,
+        last_timestamps: dict[str, datetime],
+        max_workers: int = DEFAULT_BACKFILL_WORKERS,
+    ) -> pd.DataFrame | None:
         """Methode wird oben beschrieben."""
-        return self.data_loader.fetch_all_historical_data_for_one_box(output_dir_path)
+        return self.data_loader.fetch_missing_sensor_data_for_one_box(
+            last_timestamps, max_workers
+        )
 
     def fetch_temp_data_for_forecast(self) -> pd.DataFrame:
         """Methode wird oben beschrieben."""
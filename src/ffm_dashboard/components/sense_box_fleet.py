@@ -0,0 +1,211 @@
+"""SenseBoxFleet-Klasse für die Abfragen mehrerer SenseBoxen."""
+
+import os
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Final
+
+import pandas as pd
+from loguru import logger
+
+from src.ffm_dashboard.components.http_client import SenseBoxHttpClient
+from src.ffm_dashboard.components.sense_box_api import (
+    DEFAULT_BACKFILL_WORKERS,
+    SenseBoxApi,
+)
+
+SENSE_BOX_IDS_ENV: Final = "SENSEBOX_IDS"
+"""Umgebungsvariable mit den kommagetrennten IDs aller SenseBoxen."""
+
+DEFAULT_FLEET_WORKERS: Final = 8
+"""Standardanzahl gleichzeitig abgefragter SenseBoxen."""
+
+
+def get_box_ids_from_env(default_box_id: str) -> list[str]:
+    """
+    Liest die IDs der SenseBoxen aus der Umgebungsvariable ``SENSEBOX_IDS``.
+
+    :param default_box_id: Box-ID, falls die Variable nicht gesetzt ist.
+    :type default_box_id: str
+    :return: Liste der Box-IDs (ohne Duplikate, Reihenfolge bleibt erhalten).
+    :rtype: list[str]
+    """
+
+    box_ids: list[str] = [
+        box_id.strip()
+        for box_id in os.environ.get(SENSE_BOX_IDS_ENV, "").split(",")
+        if box_id.strip()
+    ]
+    return list(dict.fromkeys(box_ids)) or [default_box_id]
+
+
+class SenseBoxFleet:
+    """
+    Fragt Metadaten, aktuelle und historische Messwerte mehrerer SenseBoxen
+    gleichzeitig ab.
+
+    Alle Boxen teilen sich einen :class:`SenseBoxHttpClient` und damit dessen
+    Connection-Pool und das Anfrage-Budget pro Host. Die Anzahl der Anfragen an
+    die openSenseMap API bleibt so unabhängig von der Anzahl der Boxen begrenzt.
+    Der Pool wird auf die gemeinsame Parallelität (gleichzeitig abgefragte Boxen
+    × Abfragen pro Box) vergrößert, damit jeder Thread eine Verbindung behält.
+    Fehler einer Box werden geloggt und brechen die Abfrage der übrigen Boxen
+    nicht ab.
+
+    :param box_ids: IDs der SenseBoxen.
+    :type box_ids: list[str]
+    :param http_client: Gemeinsamer HTTP-Client; ohne Angabe wird ein eigener erstellt.
+    :type http_client: SenseBoxHttpClient | None
+    :param max_workers: Maximale Anzahl gleichzeitig abgefragter Boxen.
+    :type max_workers: int
+    :param max_workers_per_box: Erwartete Anzahl gleichzeitiger Abfragen pro Box
+                                (für die Größe des Connection-Pools).
+    :type max_workers_per_box: int
+    """
+
+    def __init__(
+        self,
+        box_ids: list[str],
+        http_client: SenseBoxHttpClient | None = None,
+        max_workers: int = DEFAULT_FLEET_WORKERS,
+        max_workers_per_box: int = DEFAULT_BACKFILL_WORKERS,
+    ) -> None:
+        self.box_ids = box_ids
+        self.max_workers = max_workers
+        self.http_client = http_client or SenseBoxHttpClient()
+        self.http_client.ensure_pool_size(self.pool_size(max_workers_per_box))
+
+        self.apis: dict[str, SenseBoxApi] = {
+            box_id: SenseBoxApi(box_id, self.http_client) for box_id in box_ids
+        }
+
+    def pool_size(self, max_workers_per_box: int) -> int:
+        """
+        Berechnet die Anzahl gleichzeitiger Anfragen aller Boxen an die API.
+
+        :param max_workers_per_box: Maximale Anzahl gleichzeitiger Abfragen pro Box.
+        :type max_workers_per_box: int
+        :return: Benötigte Anzahl Verbindungen im Connection-Pool.
+        :rtype: int
+        """
+
+        return max(1, min(self.max_workers, len(self.box_ids))) * max_workers_per_box
+
+    def _run_for_all_boxes(
+        self, task: Callable[[SenseBoxApi], Any], name: str
+    ) -> Iterator[tuple[str, Any]]:
+        """
+        Führt eine Abfrage für alle Boxen parallel aus und gibt die Ergebnisse in
+        der Reihenfolge ihrer Fertigstellung zurück.
+
+        :param task: Abfrage, die mit der SenseBoxApi einer Box aufgerufen wird.
+        :type task: Callable[[SenseBoxApi], Any]
+        :param name: Name der Abfrage für das Logging.
+        :type name: str
+        :return: Iterator über (Box-ID, Ergebnis) der erfolgreichen Abfragen.
+        :rtype: Iterator[tuple[str, Any]]
+        """
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="fleet"
+        ) as executor:
+            futures: dict[Future, str] = {
+                executor.submit(task, api): box_id for box_id, api in self.apis.items()
+            }
+            for future in as_completed(futures):
+                box_id: str = futures[future]
+                try:
+                    yield box_id, future.result()
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    logger.error("Fetching {} for box {} failed: {}", name, box_id, e)
+
+    def fetch_sensors_information(self) -> pd.DataFrame:
+        """
+        Ruft die Metadaten aller Sensoren aller Boxen ab.
+
+        :return: DataFrame mit den Sensor-Metadaten und der Spalte 'box_id'.
+        :rtype: pd.DataFrame
+        """
+
+        sensors_infos: list[pd.DataFrame] = [
+            sensors_info.assign(box_id=box_id)
+            for box_id, sensors_info in self._run_for_all_boxes(
+                SenseBoxApi.get_sensors_information_for_box, "sensor metadata"
+            )
+        ]
+        if not sensors_infos:
+            return pd.DataFrame()
+        return pd.concat(sensors_infos, ignore_index=True)
+
+    def iter_new_sensor_data(self) -> Iterator[pd.DataFrame]:
+        """
+        Holt die aktuellsten Messwerte aller Boxen.
+
+        :return: Iterator über die Messwerte je Box, sobald diese geladen sind.
+        :rtype: Iterator[pd.DataFrame]
+        """
+
+        for _, data in self._run_for_all_boxes(
+            SenseBoxApi.fetch_new_sensor_data_for_one_box, "new sensor data"
+        ):
+            if data is not None and not data.empty:
+                yield data
+
+    def iter_missing_sensor_data(
+        self,
+        last_timestamps: dict[str, dict[str, datetime]],
+        max_workers_per_box: int = DEFAULT_BACKFILL_WORKERS,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Lädt für alle Boxen die Messwerte seit dem letzten gespeicherten Zeitstempel nach.
+
+        :param last_timestamps: Letzter gespeicherter Zeitstempel je Box- und Sensor-ID.
+        :type last_timestamps: dict[str, dict[str, datetime]]
+        :param max_workers_per_box: Maximale Anzahl gleichzeitiger Abfragen pro Box.
+        :type max_workers_per_box: int
+        :return: Iterator über die fehlenden Messwerte je Box, sobald diese geladen sind.
+        :rtype: Iterator[pd.DataFrame]
+        """
+
+        self.http_client.ensure_pool_size(self.pool_size(max_workers_per_box))
+        for _, data in self._run_for_all_boxes(
+            lambda api: api.fetch_missing_sensor_data_for_one_box(
+                last_timestamps.get(api.box_id, {}), max_workers_per_box
+            ),
+            "missing sensor data",
+        ):
+            if data is not None and not data.empty:
+                yield data
+
+    def fetch_all_historical_data(
+        self,
+        output_dir_path: Path,
+        max_workers_per_box: int = DEFAULT_BACKFILL_WORKERS,
+        retry_failed: bool = False,
+    ) -> list[str]:
+        """
+        Lädt die historischen Daten aller Boxen als Parquet-Dateien nach
+        ``output_dir_path/<box_id>``.
+
+        :param output_dir_path: Verzeichnis, in dem die Daten gespeichert werden.
+        :type output_dir_path: pathlib.Path
+        :param max_workers_per_box: Maximale Anzahl gleichzeitiger Abfragen pro Box.
+        :type max_workers_per_box: int
+        :param retry_failed: Nur leere oder fehlgeschlagene Fenster erneut abfragen.
+        :type retry_failed: bool
+        :return: IDs der Boxen, deren Import erfolgreich abgeschlossen wurde.
+        :rtype: list[str]
+        """
+
+        self.http_client.ensure_pool_size(self.pool_size(max_workers_per_box))
+        return [
+            box_id
+            for box_id, _ in self._run_for_all_boxes(
+                lambda api: api.fetch_all_historical_data_for_one_box(
+                    output_dir_path / api.box_id, max_workers_per_box, retry_failed
+                ),
+                "historical data",
+            )
+        ]
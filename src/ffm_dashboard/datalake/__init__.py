@@ -0,0 +1,23 @@
+"""Modul für die lokale Ablage historischer Sensordaten als Parquet."""
+
+from src.ffm_dashboard.datalake.compaction import (
+    CompactionResult,
+    PartitionCompactor,
+)
+from src.ffm_dashboard.datalake.parquet_writer import (
+    PARTITIONING_SCHEMA,
+    SENSOR_DATA_SCHEMA,
+    SensorPartitionWriter,
+    get_sensor_partition_path,
+)
+from src.ffm_dashboard.datalake.reader import SensorDataLake
+
+__all__: list[str] = [
+    "CompactionResult",
+    "PartitionCompactor",
+    "PARTITIONING_SCHEMA",
+    "SENSOR_DATA_SCHEMA",
+    "SensorDataLake",
+    "SensorPartitionWriter",
+    "get_sensor_partition_path",
+]
@@ -0,0 +1,233 @@
+"""Compaction der Parquet-Partitionen im historischen Datenverzeichnis."""
+
+import math
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
+from uuid import uuid4
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from loguru import logger
+
+from src.ffm_dashboard.components.backfill_checkpoint import BackfillCheckpoint
+from src.ffm_dashboard.datalake.parquet_writer import SENSOR_DATA_SCHEMA
+
+DEDUP_COLUMNS: Final = ["timestamp", "box_id", "sensor_id"]
+"""Spalten, die einen Messwert eindeutig identifizieren."""
+
+DEFAULT_TARGET_ROWS_PER_FILE: Final = 1_000_000
+"""Angestrebte Zeilenanzahl einer Parquet-Datei nach der Compaction."""
+
+DEFAULT_ROW_GROUP_SIZE: Final = 128_000
+"""Zeilenanzahl pro Row-Group der neu geschriebenen Dateien."""
+
+
+@dataclass
+class CompactionResult:
+    """
+    Ergebnis der Compaction eines Partitionsverzeichnisses.
+
+    - directory: Verzeichnis relativ zum Datenverzeichnis
+    - files_before/files_after: Anzahl Dateien vor und nach der Compaction
+    - rows_before/rows_after: Anzahl Zeilen vor und nach dem Entfernen von Duplikaten
+    """
+
+    directory: str
+    files_before: int
+    files_after: int
+    rows_before: int
+    rows_after: int
+
+
+class PartitionCompactor:
+    """
+    Fasst viele kleine Parquet-Dateien einer Partition zu wenigen Dateien der
+    Zielgröße zusammen. Die Daten werden dabei nach Zeitstempel sortiert und
+    Duplikate auf (timestamp, box_id, sensor_id) entfernt.
+
+    Die neuen Dateien werden unter temporärem Namen geschrieben und atomar
+    umbenannt, erst danach werden die alten Dateien gelöscht. Bricht der Vorgang
+    dazwischen ab, entstehen höchstens doppelte Zeilen, die ein erneuter Lauf
+    wieder entfernt.
+
+    Dateien, die laut Checkpoint bereits in die Datenbank geladen wurden, werden
+    getrennt von noch nicht geladenen Dateien zusammengefasst; die neuen Dateien
+    übernehmen ihren Status, damit kein Messwert doppelt importiert wird.
+
+    :param data_dir_path: Datenverzeichnis einer Box (``data/<box_id>``) mit
+                          dem zugehörigen Checkpoint-Manifest.
+    :type data_dir_path: pathlib.Path
+    :param target_rows_per_file: Angestrebte Zeilenanzahl einer Datei.
+    :type target_rows_per_file: int
+    """
+
+    def __init__(
+        self,
+        data_dir_path: Path,
+        target_rows_per_file: int = DEFAULT_TARGET_ROWS_PER_FILE,
+    ) -> None:
+        self.data_dir_path = data_dir_path
+        self.target_rows_per_file = target_rows_per_file
+        self.checkpoint = BackfillCheckpoint(data_dir_path)
+
+    def find_partitions(self) -> dict[Path, list[Path]]:
+        """
+        Sucht alle Verzeichnisse, die Parquet-Dateien enthalten.
+
+        :return: Parquet-Dateien je Verzeichnis.
+        :rtype: dict[Path, list[Path]]
+        """
+
+        partitions: dict[Path, list[Path]] = {}
+        for file_path in sorted(self.data_dir_path.rglob("*.parquet")):
+            if file_path.name.startswith((".", "_")):
+                continue
+            partitions.setdefault(file_path.parent, []).append(file_path)
+        return partitions
+
+    def compact(self, dry_run: bool = False) -> list[CompactionResult]:
+        """
+        Führt die Compaction für alle Partitionen mit mehr als einer Datei durch.
+
+        :param dry_run: Nur anzeigen, welche Partitionen zusammengefasst würden.
+        :type dry_run: bool
+        :return: Ergebnisse der zusammengefassten Partitionen.
+        :rtype: list[CompactionResult]
+        """
+
+        results: list[CompactionResult] = []
+        for directory, file_paths in self.find_partitions().items():
+            loaded: list[Path] = []
+            not_loaded: list[Path] = []
+            for file_path in file_paths:
+                if self.checkpoint.is_file_loaded(self._relative_name(file_path)):
+                    loaded.append(file_path)
+                else:
+                    not_loaded.append(file_path)
+
+            # Nicht geladene Dateien zuerst, solange die geladenen noch existieren
+            groups: list[tuple[list[Path], bool, list[Path]]] = [
+                (not_loaded, False, loaded),
+                (loaded, True, []),
+            ]
+            for group, is_loaded, exclude in groups:
+                # Noch nicht geladene Dateien auch einzeln bereinigen, wenn sie
+                # Messwerte bereits geladener Dateien enthalten könnten
+                if len(group) < 2 and not (group and exclude):
+                    continue
+                if dry_run:
+                    logger.info(
+                        "Would compact {} files in '{}'.",
+                        len(group),
+                        self._relative_name(directory),
+                    )
+                    continue
+                result: CompactionResult | None = self.compact_files(
+                    directory, group, is_loaded, exclude
+                )
+                if result is not None:
+                    results.append(result)
+        return results
+
+    def compact_files(
+        self,
+        directory: Path,
+        file_paths: list[Path],
+        is_loaded: bool,
+        exclude_paths: list[Path] | None = None,
+    ) -> CompactionResult | None:
+        """
+        Fasst die übergebenen Dateien eines Verzeichnisses zusammen. Messwerte, die
+        bereits in ``exclude_paths`` enthalten sind, werden dabei entfernt.
+
+        :param directory: Verzeichnis der Dateien.
+        :type directory: pathlib.Path
+        :param file_paths: Die zusammenzufassenden Parquet-Dateien.
+        :type file_paths: list[pathlib.Path]
+        :param is_loaded: Ob die Dateien bereits in die Datenbank geladen wurden.
+        :type is_loaded: bool
+        :param exclude_paths: Dateien, deren Messwerte nicht übernommen werden.
+        :type exclude_paths: list[pathlib.Path] | None
+        :return: Ergebnis der Compaction oder None, wenn eine einzelne Datei
+                 unverändert bleibt.
+        :rtype: CompactionResult | None
+        """
+
+        table: pa.Table = pa.concat_tables(
+            pq.read_table(file_path, schema=SENSOR_DATA_SCHEMA)
+            for file_path in file_paths
+        )
+        rows_before: int = table.num_rows
+        df: pd.DataFrame = table.to_pandas().drop_duplicates(subset=DEDUP_COLUMNS)
+        if exclude_paths:
+            existing: pd.MultiIndex = pd.MultiIndex.from_frame(
+                pa.concat_tables(
+                    pq.read_table(file_path, columns=DEDUP_COLUMNS)
+                    for file_path in exclude_paths
+                ).to_pandas()
+            )
+            df = df[~pd.MultiIndex.from_frame(df[DEDUP_COLUMNS]).isin(existing)]
+        df = df.sort_values("timestamp", kind="stable")
+        table = pa.Table.from_pandas(
+            df, schema=SENSOR_DATA_SCHEMA, preserve_index=False
+        )
+        del df
+        if len(file_paths) == 1 and table.num_rows == rows_before:
+            return None
+
+        num_files: int = max(1, math.ceil(table.num_rows / self.target_rows_per_file))
+        rows_per_file: int = max(1, math.ceil(table.num_rows / num_files))
+        new_paths: list[Path] = []
+        for offset in range(0, table.num_rows, rows_per_file):
+            file_path: Path = directory / f"part-{uuid4().hex}.parquet"
+            tmp_path: Path = directory / f".{file_path.name}.tmp"
+            pq.write_table(
+                table.slice(offset, rows_per_file),
+                tmp_path,
+                row_group_size=DEFAULT_ROW_GROUP_SIZE,
+                compression="snappy",
+                write_statistics=True,
+                sorting_columns=[pq.SortingColumn(0)],
+            )
+            os.replace(tmp_path, file_path)
+            new_paths.append(file_path)
+
+        if is_loaded:
+            self.checkpoint.replace_loaded_files(
+                [self._relative_name(path) for path in file_paths],
+                [self._relative_name(path) for path in new_paths],
+            )
+        for file_path in file_paths:
+            file_path.unlink()
+
+        result = CompactionResult(
+            directory=self._relative_name(directory),
+            files_before=len(file_paths),
+            files_after=len(new_paths),
+            rows_before=rows_before,
+            rows_after=table.num_rows,
+        )
+        logger.info(
+            "Compacted '{}': {} -> {} files, {} -> {} rows.",
+            result.directory,
+            result.files_before,
+            result.files_after,
+            result.rows_before,
+            result.rows_after,
+        )
+        return result
+
+    def _relative_name(self, path: Path) -> str:
+        """
+        Gibt den Pfad relativ zum Datenverzeichnis zurück (wie im Checkpoint).
+
+        :param path: Absoluter Pfad.
+        :type path: pathlib.Path
+        :return: Relativer Pfad mit '/' als Trennzeichen.
+        :rtype: str
+        """
+
+        return path.relative_to(self.data_dir_path).as_posix()
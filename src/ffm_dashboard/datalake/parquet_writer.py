@@ -0,0 +1,186 @@
+"""Streaming-Writer für die Parquet-Partitionen der historischen Sensordaten."""
+
+import os
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Final
+from uuid import uuid4
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from loguru import logger
+
+SENSOR_DATA_SCHEMA: Final = pa.schema(
+    [
+        ("timestamp", pa.timestamp("ns", tz="UTC")),
+        ("measurement", pa.float64()),
+        ("box_id", pa.string()),
+        ("sensor_id", pa.string()),
+        ("title", pa.string()),
+        ("unit", pa.string()),
+        ("sensor_type", pa.string()),
+        ("icon", pa.string()),
+    ]
+)
+"""Schema der Parquet-Dateien (entspricht den Spalten der Tabelle 'sensor_data')."""
+
+METADATA_COLUMNS: Final = ("title", "unit", "sensor_type", "icon")
+"""Metadaten-Spalten, die pro Batch an die Messwerte angehängt werden."""
+
+PARTITIONING_SCHEMA: Final = pa.schema(
+    [
+        ("sensor_partition", pa.string()),
+        ("year", pa.int16()),
+        ("month", pa.int8()),
+    ]
+)
+"""Hive-Partitionierung des Datenverzeichnisses: ``sensor_partition=<id>/year=<YYYY>/month=<M>``."""
+
+DEFAULT_MAX_ROWS_PER_FILE: Final = 500_000
+"""Anzahl Zeilen, nach der die offenen Parquet-Dateien eines Sensors abgeschlossen werden."""
+
+
+def get_sensor_partition_path(data_dir_path: Path, sensor_id: str) -> Path:
+    """
+    Gibt das Verzeichnis der Partition eines Sensors zurück.
+
+    :param data_dir_path: Verzeichnis der historischen Parquet-Daten.
+    :type data_dir_path: pathlib.Path
+    :param sensor_id: Die Sensor-ID.
+    :type sensor_id: str
+    :return: Pfad der Sensor-Partition.
+    :rtype: pathlib.Path
+    """
+
+    return data_dir_path / f"sensor_partition={sensor_id}"
+
+
+class SensorPartitionWriter:
+    """
+    Schreibt die Messwerte eines Sensors fortlaufend in seine Parquet-Partition.
+
+    Jeder übergebene Batch (ein abgefragtes Zeitfenster) wird nach Zeitstempel
+    sortiert, mit den Sensor-Metadaten ergänzt und nach Monat aufgeteilt. Jeder
+    Teil wird direkt als eigene Row-Group (mit Min/Max-Statistiken) über einen
+    ``pyarrow.parquet.ParquetWriter`` an die Datei seiner Partition
+    ``year=<YYYY>/month=<M>`` angehängt. Der Speicherbedarf hängt dadurch nur von
+    der Größe eines Batches ab, nicht vom Alter der Box.
+
+    Sobald die offenen Dateien zusammen ``max_rows_per_file`` Zeilen enthalten,
+    werden alle geschlossen, von ihrem temporären Namen atomar umbenannt und
+    ``on_commit`` mit den Einträgen aller enthaltenen Batches aufgerufen. Erst
+    dann gelten diese als gespeichert, auch wenn ein Batch auf mehrere Dateien
+    verteilt wurde.
+
+    :param partition_path: Verzeichnis der Sensor-Partition.
+    :type partition_path: pathlib.Path
+    :param metadata: Sensor-Metadaten (title, unit, sensor_type, icon).
+    :type metadata: dict[str, Any]
+    :param on_commit: Callback, der die Einträge geschriebener Batches erhält.
+    :type on_commit: Callable[[list], None] | None
+    :param max_rows_per_file: Maximale Zeilenanzahl der offenen Dateien.
+    :type max_rows_per_file: int
+    """
+
+    def __init__(
+        self,
+        partition_path: Path,
+        metadata: dict[str, Any],
+        on_commit: Callable[[list], None] | None = None,
+        max_rows_per_file: int = DEFAULT_MAX_ROWS_PER_FILE,
+    ) -> None:
+        self.partition_path = partition_path
+        self.metadata = {column: metadata.get(column) for column in METADATA_COLUMNS}
+        self.on_commit = on_commit
+        self.max_rows_per_file = max_rows_per_file
+
+        self._files: dict[tuple[int, int], tuple[pq.ParquetWriter, Path, Path]] = {}
+        self._rows_in_files: int = 0
+        self._pending: list = []
+
+    def write(self, df: pd.DataFrame | None, record: Any = None) -> None:
+        """
+        Hängt einen Batch als Row-Groups an die Dateien der betroffenen Monate an.
+
+        :param df: Messwerte mit den Spalten timestamp, measurement, box_id und
+                   sensor_id (oder None für ein Fenster ohne Daten).
+        :type df: pd.DataFrame | None
+        :param record: Eintrag, der beim Abschluss der Dateien an ``on_commit`` geht.
+        :type record: Any
+        """
+
+        if record is not None:
+            self._pending.append(record)
+
+        if df is None or df.empty:
+            # Ohne offene Dateien geht beim Abbruch nichts verloren
+            if not self._files:
+                self.commit()
+            return
+
+        df = df.sort_values("timestamp").assign(**self.metadata)
+        timestamps: pd.Series = df["timestamp"].dt.tz_convert("UTC")
+        for (year, month), month_df in df.groupby(
+            [timestamps.dt.year, timestamps.dt.month], sort=True
+        ):
+            table: pa.Table = pa.Table.from_pandas(
+                month_df, schema=SENSOR_DATA_SCHEMA, preserve_index=False
+            )
+            self._get_writer(int(year), int(month)).write_table(table)
+            self._rows_in_files += table.num_rows
+
+        if self._rows_in_files >= self.max_rows_per_file:
+            self.commit()
+
+    def _get_writer(self, year: int, month: int) -> pq.ParquetWriter:
+        """
+        Gibt den Writer der Monatspartition zurück und öffnet bei Bedarf eine neue Datei.
+
+        :param year: Jahr der Partition.
+        :type year: int
+        :param month: Monat der Partition.
+        :type month: int
+        :return: Der Writer der temporären Datei.
+        :rtype: pq.ParquetWriter
+        """
+
+        if (year, month) not in self._files:
+            month_path: Path = self.partition_path / f"year={year}" / f"month={month}"
+            os.makedirs(month_path, exist_ok=True)
+            file_path: Path = month_path / f"part-{uuid4().hex}.parquet"
+            tmp_path: Path = month_path / f".{file_path.name}.tmp"
+            writer = pq.ParquetWriter(
+                tmp_path,
+                SENSOR_DATA_SCHEMA,
+                compression="snappy",
+                write_statistics=True,
+                sorting_columns=[pq.SortingColumn(0)],
+            )
+            self._files[(year, month)] = (writer, tmp_path, file_path)
+        return self._files[(year, month)][0]
+
+    def commit(self) -> None:
+        """Schließt alle offenen Dateien und meldet die enthaltenen Batches als gespeichert."""
+
+        for writer, tmp_path, file_path in self._files.values():
+            writer.close()
+            os.replace(tmp_path, file_path)
+        if self._files:
+            logger.debug(
+                "Wrote {} rows to {} files in '{}'.",
+                self._rows_in_files,
+                len(self._files),
+                self.partition_path.name,
+            )
+        self._files = {}
+        self._rows_in_files = 0
+
+        if self._pending and self.on_commit is not None:
+            self.on_commit(self._pending)
+        self._pending = []
+
+    def close(self) -> None:
+        """Schließt den Writer; alle noch offenen Batches werden festgeschrieben."""
+
+        self.commit()
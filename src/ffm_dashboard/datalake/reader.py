@@ -0,0 +1,164 @@
+"""Lesezugriff auf die partitionierten Parquet-Daten über ``pyarrow.dataset``."""
+
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+from src.ffm_dashboard.datalake.parquet_writer import PARTITIONING_SCHEMA
+
+
+def _to_utc_timestamp(value: datetime) -> pd.Timestamp:
+    """Wandelt einen Zeitpunkt in UTC um (naive Zeitpunkte gelten als UTC)."""
+
+    timestamp: pd.Timestamp = pd.Timestamp(value)
+    if timestamp.tz is None:
+        return timestamp.tz_localize("UTC")
+    return timestamp.tz_convert("UTC")
+
+
+class SensorDataLake:
+    """
+    Liest historische Sensordaten aus dem Hive-partitionierten Datenverzeichnis
+    (``sensor_partition=<id>/year=<YYYY>/month=<M>``).
+
+    Filter auf Sensoren und Zeitraum werden an ``pyarrow.dataset`` übergeben:
+    Sensor und Monat schränken die gelesenen Verzeichnisse ein, der Zeitraum
+    wird zusätzlich über die Row-Group-Statistiken von ``timestamp`` geprüft.
+    Es werden also nur Dateien und Row-Groups gelesen, die relevante Daten
+    enthalten können.
+
+    :param data_dir_path: Verzeichnis der historischen Parquet-Daten.
+    :type data_dir_path: pathlib.Path
+    """
+
+    def __init__(self, data_dir_path: Path) -> None:
+        self.data_dir_path = data_dir_path
+
+    def dataset(self) -> ds.Dataset:
+        """
+        Öffnet das Datenverzeichnis als Dataset (Dateien mit '.' oder '_' am Anfang
+        wie Checkpoint und temporäre Dateien werden ignoriert).
+
+        :return: Das Dataset mit den Partitionsspalten sensor_partition, year und month.
+        :rtype: ds.Dataset
+        """
+
+        return ds.dataset(
+            self.data_dir_path,
+            format="parquet",
+            partitioning=ds.partitioning(PARTITIONING_SCHEMA, flavor="hive"),
+        )
+
+    @staticmethod
+    def build_filter(
+        sensor_ids: list[str] | None = None,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+    ) -> ds.Expression | None:
+        """
+        Erstellt den Filterausdruck für Sensoren und den Zeitraum [from_date, to_date).
+
+        :param sensor_ids: Sensor-IDs, die gelesen werden sollen (None = alle).
+        :type sensor_ids: list[str] | None
+        :param from_date: Beginn des Zeitraums (inklusive).
+        :type from_date: datetime | None
+        :param to_date: Ende des Zeitraums (exklusive).
+        :type to_date: datetime | None
+        :return: Filterausdruck oder None, wenn nicht gefiltert wird.
+        :rtype: ds.Expression | None
+        """
+
+        conditions: list[ds.Expression] = []
+        if sensor_ids is not None:
+            conditions.append(ds.field("sensor_partition").isin(sensor_ids))
+
+        year: ds.Expression = ds.field("year")
+        month: ds.Expression = ds.field("month")
+        if from_date is not None:
+            start: pd.Timestamp = _to_utc_timestamp(from_date)
+            conditions.append(
+                (year > start.year) | ((year == start.year) & (month >= start.month))
+            )
+            conditions.append(ds.field("timestamp") >= pa.scalar(start))
+        if to_date is not None:
+            end: pd.Timestamp = _to_utc_timestamp(to_date)
+            conditions.append(
+                (year < end.year) | ((year == end.year) & (month <= end.month))
+            )
+            conditions.append(ds.field("timestamp") < pa.scalar(end))
+
+        if not conditions:
+            return None
+        expression: ds.Expression = conditions[0]
+        for condition in conditions[1:]:
+            expression = expression & condition
+        return expression
+
+    def read_table(
+        self,
+        sensor_ids: list[str] | None = None,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+        columns: list[str] | None = None,
+    ) -> pa.Table:
+        """
+        Liest die Messwerte der Sensoren im Zeitraum [from_date, to_date) als Arrow-Tabelle.
+
+        :param sensor_ids: Sensor-IDs, die gelesen werden sollen (None = alle).
+        :type sensor_ids: list[str] | None
+        :param from_date: Beginn des Zeitraums (inklusive).
+        :type from_date: datetime | None
+        :param to_date: Ende des Zeitraums (exklusive).
+        :type to_date: datetime | None
+        :param columns: Zu lesende Spalten (None = alle Spalten der Dateien).
+        :type columns: list[str] | None
+        :return: Nach Sensor und Zeitstempel sortierte Tabelle.
+        :rtype: pa.Table
+        """
+
+        dataset: ds.Dataset = self.dataset()
+        if columns is None:
+            columns = [
+                name
+                for name in dataset.schema.names
+                if name not in PARTITIONING_SCHEMA.names
+            ]
+        table: pa.Table = dataset.to_table(
+            columns=columns, filter=self.build_filter(sensor_ids, from_date, to_date)
+        )
+        sort_keys: list = [
+            (name, "ascending")
+            for name in ("sensor_id", "timestamp")
+            if name in table.column_names
+        ]
+        if sort_keys:
+            table = table.take(pc.sort_indices(table, sort_keys=sort_keys))
+        return table
+
+    def read(
+        self,
+        sensor_ids: list[str] | None = None,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Liest die Messwerte der Sensoren im Zeitraum [from_date, to_date) als DataFrame.
+
+        :param sensor_ids: Sensor-IDs, die gelesen werden sollen (None = alle).
+        :type sensor_ids: list[str] | None
+        :param from_date: Beginn des Zeitraums (inklusive).
+        :type from_date: datetime | None
+        :param to_date: Ende des Zeitraums (exklusive).
+        :type to_date: datetime | None
+        :param columns: Zu lesende Spalten (None = alle Spalten der Dateien).
+        :type columns: list[str] | None
+        :return: Nach Sensor und Zeitstempel sortierter DataFrame.
+        :rtype: pd.DataFrame
+        """
+
+        return self.read_table(sensor_ids, from_date, to_date, columns).to_pandas()
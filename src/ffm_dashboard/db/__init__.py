@@ -1,15 +1,47 @@
 """Modul für Datenbank-Verbindung."""
 
+from src.ffm_dashboard.db.arrow_reader import read_arrow, read_dataframe
 from src.ffm_dashboard.db.db_con import DbCon
 from src.ffm_dashboard.db.entity.base import Base
 from src.ffm_dashboard.db.entity.sensor_data import SensorData
+from src.ffm_dashboard.db.entity.sensor_data_aggregate import (
+    SensorDataDaily,
+    SensorDataHourly,
+)
 from src.ffm_dashboard.db.entity.sensor_metadata import SensorMetadata
-from src.ffm_dashboard.db.sensor_data_db_service import SensorDataDbService
+from src.ffm_dashboard.db.fleet_ingestion_service import FleetIngestionService
+from src.ffm_dashboard.db.query_plan import QueryPlan, explain
+from src.ffm_dashboard.db.query_result_cache import QueryResultCache
+from src.ffm_dashboard.db.sensor_data_copy_loader import SensorDataCopyLoader
+from src.ffm_dashboard.db.sensor_data_db_service import (
+    DEFAULT_IMPORT_WORKERS,
+    SensorDataDbService,
+)
+from src.ffm_dashboard.db.sensor_key_cache import SensorKeyCache
+from src.ffm_dashboard.db.storage_policies import (
+    StoragePolicies,
+    StoragePolicyService,
+)
+from src.ffm_dashboard.db.write_result import WriteResult
 
 __all__: list[str] = [
+    "DEFAULT_IMPORT_WORKERS",
     "DbCon",
     "SensorDataDbService",
+    "FleetIngestionService",
+    "SensorDataCopyLoader",
+    "SensorKeyCache",
+    "QueryPlan",
+    "QueryResultCache",
+    "explain",
+    "read_arrow",
+    "read_dataframe",
+    "StoragePolicies",
+    "StoragePolicyService",
     "Base",
     "SensorData",
+    "SensorDataHourly",
+    "SensorDataDaily",
     "SensorMetadata",
+    "WriteResult",
 ]
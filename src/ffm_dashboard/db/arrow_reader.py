@@ -0,0 +1,108 @@
+"""Schneller Lesepfad: Abfrageergebnisse per COPY direkt als Arrow-Tabelle."""
+
+from datetime import datetime
+from io import BytesIO
+from typing import Final
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+from loguru import logger
+from sqlalchemy import Select
+from sqlalchemy.dialects import postgresql
+
+from src.ffm_dashboard.db.db_con import DbCon
+
+ARROW_TYPES: Final = {
+    bool: pa.bool_(),
+    int: pa.int64(),
+    float: pa.float64(),
+    str: pa.string(),
+    datetime: pa.timestamp("us", tz="UTC"),
+}
+"""Arrow-Typen der Spalten nach Python-Typ der SQLAlchemy-Spalte."""
+
+
+def _arrow_schema(statement: Select) -> dict[str, pa.DataType]:
+    """
+    Ermittelt die Arrow-Typen der ausgewählten Spalten. Spalten ohne bekannten
+    Typ werden von Arrow anhand der Werte bestimmt.
+
+    :param statement: Abfrage.
+    :type statement: Select
+    :return: Dictionary mit Spaltenname als Schlüssel und Arrow-Typ als Wert.
+    :rtype: dict[str, pa.DataType]
+    """
+
+    column_types: dict[str, pa.DataType] = {}
+    for column in statement.selected_columns:
+        try:
+            python_type: type = column.type.python_type
+        except NotImplementedError:
+            continue
+        if python_type in ARROW_TYPES:
+            column_types[column.name] = ARROW_TYPES[python_type]
+    return column_types
+
+
+def read_arrow(db_con: DbCon, statement: Select) -> pa.Table:
+    """
+    Führt eine SQLAlchemy-Abfrage als ``COPY (...) TO STDOUT (FORMAT csv)`` aus
+    und liest das Ergebnis mit dem parallelen CSV-Parser von Arrow direkt in
+    Spalten. Im Gegensatz zu ``pd.read_sql`` entstehen dabei keine
+    Python-Objekte je Zeile. Zeitstempel werden mit Zeitzone UTC gelesen.
+
+    :param db_con: Datenbankverbindung.
+    :type db_con: DbCon
+    :param statement: Auszuführende Abfrage.
+    :type statement: Select
+    :return: Ergebnis als Arrow-Tabelle mit den Spalten der Abfrage.
+    :rtype: pa.Table
+    """
+
+    compiled = statement.compile(dialect=postgresql.dialect())
+    buffer = BytesIO()
+    connection = db_con.engine.raw_connection()
+    try:
+        with connection.cursor() as cursor:
+            # COPY kennt keine gebundenen Parameter, psycopg2 setzt sie sicher ein
+            query: str = cursor.mogrify(str(compiled), compiled.params).decode()
+            cursor.execute("SET LOCAL DateStyle TO ISO")
+            cursor.copy_expert(
+                f"COPY ({query}) TO STDOUT WITH (FORMAT csv, HEADER)", buffer
+            )
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        connection.close()
+
+    # Dank HEADER enthält auch ein leeres Ergebnis die Spaltennamen
+    table: pa.Table = pa_csv.read_csv(
+        pa.BufferReader(buffer.getbuffer()),
+        convert_options=pa_csv.ConvertOptions(
+            column_types=_arrow_schema(statement),
+            strings_can_be_null=True,
+            quoted_strings_can_be_null=False,
+        ),
+    )
+    logger.debug("Read {} rows via COPY.", table.num_rows)
+    return table
+
+
+def read_dataframe(db_con: DbCon, statement: Select) -> pd.DataFrame:
+    """
+    Führt eine Abfrage über :func:`read_arrow` aus und gibt sie als DataFrame
+    zurück. Die Spaltentypen entsprechen denen von
+    ``pd.read_sql(..., parse_dates=["timestamp"])``.
+
+    :param db_con: Datenbankverbindung.
+    :type db_con: DbCon
+    :param statement: Auszuführende Abfrage.
+    :type statement: Select
+    :return: Ergebnis der Abfrage.
+    :rtype: pd.DataFrame
+    """
+
+    return read_arrow(db_con, statement).to_pandas(coerce_temporal_nanoseconds=True)
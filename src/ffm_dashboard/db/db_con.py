@@ -1,14 +1,35 @@
 """DB-Connection Klasse für Datenbankverbindung."""
 
+import threading
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Optional
+from typing import Any, Final, Optional
 
 import yaml
 from loguru import logger
 from sqlalchemy import Engine, create_engine
 from sqlalchemy.engine import URL
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm.session import Session, sessionmaker
 
+DEFAULT_POOL_SETTINGS: Final = {
+    "pool_size": 10,
+    "max_overflow": 10,
+    "pool_timeout": 30,
+    "pool_recycle": 1800,
+    "pool_pre_ping": True,
+}
+"""Standardeinstellungen des Verbindungspools (Abschnitt 'pool' in config.yaml)."""
+
+DEFAULT_STATEMENT_TIMEOUT_MS: Final = 0
+"""Standard-Zeitlimit einer Abfrage in Millisekunden (0 = ohne Limit)."""
+
+DEFAULT_ASYNC_DRIVER: Final = "asyncpg"
+"""Standardtreiber der asynchronen Engine."""
+
+ASYNC_DRIVERS: Final = ("asyncpg", "psycopg")
+"""Unterstützte Treiber der asynchronen Engine."""
+
 
 class DbCon:
     """
@@ -16,6 +37,12 @@ class DbCon:
     Diese Klasse ermöglicht das Erstellen von SQLAlchemy-Sessions sowie das Löschen aller Daten
     aus einer Tabelle.
 
+    Größe des Verbindungspools, Überlauf, Pre-Ping, Recycle-Zeit und das
+    Zeitlimit von Abfragen werden aus der Konfiguration gelesen; fehlende
+    Einträge erhalten die Standardwerte. Die asynchrone Engine wird erst beim
+    ersten Zugriff erstellt und benötigt den Treiber aus 'async_driver'
+    (asyncpg oder psycopg).
+
     :param db_name: Name der Datenbank
     :type db_name: Optional[str]
     :param user: Datenbank-Benutzername
@@ -50,11 +77,82 @@ class DbCon:
             port=config["port"],
         )
 
+        self.pool_settings: dict[str, Any] = DEFAULT_POOL_SETTINGS | (
+            config.get("pool") or {}
+        )
+        self.statement_timeout_ms: int = int(
+            config.get("statement_timeout_ms", DEFAULT_STATEMENT_TIMEOUT_MS)
+        )
+        self.async_driver: str = config.get("async_driver", DEFAULT_ASYNC_DRIVER)
+
         # Verbindung mit der Datenbank
-        self.engine: Engine = create_engine(url=self.db_url)
+        connect_args: dict[str, Any] = {}
+        if self.statement_timeout_ms > 0:
+            connect_args["options"] = (
+                f"-c statement_timeout={self.statement_timeout_ms}"
+            )
+        self.engine: Engine = create_engine(
+            url=self.db_url, connect_args=connect_args, **self.pool_settings
+        )
 
         self.session: Session = sessionmaker(self.engine)
 
+        self._async_engine: AsyncEngine | None = None
+        self._async_session: async_sessionmaker | None = None
+        self._async_lock = threading.Lock()
+
+    @property
+    def async_engine(self) -> AsyncEngine:
+        """
+        Asynchrone Engine mit denselben Pool-Einstellungen wie die synchrone.
+        Wird beim ersten Zugriff erstellt.
+
+        :raises ValueError: Wenn der konfigurierte Treiber nicht unterstützt wird.
+        :raises ImportError: Wenn der konfigurierte Treiber nicht installiert ist.
+        """
+
+        with self._async_lock:
+            if self._async_engine is None:
+                self._async_engine = self._create_async_engine()
+            return self._async_engine
+
+    def _create_async_engine(self) -> AsyncEngine:
+        """
+        Erstellt die asynchrone Engine für den konfigurierten Treiber.
+
+        :return: Asynchrone Engine.
+        :rtype: sqlalchemy.ext.asyncio.AsyncEngine
+        """
+
+        if self.async_driver not in ASYNC_DRIVERS:
+            raise ValueError(
+                f"Unsupported async driver '{self.async_driver}', "
+                f"expected one of {ASYNC_DRIVERS}"
+            )
+        if find_spec(self.async_driver) is None:
+            logger.error("Async driver '{}' is not installed", self.async_driver)
+            raise ImportError(
+                f"Async driver '{self.async_driver}' is not installed "
+                f"(uv add {self.async_driver})"
+            )
+
+        # asyncpg kennt keine libpq-Optionen, das Zeitlimit wird direkt gesetzt
+        connect_args: dict[str, Any] = {}
+        if self.statement_timeout_ms > 0 and self.async_driver == "asyncpg":
+            connect_args["server_settings"] = {
+                "statement_timeout": str(self.statement_timeout_ms)
+            }
+        elif self.statement_timeout_ms > 0:
+            connect_args["options"] = (
+                f"-c statement_timeout={self.statement_timeout_ms}"
+            )
+
+        return create_async_engine(
+            self.db_url.set(drivername=f"postgresql+{self.async_driver}"),
+            connect_args=connect_args,
+            **self.pool_settings,
+        )
+
     def get_session(self) -> sessionmaker:
         """
         Gibt ein SQLAlchemy-Sessionmaker-Objekt zurück, das für Transaktionen
@@ -67,6 +165,21 @@ class DbCon:
 
         return self.session
 
+    def get_async_session(self) -> async_sessionmaker:
+        """
+        Gibt ein Sessionmaker-Objekt für asynchrone Sessions zurück.
+        Muss mit zwei Klammern aufgerufen werden: ``async with get_async_session()() as session``
+
+        :return: Sessionmaker-Objekt zur Erstellung von asynchronen Sessions.
+        :rtype: sqlalchemy.ext.asyncio.async_sessionmaker
+        """
+
+        engine: AsyncEngine = self.async_engine
+        with self._async_lock:
+            if self._async_session is None:
+                self._async_session = async_sessionmaker(engine, expire_on_commit=False)
+            return self._async_session
+
     def delete_all_data_from_table(self, table) -> None:
         """
         Löscht alle Einträge aus der angegebenen Tabelle und bestätigt die Transaktion.
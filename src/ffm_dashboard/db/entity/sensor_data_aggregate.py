@@ -0,0 +1,66 @@
+"""Entity-Klassen für die stündlich und täglich aggregierten Sensordaten."""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.ffm_dashboard.db import Base
+
+
+class SensorDataHourly(Base):
+    """
+    Entity-Klasse für das Continuous Aggregate 'sensor_data_hourly'.
+
+    Enthält je Sensor und Stunde Mittel-, Minimal- und Maximalwert sowie die
+    Anzahl der Messwerte. Wird von TimescaleDB befüllt und nur gelesen.
+    """
+
+    __tablename__: Any = "sensor_data_hourly"
+
+    timestamp: Mapped[datetime] = mapped_column(primary_key=True)
+    """Beginn der Stunde."""
+
+    sensor_key: Mapped[int] = mapped_column(primary_key=True)
+    """Schlüssel des Sensors (siehe SensorMetadata.sensor_key)."""
+
+    measurement: Mapped[float]
+    """Mittelwert der Messwerte."""
+
+    min_measurement: Mapped[float]
+    """Kleinster Messwert."""
+
+    max_measurement: Mapped[float]
+    """Größter Messwert."""
+
+    num_measurements: Mapped[int]
+    """Anzahl der Messwerte."""
+
+
+class SensorDataDaily(Base):
+    """
+    Entity-Klasse für das Continuous Aggregate 'sensor_data_daily'.
+
+    Enthält je Sensor und Tag Mittel-, Minimal- und Maximalwert sowie die
+    Anzahl der Messwerte. Wird von TimescaleDB befüllt und nur gelesen.
+    """
+
+    __tablename__: Any = "sensor_data_daily"
+
+    timestamp: Mapped[datetime] = mapped_column(primary_key=True)
+    """Beginn des Tages (UTC)."""
+
+    sensor_key: Mapped[int] = mapped_column(primary_key=True)
+    """Schlüssel des Sensors (siehe SensorMetadata.sensor_key)."""
+
+    measurement: Mapped[float]
+    """Mittelwert der Messwerte."""
+
+    min_measurement: Mapped[float]
+    """Kleinster Messwert."""
+
+    max_measurement: Mapped[float]
+    """Größter Messwert."""
+
+    num_measurements: Mapped[int]
+    """Anzahl der Messwerte."""
@@ -2,6 +2,7 @@
 
 from typing import Any
 
+from sqlalchemy import Identity
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.ffm_dashboard.db import Base
@@ -15,6 +16,12 @@ class SensorMetadata(Base):
     sensor_id: Mapped[str] = mapped_column(nullable=False, primary_key=True)
     """ID des Sensors."""
 
+    sensor_key: Mapped[int] = mapped_column(Identity(), unique=True, init=False)
+    """Kompakter Schlüssel des Sensors, auf den die Messwerte verweisen."""
+
+    box_id: Mapped[str | None]
+    """ID der Sensebox."""
+
     unit: Mapped[str]
     """Einheit des Messwerts."""
 
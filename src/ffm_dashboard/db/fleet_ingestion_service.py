@@ -0,0 +1,174 @@
+"""Klasse für die Aufnahme der Sensordaten mehrerer SenseBoxen in die Datenbank."""
+
+from collections.abc import Iterator
+from pathlib import Path
+from timeit import default_timer as timer
+
+import pandas as pd
+from loguru import logger
+
+from src.ffm_dashboard.components import DEFAULT_BACKFILL_WORKERS
+from src.ffm_dashboard.components.sense_box_fleet import SenseBoxFleet
+from src.ffm_dashboard.db import DbCon
+from src.ffm_dashboard.db.query_result_cache import QueryResultCache
+from src.ffm_dashboard.db.sensor_data_db_service import (
+    DEFAULT_IMPORT_WORKERS,
+    SensorDataQueryService,
+    SensorDataWriteService,
+)
+from src.ffm_dashboard.db.sensor_key_cache import SensorKeyCache
+from src.ffm_dashboard.db.write_result import WriteResult
+
+
+class FleetIngestionService:
+    """
+    Schreibt Metadaten, aktuelle und historische Messwerte aller Boxen einer
+    :class:`SenseBoxFleet` in die Datenbank.
+
+    Die Abfragen laufen für alle Boxen parallel; die Ergebnisse einer Box werden
+    geschrieben, sobald sie vorliegen, jeweils gebündelt in einer Transaktion.
+    Abfragen und Schreiben überlappen sich dadurch.
+
+    :param db_con: Datenbankverbindung.
+    :type db_con: DbCon
+    :param fleet: Die abzufragenden SenseBoxen.
+    :type fleet: SenseBoxFleet
+    :param query_cache: Cache der Abfrageergebnisse des Dashboards, dessen
+                        betroffene Einträge nach dem Schreiben entfernt werden.
+    :type query_cache: QueryResultCache | None
+    """
+
+    def __init__(
+        self,
+        db_con: DbCon,
+        fleet: SenseBoxFleet,
+        query_cache: QueryResultCache | None = None,
+    ) -> None:
+        self.db_con = db_con
+        self.fleet = fleet
+
+        self.sensor_key_cache = SensorKeyCache(db_con)
+        self.write_services: dict[str, SensorDataWriteService] = {
+            box_id: SensorDataWriteService(
+                db_con, box_id, self.sensor_key_cache, query_cache
+            )
+            for box_id in fleet.box_ids
+        }
+        self.query_service = SensorDataQueryService(
+            db_con, fleet.box_ids[0], query_cache
+        )
+        self._sensors_info: pd.DataFrame | None = None
+
+    def _get_sensors_info(self) -> pd.DataFrame:
+        """
+        Gibt die Sensor-Metadaten aller Boxen zurück (einmalig von der API geladen).
+
+        :return: DataFrame mit den Sensor-Metadaten und der Spalte 'box_id'.
+        :rtype: pd.DataFrame
+        """
+
+        if self._sensors_info is None:
+            self._sensors_info = self.fleet.fetch_sensors_information()
+        return self._sensors_info
+
+    def write_sensor_metadata(self) -> int:
+        """
+        Schreibt die Metadaten aller noch nicht bekannten Sensoren der Boxen.
+
+        :return: Anzahl neu geschriebener Sensoren.
+        :rtype: int
+        """
+
+        write_service: SensorDataWriteService = next(iter(self.write_services.values()))
+        return write_service.write_sensors_metadata(self._get_sensors_info())
+
+    def _write_all(self, data_frames: Iterator[pd.DataFrame]) -> WriteResult | None:
+        """
+        Validiert und schreibt die DataFrames der Boxen gebündelt, sobald sie vorliegen.
+
+        :param data_frames: Iterator über die Messwerte je Box.
+        :type data_frames: Iterator[pd.DataFrame]
+        :return: Summe der Schreibergebnisse oder None, falls keine Box Daten
+                 geliefert hat.
+        :rtype: WriteResult | None
+        """
+
+        start = timer()
+        result: WriteResult | None = None
+        for data in data_frames:
+            write_service: SensorDataWriteService = self.write_services[
+                data["box_id"].iloc[0]
+            ]
+            result = (result or WriteResult()) + write_service.write_new_sensor_data(
+                data
+            )
+        logger.info(
+            "Wrote {} readings of {} boxes. Took {:.1f}s.",
+            result.inserted if result else 0,
+            len(self.fleet.box_ids),
+            timer() - start,
+        )
+        return result
+
+    def write_new_sensor_data(self) -> WriteResult | None:
+        """
+        Holt die aktuellsten Messwerte aller Boxen und schreibt sie in die Datenbank.
+
+        :return: Anzahl geschriebener, übersprungener und ungültiger Datensätze oder
+                 None, falls keine Box Daten geliefert hat.
+        :rtype: WriteResult | None
+        """
+
+        return self._write_all(self.fleet.iter_new_sensor_data())
+
+    def sync_missing_sensor_data(self) -> WriteResult:
+        """
+        Inkrementeller Catch-Up für alle Boxen: lädt je Sensor nur die Messwerte
+        ab dem letzten gespeicherten Zeitstempel und schreibt sie in die Datenbank.
+
+        :return: Anzahl geschriebener, übersprungener und ungültiger Datensätze.
+        :rtype: WriteResult
+        """
+
+        sensors_info: pd.DataFrame = self._get_sensors_info()
+        if sensors_info.empty:
+            return WriteResult()
+        last_timestamps: dict[str, dict] = {
+            box_id: self.query_service.query_latest_timestamps(
+                box_id, list(box_sensors["sensor_id"])
+            )
+            for box_id, box_sensors in sensors_info.groupby("box_id")
+        }
+        return (
+            self._write_all(self.fleet.iter_missing_sensor_data(last_timestamps))
+            or WriteResult()
+        )
+
+    def load_historical_data(
+        self,
+        data_dir_path: Path,
+        max_workers_per_box: int = DEFAULT_BACKFILL_WORKERS,
+        retry_failed: bool = False,
+        import_workers: int = DEFAULT_IMPORT_WORKERS,
+    ) -> None:
+        """
+        Lädt die historischen Daten aller Boxen nach ``data_dir_path/<box_id>``
+        und importiert sie anschließend per Bulk-Insert in die Datenbank.
+
+        :param data_dir_path: Verzeichnis der historischen Parquet-Daten.
+        :type data_dir_path: pathlib.Path
+        :param max_workers_per_box: Maximale Anzahl gleichzeitiger Abfragen pro Box.
+        :type max_workers_per_box: int
+        :param retry_failed: Nur leere oder fehlgeschlagene Fenster erneut abfragen.
+        :type retry_failed: bool
+        :param import_workers: Maximale Anzahl gleichzeitig importierter Partitionen
+                               pro Box.
+        :type import_workers: int
+        """
+
+        for box_id in self.fleet.fetch_all_historical_data(
+            data_dir_path, max_workers_per_box, retry_failed
+        ):
+            self.write_services[box_id].bulk_write_sensor_data_to_db(
+                data_dir_path / box_id, import_workers
+            )
@@ -0,0 +1,112 @@
+"""Auswertung von Ausführungsplänen (EXPLAIN) der Datenbankabfragen."""
+
+from dataclasses import dataclass, field
+from typing import Final, Iterator
+
+from sqlalchemy import Executable
+from sqlalchemy.dialects import postgresql
+
+from src.ffm_dashboard.db import DbCon
+
+CHUNK_PREFIX: Final = "_hyper_"
+"""Namenspräfix der Chunk-Tabellen von TimescaleDB-Hypertables."""
+
+
+@dataclass
+class QueryPlan:
+    """
+    Ausführungsplan einer Abfrage im JSON-Format von ``EXPLAIN``.
+
+    :param plan: Wurzelknoten des Plans ("Plan" aus ``EXPLAIN (FORMAT JSON)``).
+    :type plan: dict
+    :param statement: SQL der untersuchten Abfrage.
+    :type statement: str
+    """
+
+    plan: dict
+    statement: str = field(default="", repr=False)
+
+    def nodes(self) -> Iterator[dict]:
+        """
+        Durchläuft alle Knoten des Plans (Tiefensuche).
+
+        :return: Iterator über die Planknoten.
+        :rtype: Iterator[dict]
+        """
+
+        stack: list[dict] = [self.plan]
+        while stack:
+            node: dict = stack.pop()
+            yield node
+            stack.extend(reversed(node.get("Plans", [])))
+
+    @property
+    def relations(self) -> list[str]:
+        """Gelesene Tabellen bzw. Chunks."""
+        return [
+            node["Relation Name"] for node in self.nodes() if "Relation Name" in node
+        ]
+
+    @property
+    def indexes(self) -> list[str]:
+        """Genutzte Indizes."""
+        return [node["Index Name"] for node in self.nodes() if "Index Name" in node]
+
+    @property
+    def index_conditions(self) -> list[str]:
+        """Bedingungen, die über einen Index ausgewertet werden."""
+        return [node["Index Cond"] for node in self.nodes() if "Index Cond" in node]
+
+    @property
+    def chunks(self) -> list[str]:
+        """Gelesene Chunks einer Hypertable (nach Chunk-Ausschluss)."""
+        return [
+            relation for relation in self.relations if relation.startswith(CHUNK_PREFIX)
+        ]
+
+    @property
+    def chunks_excluded_at_startup(self) -> int:
+        """Zur Laufzeit ausgeschlossene Chunks (ChunkAppend, gebundene Parameter)."""
+        return sum(
+            node.get("Chunks excluded during startup", 0) for node in self.nodes()
+        )
+
+    def has_seq_scan(self, relation_prefix: str) -> bool:
+        """
+        Prüft, ob eine Tabelle (oder ihre Chunks) sequenziell gelesen wird.
+
+        :param relation_prefix: Name bzw. Präfix der Tabelle.
+        :type relation_prefix: str
+        :return: True, wenn ein passender Seq Scan im Plan vorkommt.
+        :rtype: bool
+        """
+
+        return any(
+            node["Node Type"] == "Seq Scan"
+            and node.get("Relation Name", "").startswith(relation_prefix)
+            for node in self.nodes()
+        )
+
+
+def explain(db_con: DbCon, statement: Executable, analyze: bool = False) -> QueryPlan:
+    """
+    Ermittelt den Ausführungsplan einer SQLAlchemy-Abfrage. Die Parameter bleiben
+    gebunden, der Plan entspricht also dem der Anwendung.
+
+    :param db_con: Datenbankverbindung.
+    :type db_con: DbCon
+    :param statement: Zu untersuchende Abfrage.
+    :type statement: sqlalchemy.Executable
+    :param analyze: Abfrage zusätzlich ausführen (``EXPLAIN ANALYZE``).
+    :type analyze: bool
+    :return: Ausführungsplan der Abfrage.
+    :rtype: QueryPlan
+    """
+
+    compiled = statement.compile(dialect=postgresql.dialect())
+    options: str = "FORMAT JSON, ANALYZE" if analyze else "FORMAT JSON"
+    with db_con.engine.connect() as connection:
+        result: list[dict] = connection.exec_driver_sql(
+            f"EXPLAIN ({options}) {compiled}", compiled.params
+        ).scalar_one()
+    return QueryPlan(result[0]["Plan"], str(compiled))
@@ -0,0 +1,151 @@
+"""Zwischenspeicher für Abfrageergebnisse der Sensordaten."""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from time import monotonic
+from typing import Any, Final
+
+DEFAULT_CACHE_MAX_ENTRIES: Final = 256
+"""Standardanzahl gespeicherter Abfrageergebnisse."""
+
+DEFAULT_CACHE_TTL_SECONDS: Final = 300.0
+"""Standard-Lebensdauer eines Ergebnisses, dessen Zeitraum noch nicht abgeschlossen ist."""
+
+
+@dataclass
+class _CacheEntry:
+    """
+    Eintrag im Zwischenspeicher.
+
+    - value: Das gespeicherte Ergebnis
+    - range_end: Ende (exklusive) des abgefragten Zeitraums, None ohne Zeitbezug
+    - expires_at: Ablaufzeitpunkt (``time.monotonic``), None für abgeschlossene Zeiträume
+    """
+
+    value: Any
+    range_end: datetime | None
+    expires_at: float | None
+
+
+class QueryResultCache:
+    """
+    Thread-sicherer LRU-Cache mit TTL für Abfrageergebnisse.
+
+    Ergebnisse abgeschlossener Zeiträume (Ende in der Vergangenheit) ändern sich
+    nicht mehr und verfallen nur durch die LRU-Verdrängung. Ergebnisse, deren
+    Zeitraum noch läuft, und Ergebnisse ohne Zeitbezug verfallen nach ``ttl``.
+    Nach dem Schreiben neuer Messwerte werden mit :meth:`invalidate` gezielt die
+    Einträge entfernt, deren Zeitraum die neuen Zeitstempel enthält.
+
+    Der Cache gilt nur innerhalb eines Prozesses; Schreibvorgänge anderer
+    Prozesse werden erst nach Ablauf der TTL sichtbar.
+
+    :param max_entries: Maximale Anzahl gespeicherter Ergebnisse.
+    :type max_entries: int
+    :param ttl: Lebensdauer nicht abgeschlossener Ergebnisse in Sekunden.
+    :type ttl: float
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        ttl: float = DEFAULT_CACHE_TTL_SECONDS,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits: int = 0
+        self.misses: int = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        """
+        Gibt ein gespeichertes Ergebnis zurück.
+
+        :param key: Schlüssel des Ergebnisses.
+        :type key: Hashable
+        :return: Das Ergebnis oder None, wenn es fehlt oder abgelaufen ist.
+        :rtype: Any | None
+        """
+
+        with self._lock:
+            entry: _CacheEntry | None = self._entries.get(key)
+            if entry is not None and (
+                entry.expires_at is None or entry.expires_at > monotonic()
+            ):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.value
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, value: Any, range_end: datetime | None = None) -> None:
+        """
+        Speichert ein Ergebnis und verdrängt bei Bedarf das am längsten nicht
+        genutzte Ergebnis.
+
+        :param key: Schlüssel des Ergebnisses.
+        :type key: Hashable
+        :param value: Das Ergebnis.
+        :type value: Any
+        :param range_end: Ende (exklusive) des abgefragten Zeitraums (mit
+                          Zeitzone), None bei Ergebnissen ohne Zeitbezug.
+        :type range_end: datetime | None
+        """
+
+        is_closed: bool = range_end is not None and range_end <= datetime.now(
+            timezone.utc
+        )
+        entry = _CacheEntry(
+            value, range_end, None if is_closed else monotonic() + self.ttl
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, since: datetime | None = None) -> int:
+        """
+        Entfernt die Ergebnisse, deren Zeitraum nach ``since`` endet, also neue
+        Messwerte ab ``since`` enthalten könnte. Ergebnisse ohne Zeitbezug
+        bleiben erhalten.
+
+        :param since: Frühester neu geschriebener Zeitstempel (mit Zeitzone);
+                      None entfernt alle Ergebnisse mit Zeitbezug.
+        :type since: datetime | None
+        :return: Anzahl entfernter Ergebnisse.
+        :rtype: int
+        """
+
+        with self._lock:
+            stale_keys: list[Hashable] = [
+                key
+                for key, entry in self._entries.items()
+                if entry.range_end is not None
+                and (since is None or entry.range_end > since)
+            ]
+            for key in stale_keys:
+                del self._entries[key]
+        return len(stale_keys)
+
+    def pop(self, key: Hashable) -> None:
+        """
+        Entfernt ein einzelnes Ergebnis.
+
+        :param key: Schlüssel des Ergebnisses.
+        :type key: Hashable
+        """
+
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        """Anzahl gespeicherter Ergebnisse."""
+
+        return len(self._entries)
@@ -0,0 +1,149 @@
+"""Massenimport historischer Parquet-Daten über ``COPY ... FROM STDIN``."""
+
+from pathlib import Path
+from typing import Final
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from loguru import logger
+
+from src.ffm_dashboard.datalake import SENSOR_DATA_SCHEMA
+from src.ffm_dashboard.db import DbCon, SensorData
+from src.ffm_dashboard.db.sensor_key_cache import SensorKeyCache
+from src.ffm_dashboard.db.write_result import WriteResult
+from src.ffm_dashboard.utils import SensorDataValidationResult, validate_sensor_data
+
+STAGING_TABLE_NAME: Final = "sensor_data_staging"
+"""Name der temporären Staging-Tabelle (existiert nur bis zum Ende der Transaktion)."""
+
+COPY_COLUMNS: Final = [column.name for column in SensorData.__table__.columns]
+"""Spalten der Tabelle 'sensor_data', die per COPY in die Staging-Tabelle geschrieben werden."""
+
+
+class SensorDataCopyLoader:
+    """
+    Lädt Parquet-Dateien mit ``COPY ... FROM STDIN`` in die Tabelle 'sensor_data'.
+
+    Die Row-Groups einer Datei werden nacheinander gelesen, mit
+    :func:`validate_sensor_data` geprüft, die Sensor-IDs auf ihre Schlüssel
+    abgebildet und als CSV in eine temporäre Staging-Tabelle kopiert; es liegt
+    also immer nur eine Row-Group im Speicher. Anschließend werden die Daten mit
+    ``INSERT ... SELECT ... ON CONFLICT DO NOTHING`` übernommen. Eine Datei wird
+    in einer Transaktion geladen, ein erneuter Import derselben Datei schreibt
+    keine Duplikate.
+
+    :param db_con: Datenbankverbindung.
+    :type db_con: DbCon
+    :param sensor_key_cache: Cache der Sensor-Schlüssel.
+    :type sensor_key_cache: SensorKeyCache
+    """
+
+    def __init__(self, db_con: DbCon, sensor_key_cache: SensorKeyCache) -> None:
+        self.db_con = db_con
+        self.sensor_key_cache = sensor_key_cache
+
+    @staticmethod
+    def to_csv_buffer(table: pa.Table, sensor_keys: dict[str, int]) -> pa.Buffer:
+        """
+        Schreibt die Spalten ``COPY_COLUMNS`` als CSV ohne Kopfzeile für
+        ``COPY ... FORMAT csv``. Die Sensor-IDs werden durch ihre Schlüssel
+        ersetzt, Zeitstempel auf Mikrosekunden (Auflösung von TIMESTAMPTZ) gekürzt.
+
+        :param table: Arrow-Tabelle mit den Spalten der Parquet-Dateien.
+        :type table: pa.Table
+        :param sensor_keys: sensor_key je Sensor-ID der Tabelle.
+        :type sensor_keys: dict[str, int]
+        :return: CSV-Daten.
+        :rtype: pa.Buffer
+        """
+
+        sensor_key: pa.Array = pc.take(
+            pa.array(list(sensor_keys.values()), pa.int32()),
+            pc.index_in(table["sensor_id"], value_set=pa.array(list(sensor_keys))),
+        )
+        copy_table = pa.table(
+            {
+                "timestamp": pc.cast(table["timestamp"], pa.timestamp("us", tz="UTC")),
+                "measurement": table["measurement"],
+                "sensor_key": sensor_key,
+            }
+        ).select(COPY_COLUMNS)
+        sink = pa.BufferOutputStream()
+        pa_csv.write_csv(copy_table, sink, pa_csv.WriteOptions(include_header=False))
+        return sink.getvalue()
+
+    def load_file(self, file_path: Path) -> WriteResult:
+        """
+        Lädt eine Parquet-Datei über die Staging-Tabelle in die Datenbank.
+
+        :param file_path: Pfad der Parquet-Datei.
+        :type file_path: pathlib.Path
+        :return: Anzahl geschriebener, übersprungener und ungültiger Datensätze.
+        :rtype: WriteResult
+        """
+
+        columns: str = ", ".join(COPY_COLUMNS)
+        parquet_file = pq.ParquetFile(file_path)
+        staged_count: int = 0
+        invalid_count: int = 0
+
+        connection = self.db_con.engine.raw_connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"CREATE TEMP TABLE {STAGING_TABLE_NAME} "
+                    f"(LIKE {SensorData.__tablename__} INCLUDING DEFAULTS) "
+                    "ON COMMIT DROP"
+                )
+                for i in range(parquet_file.num_row_groups):
+                    table: pa.Table = parquet_file.read_row_group(
+                        i, columns=SENSOR_DATA_SCHEMA.names
+                    )
+                    validation: SensorDataValidationResult = validate_sensor_data(
+                        table.to_pandas(types_mapper=pd.ArrowDtype)
+                    )
+                    if validation.invalid_count:
+                        logger.warning(
+                            "Skipping {} invalid rows in '{}': {}",
+                            validation.invalid_count,
+                            file_path.name,
+                            validation.rejection_summary(),
+                        )
+                    invalid_count += validation.invalid_count
+                    valid_table: pa.Table = table.filter(pa.array(validation.mask))
+                    if valid_table.num_rows == 0:
+                        continue
+                    sensor_keys: dict[str, int] = self.sensor_key_cache.get_sensor_keys(
+                        validation.data.drop_duplicates("sensor_id")
+                    )
+                    cursor.copy_expert(
+                        f"COPY {STAGING_TABLE_NAME} ({columns}) "
+                        "FROM STDIN WITH (FORMAT csv)",
+                        pa.BufferReader(self.to_csv_buffer(valid_table, sensor_keys)),
+                    )
+                    staged_count += valid_table.num_rows
+                cursor.execute(
+                    f"INSERT INTO {SensorData.__tablename__} ({columns}) "
+                    f"SELECT {columns} FROM {STAGING_TABLE_NAME} "
+                    "ON CONFLICT (sensor_key, timestamp) DO NOTHING"
+                )
+                insert_count: int = cursor.rowcount
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+
+        result = WriteResult(insert_count, staged_count - insert_count, invalid_count)
+        logger.debug(
+            "Copied '{}': {} new, {} already existing, {} invalid rows.",
+            file_path.name,
+            result.inserted,
+            result.skipped,
+            result.invalid,
+        )
+        return result
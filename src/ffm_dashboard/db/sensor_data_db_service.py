@@ -1,23 +1,157 @@
 """Klasse für das Schreiben und Lesen der Sensordaten."""
 
-import os
-from datetime import date
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from timeit import default_timer as timer
-from typing import Dict, Final
+from typing import Dict, Final, Iterator
 
 import pandas as pd
+import polars as pl
+import pyarrow as pa
 from loguru import logger
-from pandantic import Pandantic
-from pydantic import ValidationError
-from sqlalchemy import Date, cast, func, select, text
+from sqlalchemy import (
+    Integer,
+    Result,
+    Select,
+    any_,
+    bindparam,
+    func,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
 
-from src.ffm_dashboard.components import SenseBoxApi
-from src.ffm_dashboard.db import DbCon, SensorData, SensorMetadata
+from src.ffm_dashboard.components import BackfillCheckpoint, SenseBoxApi
+from src.ffm_dashboard.db import (
+    DbCon,
+    SensorData,
+    SensorDataDaily,
+    SensorDataHourly,
+    SensorMetadata,
+)
+from src.ffm_dashboard.db.arrow_reader import read_arrow, read_dataframe
+from src.ffm_dashboard.db.query_result_cache import QueryResultCache
+from src.ffm_dashboard.db.sensor_data_copy_loader import SensorDataCopyLoader
+from src.ffm_dashboard.db.sensor_key_cache import SensorKeyCache
+from src.ffm_dashboard.db.write_result import WriteResult
 from src.ffm_dashboard.plots import PlotData
-from src.ffm_dashboard.utils import SensorDataModel
+from src.ffm_dashboard.utils import (
+    DEFAULT_MAX_PLOT_POINTS,
+    DownsamplingMethod,
+    SensorDataValidationResult,
+    downsample,
+    use_polars,
+    validate_sensor_data,
+)
+
+DEFAULT_IMPORT_WORKERS: Final = 4
+"""Standardanzahl gleichzeitig importierter Sensor-Partitionen (je eine Verbindung)."""
+
+DEFAULT_WRITE_BATCH_SIZE: Final = 1000
+"""Anzahl Zeilen pro INSERT-Statement beim gebündelten Schreiben."""
+
+SENSOR_DATA_COLUMNS: Final = [column.name for column in SensorData.__table__.columns]
+"""Spalten der Tabelle 'sensor_data'."""
+
+SENSORS_METADATA_CACHE_KEY: Final = "sensors_metadata"
+"""Schlüssel der Sensor-Metadaten im QueryResultCache."""
+
+DEFAULT_STREAM_CHUNK_SIZE: Final = 100_000
+"""Anzahl Zeilen je Chunk beim Streamen von Sensordaten."""
+
+PLOT_TIMEZONE: Final = "Europe/Berlin"
+"""Zeitzone der Plots, in der auch die Tagesgrenzen der Zeiträume liegen."""
+
+PLOT_SOURCES: Final = [
+    (SensorData, pd.Timedelta(minutes=3)),
+    (SensorDataHourly, pd.Timedelta(hours=1)),
+    (SensorDataDaily, pd.Timedelta(days=1)),
+]
+"""Datenquellen der Plots mit dem Abstand ihrer Werte, von fein nach grob."""
+
+PLOT_OVERSAMPLING: Final = 4
+"""Faktor, um den eine Datenquelle mehr Werte als das Punktbudget liefern darf."""
+
+
+def _select_sensor_data_with_metadata() -> Select:
+    """
+    Erstellt die Abfrage der Messwerte mit Box-ID, Sensor-ID und den
+    beschreibenden Feldern ihres Sensors (wie die View 'sensor_data_view').
+
+    :return: SELECT über 'sensor_data' mit Join auf 'sensor_metadata'.
+    :rtype: Select
+    """
+
+    return select(
+        SensorData.timestamp,
+        SensorMetadata.box_id,
+        SensorMetadata.sensor_id,
+        SensorData.measurement,
+        SensorMetadata.unit,
+        SensorMetadata.sensor_type,
+        SensorMetadata.icon,
+        SensorMetadata.title,
+    ).join(SensorMetadata, SensorMetadata.sensor_key == SensorData.sensor_key)
+
+
+STREAM_COLUMNS: Final = [
+    column.name for column in _select_sensor_data_with_metadata().selected_columns
+]
+"""Spalten der Sensordaten mit Metadaten, die beim Streamen ausgewählt werden können."""
+
+
+def _project_columns(query: Select, columns: list[str] | None) -> Select:
+    """
+    Beschränkt eine Abfrage aus ``_select_sensor_data_with_metadata`` auf die
+    angegebenen Spalten. Join und Filter bleiben erhalten.
+
+    :param query: Abfrage der Messwerte mit Metadaten.
+    :type query: Select
+    :param columns: Auszuwählende Spalten aus ``STREAM_COLUMNS``; None wählt alle.
+    :type columns: list[str] | None
+    :return: Abfrage mit den ausgewählten Spalten in der angegebenen Reihenfolge.
+    :rtype: Select
+    :raises ValueError: Bei unbekannten oder fehlenden Spalten.
+    """
+
+    if columns is None:
+        return query
+    unknown: list[str] = [column for column in columns if column not in STREAM_COLUMNS]
+    if unknown or not columns:
+        raise ValueError(
+            f"Invalid columns {unknown}, expected some of {STREAM_COLUMNS}"
+        )
+    selected: dict = {column.name: column for column in query.selected_columns}
+    return query.with_only_columns(
+        *[selected[column] for column in columns], maintain_column_froms=True
+    )
+
+
+def day_range(
+    from_date: date, to_date: date, tz: str = PLOT_TIMEZONE
+) -> tuple[pd.Timestamp, pd.Timestamp]:
+    """
+    Wandelt einen Datumsbereich in einen halboffenen Zeitraum
+    ``[from_date 00:00, to_date + 1 Tag 00:00)`` um. Im Gegensatz zu einem Cast
+    der Spalte auf ``date`` kann PostgreSQL damit den Index
+    ``(sensor_key, timestamp)`` nutzen und TimescaleDB nicht betroffene Chunks
+    ausschließen.
+
+    :param from_date: Erster Tag des Zeitraums (inklusive).
+    :type from_date: date
+    :param to_date: Letzter Tag des Zeitraums (inklusive).
+    :type to_date: date
+    :param tz: Zeitzone der Tagesgrenzen.
+    :type tz: str
+    :return: Tupel aus Beginn (inklusive) und Ende (exklusive).
+    :rtype: tuple[pd.Timestamp, pd.Timestamp]
+    """
+
+    start = pd.Timestamp(pd.Timestamp(from_date).date(), tz=tz)
+    end = pd.Timestamp(pd.Timestamp(to_date).date() + timedelta(days=1), tz=tz)
+    return start, end
 
 
 class SensorDataWriteService:
@@ -30,131 +164,272 @@ class SensorDataWriteService:
     :type db_con: DbCon
     :param box_id: ID der SenseBox, zu der die Sensordaten gehören.
     :type box_id: str
+    :param sensor_key_cache: Gemeinsamer Cache der Sensor-Schlüssel; ohne Angabe
+                             wird ein eigener erstellt.
+    :type sensor_key_cache: SensorKeyCache | None
+    :param query_cache: Cache der Abfrageergebnisse, dessen betroffene Einträge
+                        nach dem Schreiben entfernt werden.
+    :type query_cache: QueryResultCache | None
     """
 
-    def __init__(self, db_con: DbCon, box_id: str) -> None:
+    def __init__(
+        self,
+        db_con: DbCon,
+        box_id: str,
+        sensor_key_cache: SensorKeyCache | None = None,
+        query_cache: QueryResultCache | None = None,
+    ) -> None:
         self.db_con = db_con
         self.box_id = box_id
+        self.sensor_key_cache = sensor_key_cache or SensorKeyCache(db_con)
+        self.query_cache = query_cache
 
-    @staticmethod
-    def exists_sensor_data_point(
-        sensor_data_point: SensorData, session: Session
-    ) -> bool:
+    def write_new_sensor_data(
+        self, data: pd.DataFrame, batch_size: int = DEFAULT_WRITE_BATCH_SIZE
+    ) -> WriteResult:
         """
-        Prüft, ob ein Sensordatenpunkt mit gleichem Zeitstempel, SensorID und BoxID
-        bereits existiert.
+        Validiert neue Sensordaten spaltenweise (:func:`validate_sensor_data`) und
+        schreibt sie gebündelt in die Datenbank. Bereits vorhandene Datenpunkte
+        werden übersprungen.
 
-        :param sensor_data_point: Zu prüfender Datenpunkt.
-        :type sensor_data_point: SensorData
-        :param session: Aktive SQLAlchemy-Session.
-        :type session: Session
-        :return: True, wenn der Datensatz bereits existiert, sonst False.
-        :rtype: bool
+        :param data: DataFrame mit den Sensordaten.
+        :type data: pd.DataFrame
+        :param batch_size: Anzahl Zeilen pro INSERT-Statement.
+        :type batch_size: int
+        :return: Anzahl geschriebener, übersprungener und ungültiger Datensätze.
+        :rtype: WriteResult
         """
 
-        statement: Final = select(func.count()).where(  # pylint: disable=not-callable
-            (SensorData.timestamp == sensor_data_point.timestamp)
-            & (SensorData.box_id == sensor_data_point.box_id)
-            & (SensorData.sensor_id == sensor_data_point.sensor_id)
+        if data is None or data.empty:
+            logger.error("No data provided to write")
+            return WriteResult()
+
+        validation: SensorDataValidationResult = validate_sensor_data(data)
+        if validation.invalid_count:
+            logger.warning(
+                "Skipping {} rows due to invalid data: {}",
+                validation.invalid_count,
+                validation.rejection_summary(),
+            )
+
+        result: WriteResult = self.write_sensor_data_batches(
+            validation.data, batch_size
         )
-        num_of_rows: Final = session.scalar(statement)
-        return num_of_rows is not None and num_of_rows > 0
+        result.invalid += validation.invalid_count
+        return result
 
-    def write_new_sensor_data(self, data: pd.DataFrame) -> int:
+    def write_sensor_data_batches(
+        self, data: pd.DataFrame, batch_size: int = DEFAULT_WRITE_BATCH_SIZE
+    ) -> WriteResult:
         """
-        Validiert und schreibt neue Sensordaten in die Datenbank, wenn sie noch nicht existieren.
-
-        :param data: DataFrame mit den Sensordaten.
+        Schreibt Sensordaten gebündelt mit
+        ``INSERT ... ON CONFLICT (sensor_key, timestamp) DO NOTHING``.
+        Die Sensor-IDs werden über den :class:`SensorKeyCache` auf ihre Schlüssel
+        abgebildet, unbekannte Sensoren dabei angelegt. Alle Batches werden in
+        einer Transaktion geschrieben; bereits vorhandene Datenpunkte werden von
+        der Datenbank übersprungen.
+
+        :param data: DataFrame mit den Sensordaten (Messwerte mit 'box_id',
+                     'sensor_id' und den beschreibenden Feldern).
         :type data: pd.DataFrame
-        :return: Anzahl erfolgreich geschriebener Datensätze.
-        :rtype: int
+        :param batch_size: Anzahl Zeilen pro INSERT-Statement.
+        :type batch_size: int
+        :return: Anzahl geschriebener, übersprungener und ungültiger Datensätze.
+        :rtype: WriteResult
         """
 
         if data is None or data.empty:
-            logger.error("No data provided to write")
+            return WriteResult()
 
-        insert_count: int = 0
+        df: pd.DataFrame = data.dropna(
+            subset=["timestamp", "box_id", "sensor_id", "measurement"]
+        )
+        invalid_count: int = len(data) - len(df)
+        if invalid_count:
+            logger.warning("Skipping {} rows with missing values.", invalid_count)
+        try:
+            sensor_keys: dict[str, int] = self.sensor_key_cache.get_sensor_keys(df)
+        except SQLAlchemyError as e:
+            logger.error("SQLAlchemy error while resolving sensor keys: {}", e)
+            return WriteResult(invalid=invalid_count)
+        df = df.assign(sensor_key=df["sensor_id"].map(sensor_keys))[SENSOR_DATA_COLUMNS]
+        records: list[dict] = df.astype(object).to_dict("records")
+
+        # RETURNING liefert nur die tatsächlich eingefügten Zeilen
+        statement = (
+            insert(SensorData)
+            .on_conflict_do_nothing(index_elements=["sensor_key", "timestamp"])
+            .returning(SensorData.timestamp)
+        )
+        inserted_timestamps: list[datetime] = []
         with self.db_con.get_session()() as session:
-            for _, row in data.iterrows():
-                try:
-                    SensorDataModel.model_validate_json(row.to_json())
-                except ValidationError as e:
-                    logger.warning(
-                        "Skipping row due to invalid data: {}\n{}", row.to_dict(), e
-                    )
-                else:
-                    sensor_data_point: SensorData = SensorData.from_dict(row.to_dict())
-                    if self.exists_sensor_data_point(sensor_data_point, session):
-                        logger.error(
-                            "Existierender Sensor-Datenpunkt: {}", sensor_data_point
-                        )
-                    else:
-                        logger.debug("Neuer {}", sensor_data_point)
-                        session.add(instance=sensor_data_point)
-                        session.flush(objects=[sensor_data_point])
-                        session.commit()
-                        insert_count += 1
-        logger.info("Processed {} rows for box_id {}", insert_count, self.box_id)
-        return insert_count
+            try:
+                for offset in range(0, len(records), batch_size):
+                    batch: list[dict] = records[offset : offset + batch_size]
+                    inserted_timestamps += session.scalars(statement, batch).all()
+                session.commit()
+            except SQLAlchemyError as e:
+                session.rollback()
+                logger.error("SQLAlchemy error while writing data: {}", e)
+                return WriteResult(invalid=invalid_count)
+
+        insert_count: int = len(inserted_timestamps)
+        earliest_inserted: datetime | None = min(inserted_timestamps, default=None)
+        if earliest_inserted is not None and self.query_cache is not None:
+            self.query_cache.invalidate(earliest_inserted)
+        result = WriteResult(
+            insert_count, len(records) - insert_count, invalid_count, earliest_inserted
+        )
+        logger.info(
+            "Wrote {} new rows for box_id {} ({} already existing, {} invalid).",
+            result.inserted,
+            self.box_id,
+            result.skipped,
+            result.invalid,
+        )
+        return result
 
-    def bulk_write_sensor_data_to_db(self, data_dir_path: Path) -> None:
+    def bulk_write_sensor_data_to_db(
+        self, data_dir_path: Path, max_workers: int = DEFAULT_IMPORT_WORKERS
+    ) -> WriteResult:
         """
         Führt einen Massenimport historischer Sensordaten im Parquet-Format durch.
 
+        Die Sensor-Partitionen werden parallel in einem Thread-Pool importiert;
+        jeder Worker nutzt dabei eine eigene Verbindung aus dem Connection-Pool
+        der Engine. Jede Parquet-Datei einer Partition (inkl. der Jahr/Monat-
+        Unterordner) wird einzeln per ``COPY`` über eine Staging-Tabelle geladen
+        (siehe :class:`SensorDataCopyLoader`) und danach im Checkpoint-Manifest
+        des Datenverzeichnisses als geladen markiert. Ein abgebrochener Import
+        überspringt beim nächsten Aufruf alle bereits geladenen Dateien; bereits
+        vorhandene Messwerte werden übersprungen. Schlägt der Import einer
+        Partition fehl, werden die übrigen Partitionen trotzdem geladen.
+
         :param data_dir_path: Verzeichnis mit den Parquet-Dateien.
         :type data_dir_path: Path
+        :param max_workers: Maximale Anzahl gleichzeitig importierter Partitionen.
+        :type max_workers: int
+        :return: Anzahl geschriebener, übersprungener und ungültiger Datensätze.
+        :rtype: WriteResult
         """
 
-        df_validator = Pandantic(schema=SensorDataModel)
-        paths: list = [name for name in os.listdir(data_dir_path)]
+        copy_loader = SensorDataCopyLoader(self.db_con, self.sensor_key_cache)
+        checkpoint = BackfillCheckpoint(data_dir_path)
+        partitions: list[Path] = sorted(
+            path
+            for path in data_dir_path.iterdir()
+            if path.is_dir() and path.name.startswith("sensor_partition=")
+        )
         logger.debug(
-            "Start writing all historical data from '{}' in db.", data_dir_path
+            "Start writing all historical data from '{}' in db with {} workers.",
+            data_dir_path,
+            max_workers,
         )
         start = timer()
-        for path in paths:
-            sensor_id: str = path.split("=")[1]
-            logger.debug("Try to write data for sensor '{}' in db.", sensor_id)
-            df: pd.DataFrame = pd.read_parquet(data_dir_path.absolute() / path)
-            df["measurement"] = pd.to_numeric(df["measurement"], errors="coerce")
-
-            # Validate DataFrame with Pandantic
-            validated_df: pd.DataFrame = df_validator.validate(df, errors="skip")
-
-            with self.db_con.get_session()() as session:
-                validated_df.to_sql(
-                    name=SensorData.__tablename__,
-                    con=session.bind,
-                    if_exists="append",
-                    index=False,
-                    chunksize=5000,
-                    method="multi",
-                )
-            logger.debug("Wrote data for sensor '{}' in db.", sensor_id)
+        result = WriteResult()
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="import"
+        ) as executor:
+            futures: dict[Future, Path] = {
+                executor.submit(
+                    self._bulk_write_partition,
+                    copy_loader,
+                    checkpoint,
+                    data_dir_path,
+                    partition,
+                ): partition
+                for partition in partitions
+            }
+            for future in as_completed(futures):
+                try:
+                    result += future.result()
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    logger.error(
+                        "Writing partition '{}' in db failed: {}",
+                        futures[future].name,
+                        e,
+                    )
 
+        if result.inserted and self.query_cache is not None:
+            self.query_cache.invalidate()
         end = timer()
-        logger.debug(
-            "End writing all historical data from '{}' in db. Took {}s.",
+        logger.info(
+            "Wrote {} historical readings from '{}' in db "
+            "({} already existing, {} invalid). Took {:.1f}s.",
+            result.inserted,
             data_dir_path,
+            result.skipped,
+            result.invalid,
             end - start,
         )
+        return result
+
+    @staticmethod
+    def _bulk_write_partition(
+        copy_loader: SensorDataCopyLoader,
+        checkpoint: BackfillCheckpoint,
+        data_dir_path: Path,
+        partition: Path,
+    ) -> WriteResult:
+        """
+        Importiert alle noch nicht geladenen Parquet-Dateien einer Sensor-Partition.
+
+        :param copy_loader: Loader für den Import per ``COPY``.
+        :type copy_loader: SensorDataCopyLoader
+        :param checkpoint: Checkpoint-Manifest des Datenverzeichnisses.
+        :type checkpoint: BackfillCheckpoint
+        :param data_dir_path: Verzeichnis mit den Parquet-Dateien.
+        :type data_dir_path: Path
+        :param partition: Verzeichnis der Sensor-Partition.
+        :type partition: Path
+        :return: Anzahl geschriebener, übersprungener und ungültiger Datensätze.
+        :rtype: WriteResult
+        """
+
+        sensor_id: str = partition.name.split("=")[1]
+        logger.debug("Try to write data for sensor '{}' in db.", sensor_id)
+        result = WriteResult()
+        for file_path in sorted(partition.rglob("*.parquet")):
+            file_name: str = file_path.relative_to(data_dir_path).as_posix()
+            if checkpoint.is_file_loaded(file_name):
+                logger.debug("Skipping already loaded file '{}'.", file_name)
+                continue
+
+            result += copy_loader.load_file(file_path)
+            checkpoint.mark_file_loaded(file_name)
+        logger.debug("Wrote data for sensor '{}' in db.", sensor_id)
+        return result
 
     def write_sensor_metadata(self) -> None:
         """Ruft Sensormetadaten über die SenseBox API ab und schreibt sie in die Datenbank."""
 
         sense_box_api = SenseBoxApi(self.box_id)
         metadata_df: pd.DataFrame = sense_box_api.get_sensors_information_for_box()
+        self.write_sensors_metadata(metadata_df.assign(box_id=self.box_id))
 
-        with self.db_con.get_session()() as session:
-            try:
-                metadata_df.to_sql(
-                    name=SensorMetadata.__tablename__,
-                    con=session.bind,
-                    if_exists="fail",
-                    index=False,
-                )
-                logger.info("Wrote metadata table to db.")
-            except ValueError:
-                logger.info("Metadata table already exists.")
+    def write_sensors_metadata(self, metadata_df: pd.DataFrame) -> int:
+        """
+        Schreibt die Metadaten noch nicht bekannter Sensoren in die Datenbank.
+
+        :param metadata_df: DataFrame mit den Sensor-Metadaten und 'box_id' (auch
+                            mehrerer Boxen).
+        :type metadata_df: pd.DataFrame
+        :return: Anzahl neu geschriebener Sensoren.
+        :rtype: int
+        """
+
+        if metadata_df is None or metadata_df.empty:
+            return 0
+
+        try:
+            num_new_sensors: int = self.sensor_key_cache.insert_metadata(metadata_df)
+        except SQLAlchemyError as e:
+            logger.error("SQLAlchemy error while writing metadata: {}", e)
+            return 0
+        logger.info("Wrote metadata of {} new sensors to db.", num_new_sensors)
+        if num_new_sensors and self.query_cache is not None:
+            self.query_cache.pop(SENSORS_METADATA_CACHE_KEY)
+        return num_new_sensors
 
 
 class SensorDataQueryService:
@@ -165,15 +440,24 @@ class SensorDataQueryService:
     :type db_con: DbCon
     :param box_id: ID der SenseBox, zu der die Sensordaten gehören.
     :type box_id: str
+    :param query_cache: Cache der Plotdaten und Sensor-Metadaten; ohne Angabe
+                        wird ein eigener erstellt.
+    :type query_cache: QueryResultCache | None
     """
 
-    def __init__(self, db_con: DbCon, box_id: str) -> None:
+    def __init__(
+        self, db_con: DbCon, box_id: str, query_cache: QueryResultCache | None = None
+    ) -> None:
         self.db_con = db_con
         self.box_id = box_id
+        self.query_cache = (
+            query_cache if query_cache is not None else QueryResultCache()
+        )
 
     def query_all_data(self) -> pd.DataFrame:
         """
-        Lädt alle Sensordaten für die angegebene Box-ID.
+        Lädt alle Sensordaten für die angegebene Box-ID. Gelesen wird per COPY
+        direkt in Arrow (siehe ``read_arrow``).
 
         :return: DataFrame mit allen Datenpunkten.
         :rtype: pd.DataFrame
@@ -181,9 +465,10 @@ class SensorDataQueryService:
 
         logger.info("Querying all data for box_id {}.", self.box_id)
         try:
-            query = select(SensorData).where(SensorData.box_id == self.box_id)
-            with self.db_con.get_session()() as session:
-                df = pd.read_sql(query, session.bind, parse_dates=["timestamp"])
+            query = _select_sensor_data_with_metadata().where(
+                SensorMetadata.box_id == self.box_id
+            )
+            df = read_dataframe(self.db_con, query)
             logger.info("Retrieved {} data points from db.", len(df))
             return df
         except SQLAlchemyError as e:
@@ -196,24 +481,72 @@ class SensorDataQueryService:
 
     def query_sensors_metadata(self) -> pd.DataFrame:
         """
-        Lädt alle Sensor-Metadaten aus der Datenbank.
+        Lädt alle Sensor-Metadaten aus der Datenbank. Das Ergebnis wird bis zum
+        Ablauf der TTL des Caches oder bis zum Anlegen neuer Sensoren
+        zwischengespeichert.
 
         :return: DataFrame mit Metadaten der Sensoren.
         :rtype: pd.DataFrame
         """
 
+        cached_df: pd.DataFrame | None = self.query_cache.get(
+            SENSORS_METADATA_CACHE_KEY
+        )
+        if cached_df is not None:
+            return cached_df
+
         logger.info("Query sensor metadata for box_id {}.", self.box_id)
         try:
             query = select(SensorMetadata)
             with self.db_con.get_session()() as session:
                 df: pd.DataFrame = pd.read_sql(query, session.bind)
-                return df
+            self.query_cache.put(SENSORS_METADATA_CACHE_KEY, df)
+            return df
         except SQLAlchemyError as e:
             logger.error("SQLAlchemy error while querying data: {}", e)
 
+    def query_latest_timestamps(
+        self, box_id: str | None = None, sensor_ids: list[str] | None = None
+    ) -> dict[str, datetime]:
+        """
+        Ermittelt je Sensor den Zeitstempel des zuletzt gespeicherten Messwerts.
+        Pro Sensor wird ein eigenes ``max(timestamp)`` abgefragt, damit der Index
+        ``(sensor_key, timestamp)`` genutzt wird.
+
+        :param box_id: ID der Box (Standard: Box des Services).
+        :type box_id: str | None
+        :param sensor_ids: IDs der Sensoren (Standard: alle Sensoren der Box).
+        :type sensor_ids: list[str] | None
+        :return: Dictionary mit Sensor-ID als Schlüssel und letztem Zeitstempel als Wert.
+        :rtype: dict[str, datetime]
+        """
+
+        box_id = box_id or self.box_id
+        latest_timestamps: dict[str, datetime] = {}
+        statement = select(SensorMetadata.sensor_id, SensorMetadata.sensor_key).where(
+            SensorMetadata.box_id == box_id
+        )
+        if sensor_ids is not None:
+            statement = statement.where(SensorMetadata.sensor_id.in_(sensor_ids))
+
+        try:
+            with self.db_con.get_session()() as session:
+                for sensor_id, sensor_key in session.execute(statement).tuples().all():
+                    latest_timestamp: datetime | None = session.scalar(
+                        select(func.max(SensorData.timestamp)).where(  # pylint: disable=not-callable
+                            SensorData.sensor_key == sensor_key
+                        )
+                    )
+                    if latest_timestamp is not None:
+                        latest_timestamps[sensor_id] = latest_timestamp
+        except SQLAlchemyError as e:
+            logger.error("SQLAlchemy error while querying data: {}", e)
+        return latest_timestamps
+
     def query_data_from_a_date_on(self, from_date: date) -> pd.DataFrame:
         """
-        Fragt alle Sensordaten ab einem bestimmten Datum ab.
+        Fragt alle Sensordaten ab einem bestimmten Datum ab (per COPY, siehe
+        ``read_arrow``).
 
         :param from_date: Startdatum der Abfrage.
         :type from_date: date
@@ -226,13 +559,13 @@ class SensorDataQueryService:
             self.box_id,
             from_date.strftime("%Y-%m-%d"),
         )
+        # Messwerte nach from_date, also ab dem Beginn des Folgetags (UTC)
+        start: pd.Timestamp = day_range(from_date, from_date, "UTC")[1]
         try:
-            query = select(SensorData).where(
-                (SensorData.box_id == self.box_id)
-                & (cast(SensorData.timestamp, Date) > from_date)
+            query = _select_sensor_data_with_metadata().where(
+                (SensorMetadata.box_id == self.box_id) & (SensorData.timestamp >= start)
             )
-            with self.db_con.get_session()() as session:
-                df = pd.read_sql(query, session.bind, parse_dates=["timestamp"])
+            df = read_dataframe(self.db_con, query)
             logger.info("Retrieved {} data points from db.", len(df))
             return df
         except SQLAlchemyError as e:
@@ -243,60 +576,326 @@ class SensorDataQueryService:
             logger.exception("Unexpected error while querying data: {}", e)
         return None
 
+    def stream_all_data(
+        self,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        columns: list[str] | None = None,
+        as_arrow: bool = False,
+    ) -> Iterator[pd.DataFrame | pa.RecordBatch]:
+        """
+        Streamt alle Sensordaten der Box in Chunks fester Größe (siehe
+        ``_stream_query``). Im Gegensatz zu ``query_all_data`` bleibt der
+        Speicherbedarf unabhängig von der Länge der Historie.
+
+        :param chunk_size: Anzahl Zeilen je Chunk.
+        :type chunk_size: int
+        :param columns: Auszuwählende Spalten aus ``STREAM_COLUMNS``; None wählt alle.
+        :type columns: list[str] | None
+        :param as_arrow: Chunks als Arrow-RecordBatch statt als DataFrame liefern.
+        :type as_arrow: bool
+        :return: Iterator über die Chunks.
+        :rtype: Iterator[pd.DataFrame | pa.RecordBatch]
+        """
+
+        logger.info("Streaming all data for box_id {}.", self.box_id)
+        query: Select = _select_sensor_data_with_metadata().where(
+            SensorMetadata.box_id == self.box_id
+        )
+        yield from self._stream_query(
+            _project_columns(query, columns), chunk_size, as_arrow
+        )
+
+    def stream_data_from_a_date_on(
+        self,
+        from_date: date,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        columns: list[str] | None = None,
+        as_arrow: bool = False,
+    ) -> Iterator[pd.DataFrame | pa.RecordBatch]:
+        """
+        Streamt die Sensordaten der Box nach einem bestimmten Datum in Chunks
+        fester Größe (Zeitraum wie bei ``query_data_from_a_date_on``).
+
+        :param from_date: Startdatum der Abfrage.
+        :type from_date: date
+        :param chunk_size: Anzahl Zeilen je Chunk.
+        :type chunk_size: int
+        :param columns: Auszuwählende Spalten aus ``STREAM_COLUMNS``; None wählt alle.
+        :type columns: list[str] | None
+        :param as_arrow: Chunks als Arrow-RecordBatch statt als DataFrame liefern.
+        :type as_arrow: bool
+        :return: Iterator über die Chunks.
+        :rtype: Iterator[pd.DataFrame | pa.RecordBatch]
+        """
+
+        logger.info(
+            "Streaming data for box_id {} from {} to now.",
+            self.box_id,
+            from_date.strftime("%Y-%m-%d"),
+        )
+        start: pd.Timestamp = day_range(from_date, from_date, "UTC")[1]
+        query: Select = _select_sensor_data_with_metadata().where(
+            (SensorMetadata.box_id == self.box_id) & (SensorData.timestamp >= start)
+        )
+        yield from self._stream_query(
+            _project_columns(query, columns), chunk_size, as_arrow
+        )
+
+    def _stream_query(
+        self, query: Select, chunk_size: int, as_arrow: bool
+    ) -> Iterator[pd.DataFrame | pa.RecordBatch]:
+        """
+        Führt eine Abfrage mit serverseitigem Cursor aus und liefert das Ergebnis
+        in Chunks von höchstens ``chunk_size`` Zeilen. Die Verbindung bleibt
+        belegt, bis der Iterator vollständig gelesen oder geschlossen wurde.
+
+        Fehler werden protokolliert und weitergereicht, damit ein abgebrochener
+        Stream nicht als vollständiges Ergebnis gilt.
+
+        :param query: Auszuführende Abfrage.
+        :type query: Select
+        :param chunk_size: Anzahl Zeilen je Chunk.
+        :type chunk_size: int
+        :param as_arrow: Chunks als Arrow-RecordBatch statt als DataFrame liefern.
+        :type as_arrow: bool
+        :return: Iterator über die Chunks.
+        :rtype: Iterator[pd.DataFrame | pa.RecordBatch]
+        """
+
+        num_rows: int = 0
+        start = timer()
+        try:
+            with self.db_con.engine.connect() as connection:
+                result: Result = connection.execution_options(
+                    stream_results=True, yield_per=chunk_size
+                ).execute(query)
+                columns: list[str] = list(result.keys())
+                for partition in result.partitions():
+                    df = pd.DataFrame.from_records(partition, columns=columns)
+                    if "timestamp" in df:
+                        df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
+                    num_rows += len(df)
+                    yield (
+                        pa.RecordBatch.from_pandas(df, preserve_index=False)
+                        if as_arrow
+                        else df
+                    )
+        except SQLAlchemyError as e:
+            logger.error("SQLAlchemy error while streaming data: {}", e)
+            raise
+        logger.info(
+            "Streamed {} data points from db in {:.2f} s.", num_rows, timer() - start
+        )
+
+    def get_sensors_metadata(self, sensor_ids: list[str]) -> pd.DataFrame:
+        """
+        Gibt die Metadaten der Sensoren zurück (siehe ``query_sensors_metadata``).
+        Fehlt ein angefragter Sensor im Zwischenspeicher, werden die Metadaten
+        einmal neu geladen.
+
+        :param sensor_ids: Liste der Sensor-IDs.
+        :type sensor_ids: list[str]
+        :return: DataFrame der bekannten Sensoren mit 'sensor_id' als Index.
+        :rtype: pd.DataFrame
+        """
+
+        sensors_metadata: pd.DataFrame | None = self.query_sensors_metadata()
+        if sensors_metadata is not None and not set(sensor_ids).issubset(
+            sensors_metadata["sensor_id"]
+        ):
+            self.query_cache.pop(SENSORS_METADATA_CACHE_KEY)
+            sensors_metadata = self.query_sensors_metadata()
+        if sensors_metadata is None:
+            return pd.DataFrame()
+
+        sensors_metadata = sensors_metadata.set_index("sensor_id")
+        unknown: set[str] = set(sensor_ids).difference(sensors_metadata.index)
+        if unknown:
+            logger.warning("No metadata for sensors {}.", sorted(unknown))
+        return sensors_metadata[sensors_metadata.index.isin(sensor_ids)]
+
+    @staticmethod
+    def build_plot_query(
+        sensor_keys: list[int],
+        date_range: list[pd.Timestamp],
+        max_points: int = DEFAULT_MAX_PLOT_POINTS,
+        downsampling: DownsamplingMethod = DownsamplingMethod.LTTB,
+    ) -> Select:
+        """
+        Erstellt die Abfrage der Plotdaten mehrerer Sensoren in einem Statement
+        (``sensor_key = ANY(:sensor_keys)``). Gelesen wird die feinste Quelle
+        (Rohdaten, stündliche oder tägliche Continuous Aggregates), die im
+        Zeitraum höchstens ``PLOT_OVERSAMPLING * max_points`` Werte je Sensor
+        liefert. Der Zeitraum wird als gebundener, halboffener Bereich auf
+        ``timestamp`` gefiltert.
+
+        Aus den Aggregaten wird für LTTB der Mittelwert je Bucket gelesen. Für
+        MIN_MAX liefert jeder Bucket stattdessen zwei Zeilen mit Minimum und
+        Maximum, damit Spitzen nicht bereits im Mittelwert verloren gehen.
+
+        :param sensor_keys: Schlüssel der Sensoren.
+        :type sensor_keys: list[int]
+        :param date_range: Zeitbereich im Format [Startdatum, Enddatum].
+        :type date_range: list[pd.Timestamp]
+        :param max_points: Punktbudget je Sensor.
+        :type max_points: int
+        :param downsampling: Verfahren, mit dem die Werte anschließend reduziert werden.
+        :type downsampling: DownsamplingMethod
+        :return: SELECT über Sensor-Schlüssel, Zeitstempel und Messwert, nach
+                 Sensor und Zeit sortiert.
+        :rtype: Select
+        """
+
+        start, end = day_range(date_range[0], date_range[1])
+        source: type[SensorData | SensorDataHourly | SensorDataDaily] = next(
+            (
+                source
+                for source, interval in PLOT_SOURCES
+                if (end - start) / interval <= PLOT_OVERSAMPLING * max_points
+            ),
+            SensorDataDaily,
+        )
+        sensor_keys_param = bindparam(
+            "sensor_keys", [int(key) for key in sensor_keys], type_=ARRAY(Integer)
+        )
+        condition = (
+            (source.sensor_key == any_(sensor_keys_param))
+            & (source.timestamp >= start)
+            & (source.timestamp < end)
+        )
+        if downsampling is DownsamplingMethod.LTTB or source is SensorData:
+            return (
+                select(source.sensor_key, source.timestamp, source.measurement)
+                .where(condition)
+                .order_by(source.sensor_key, source.timestamp)
+            )
+
+        extremes = union_all(
+            *[
+                select(
+                    source.sensor_key, source.timestamp, column.label("measurement")
+                ).where(condition)
+                for column in (source.min_measurement, source.max_measurement)
+            ]
+        ).subquery("extremes")
+        return select(
+            extremes.c.sensor_key, extremes.c.timestamp, extremes.c.measurement
+        ).order_by(extremes.c.sensor_key, extremes.c.timestamp, extremes.c.measurement)
+
+    @staticmethod
+    def split_plot_data(
+        table: pa.Table, polars: bool | None = None
+    ) -> dict[int, pd.DataFrame]:
+        """
+        Rechnet die Zeitstempel der Plotdaten in ``PLOT_TIMEZONE`` um und teilt
+        sie je Sensor auf. Mit Polars wird die Arrow-Tabelle ohne Kopie
+        übernommen und auf mehreren Kernen verarbeitet (siehe ``use_polars``).
+
+        :param table: Ergebnis der Abfrage aus ``build_plot_query``.
+        :type table: pa.Table
+        :param polars: Polars statt pandas verwenden; None liest ``USE_POLARS``.
+        :type polars: bool | None
+        :return: Dictionary mit Sensor-Schlüssel als Schlüssel und den
+                 zeitlich sortierten Werten des Sensors als Wert.
+        :rtype: dict[int, pd.DataFrame]
+        """
+
+        if use_polars(polars):
+            partitions: dict = (
+                pl.from_arrow(table)
+                .lazy()
+                .with_columns(
+                    pl.col("timestamp")
+                    .dt.convert_time_zone(PLOT_TIMEZONE)
+                    .dt.cast_time_unit("ns")
+                )
+                .collect()
+                .partition_by("sensor_key", as_dict=True, maintain_order=True)
+            )
+            return {key[0]: part.to_pandas() for key, part in partitions.items()}
+
+        df: pd.DataFrame = table.to_pandas(coerce_temporal_nanoseconds=True)
+        df["timestamp"] = df["timestamp"].dt.tz_convert(PLOT_TIMEZONE)
+        return dict(list(df.groupby("sensor_key", sort=False)))
+
     def query_plot_data(
         self,
         sensor_ids: list[str],
         date_range: list[pd.Timestamp],
+        max_points: int = DEFAULT_MAX_PLOT_POINTS,
+        downsampling: DownsamplingMethod = DownsamplingMethod.LTTB,
     ) -> Dict[str, PlotData]:
         """
         Abfrage aufbereiteter Plotdaten für bestimmte Sensoren in einem Zeitbereich.
-        Die Daten werden abhängig vom Zeitraum aus unterschiedlichen aggregierten Tabellen geladen.
+        Alle Sensoren werden mit einer Abfrage per COPY geladen (siehe
+        ``build_plot_query`` und ``read_arrow``), im Speicher je Sensor aufgeteilt
+        und auf höchstens ``max_points`` Punkte reduziert. Damit bleibt die
+        Datenmenge je Plot unabhängig vom Zeitraum begrenzt. Die Ergebnisse
+        werden je Sensor, Zeitraum und Auflösung im :class:`QueryResultCache`
+        gehalten; abgefragt werden nur fehlende Sensoren.
 
         :param sensor_ids: Liste der Sensor-IDs.
         :type sensor_ids: list[str]
         :param date_range: Zeitbereich im Format [Startdatum, Enddatum].
         :type date_range: list[pd.Timestamp]
+        :param max_points: Maximale Anzahl an Punkten je Sensor.
+        :type max_points: int
+        :param downsampling: Verfahren zur Reduktion der Punkte (LTTB erhält die
+                             Form der Kurve, MIN_MAX alle Spitzen).
+        :type downsampling: DownsamplingMethod
         :return: Dictionary mit Sensor-ID als Schlüssel und `PlotData`-Objekten als Wert.
         :rtype: Dict[str, PlotData]
         """
 
-        sensor_sql_dict: dict = {
-            "5d6d5269953683001ae46ae1": "temperature",
-            "5d6d5269953683001ae46add": "pm10",
-            "5d6d5269953683001ae46ade": "pm25",
-            "607fe08260979a001bd13188": "airpressure",
-            "5d6d5269953683001ae46ae0": "humidity",
-            "5e7f6fecf7afec001bf5b1a3": "illuminance",
+        sensors_metadata: pd.DataFrame = self.get_sensors_metadata(sensor_ids)
+        if sensors_metadata.empty:
+            return {}
+        start, end = day_range(date_range[0], date_range[1])
+        cache_keys: dict[str, tuple] = {
+            sensor_id: ("plot_data", sensor_id, start, end, max_points, downsampling)
+            for sensor_id in sensor_ids
+            if sensor_id in sensors_metadata.index
         }
-        delta: int = (date_range[1] - date_range[0]).days
-        time_table: str = (
-            "view" if delta <= 3 else "hourly_avg" if delta <= 31 else "daily_avg"
-        )
-        sensors_metadata: pd.DataFrame = self.query_sensors_metadata()
-        plot_data_dict: dict = {}
+        plot_data_dict: dict = {
+            sensor_id: self.query_cache.get(cache_key)
+            for sensor_id, cache_key in cache_keys.items()
+        }
+        missing: list[str] = [
+            sensor_id
+            for sensor_id, plot_data in plot_data_dict.items()
+            if plot_data is None
+        ]
+        if not missing:
+            logger.debug("Plot data of {} sensors served from cache.", len(cache_keys))
+            return plot_data_dict
+
         try:
-            with self.db_con.get_session()() as session:
-                for sensor_id in sensor_ids:
-                    table: str = f"{sensor_sql_dict[sensor_id]}_{time_table}"
-                    query_str: str = f"select * from \"{table}\" where \"timestamp\"::date between date '{date_range[0].strftime('%Y-%m-%d')}' and date '{date_range[1].strftime('%Y-%m-%d')}'"  # pylint: disable=line-too-long
-                    query = text(query_str)
-                    df: pd.DataFrame = pd.read_sql(
-                        query, session.bind, parse_dates=["timestamp"]
-                    )
-                    df["timestamp"] = df["timestamp"].map(
-                        lambda x: x.tz_convert("Europe/Berlin")
-                    )
-                    sensor_metadata = sensors_metadata[
-                        sensors_metadata["sensor_id"] == sensor_id
-                    ]
-                    plot_data: PlotData = PlotData(
-                        df.timestamp,
-                        df.measurement,
-                        sensor_metadata.title.iloc[0],
-                        sensor_metadata.unit.iloc[0],
-                    )
-                    plot_data_dict[sensor_id] = plot_data
-                return plot_data_dict
+            query: Select = self.build_plot_query(
+                sensors_metadata.loc[missing, "sensor_key"].tolist(),
+                date_range,
+                max_points,
+                downsampling,
+            )
+            table: pa.Table = read_arrow(self.db_con, query)
+            sensor_dfs: dict[int, pd.DataFrame] = self.split_plot_data(table)
+            empty_df: pd.DataFrame = table.slice(0, 0).to_pandas()
+
+            for sensor_id in missing:
+                sensor_metadata: pd.Series = sensors_metadata.loc[sensor_id]
+                sensor_df: pd.DataFrame = downsample(
+                    sensor_dfs.get(sensor_metadata.sensor_key, empty_df),
+                    max_points,
+                    downsampling,
+                )
+                plot_data: PlotData = PlotData(
+                    sensor_df.timestamp.reset_index(drop=True),
+                    sensor_df.measurement.reset_index(drop=True),
+                    sensor_metadata.title,
+                    sensor_metadata.unit,
+                )
+                plot_data_dict[sensor_id] = plot_data
+                self.query_cache.put(cache_keys[sensor_id], plot_data, end)
+            return plot_data_dict
         except SQLAlchemyError as e:
             logger.error("SQLAlchemy error while querying data: {}", e)
         except ValueError as e:
@@ -314,27 +913,41 @@ class SensorDataDbService:
     :type db_con: DbCon
     :param box_id: ID der SenseBox.
     :type box_id: str
+    :param query_cache: Gemeinsamer Cache der Abfrageergebnisse (z.B. mit dem
+                        FleetIngestionService, damit dessen Schreibvorgänge
+                        die betroffenen Einträge entfernen); ohne Angabe wird
+                        ein eigener erstellt.
+    :type query_cache: QueryResultCache | None
     """
 
-    def __init__(self, db_con: DbCon, box_id: str) -> None:
+    def __init__(
+        self, db_con: DbCon, box_id: str, query_cache: QueryResultCache | None = None
+    ) -> None:
         self.db_con = db_con
         self.box_id = box_id
+        self.query_cache = (
+            query_cache if query_cache is not None else QueryResultCache()
+        )
 
         self.sensor_data_write_service = SensorDataWriteService(
-            self.db_con, self.box_id
+            self.db_con, self.box_id, query_cache=self.query_cache
         )
         self.sensor_data_query_servive = SensorDataQueryService(
-            self.db_con, self.box_id
+            self.db_con, self.box_id, self.query_cache
         )
 
     # Write data in db
-    def write_new_sensor_data(self, data: pd.DataFrame) -> int:
+    def write_new_sensor_data(self, data: pd.DataFrame) -> WriteResult:
         """Methode wird oben beschrieben."""
         return self.sensor_data_write_service.write_new_sensor_data(data)
 
-    def bulk_write_sensor_data_to_db(self, data_dir_path: Path) -> None:
+    def bulk_write_sensor_data_to_db(
+        self, data_dir_path: Path, max_workers: int = DEFAULT_IMPORT_WORKERS
+    ) -> WriteResult:
         """Methode wird oben beschrieben."""
-        self.sensor_data_write_service.bulk_write_sensor_data_to_db(data_dir_path)
+        return self.sensor_data_write_service.bulk_write_sensor_data_to_db(
+            data_dir_path, max_workers
+        )
 
     def write_sensor_metadata(self) -> None:
         """Methode wird oben beschrieben."""
@@ -345,15 +958,48 @@ class SensorDataDbService:
         """Methode wird oben beschrieben."""
         return self.sensor_data_query_servive.query_all_data()
 
+    def query_latest_timestamps(self) -> dict[str, datetime]:
+        """Methode wird oben beschrieben."""
+        return self.sensor_data_query_servive.query_latest_timestamps()
+
     def query_data_from_a_date_on(self, from_date: date) -> pd.DataFrame:
         """Methode wird oben beschrieben."""
         return self.sensor_data_query_servive.query_data_from_a_date_on(from_date)
 
+    def stream_all_data(
+        self,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        columns: list[str] | None = None,
+        as_arrow: bool = False,
+    ) -> Iterator[pd.DataFrame | pa.RecordBatch]:
+        """Methode wird oben beschrieben."""
+        return self.sensor_data_query_servive.stream_all_data(
+            chunk_size, columns, as_arrow
+        )
+
+    def stream_data_from_a_date_on(
+        self,
+        from_date: date,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        columns: list[str] | None = None,
+        as_arrow: bool = False,
+    ) -> Iterator[pd.DataFrame | pa.RecordBatch]:
+        """Methode wird oben beschrieben."""
+        return self.sensor_data_query_servive.stream_data_from_a_date_on(
+            from_date, chunk_size, columns, as_arrow
+        )
+
     def query_plot_data(
-        self, sensor_ids: list[str], date_range: list[pd.Timestamp]
+        self,
+        sensor_ids: list[str],
+        date_range: list[pd.Timestamp],
+        max_points: int = DEFAULT_MAX_PLOT_POINTS,
+        downsampling: DownsamplingMethod = DownsamplingMethod.LTTB,
     ) -> Dict[str, PlotData]:
         """Methode wird oben beschrieben."""
-        return self.sensor_data_query_servive.query_plot_data(sensor_ids, date_range)
+        return self.sensor_data_query_servive.query_plot_data(
+            sensor_ids, date_range, max_points, downsampling
+        )
 
 
 if __name__ == "__main__":
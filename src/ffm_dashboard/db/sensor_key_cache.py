@@ -0,0 +1,104 @@
+"""Zuordnung von Sensor-IDs zu den kompakten Sensor-Schlüsseln der Datenbank."""
+
+import threading
+from typing import Final
+
+import pandas as pd
+from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from src.ffm_dashboard.db import DbCon, SensorMetadata
+
+SENSOR_METADATA_INSERT_COLUMNS: Final = [
+    column.name
+    for column in SensorMetadata.__table__.columns
+    if column.name != "sensor_key"
+]
+"""Spalten, die beim Anlegen eines Sensors geschrieben werden (ohne den Schlüssel)."""
+
+
+class SensorKeyCache:
+    """
+    Ordnet Sensor-IDs ihren ``sensor_key`` aus 'sensor_metadata' zu.
+
+    Bekannte Schlüssel werden im Speicher gehalten, da sie sich nach dem Anlegen
+    eines Sensors nicht mehr ändern. Unbekannte Sensoren werden mit den
+    Metadaten aus den Messwerten angelegt (``ON CONFLICT DO NOTHING``), damit
+    Messwerte auch vor dem Schreiben der Metadaten gespeichert werden können.
+    Dafür muss ``sensor_id`` Schlüssel von 'sensor_metadata' sein (init.sql bzw.
+    ``001_normalize_sensor_data.sql`` für bestehende Datenbanken).
+    Die Klasse ist thread-sicher.
+
+    :param db_con: Datenbankverbindung.
+    :type db_con: DbCon
+    """
+
+    def __init__(self, db_con: DbCon) -> None:
+        self.db_con = db_con
+        self._lock = threading.Lock()
+        self._keys: dict[str, int] = {}
+
+    def insert_metadata(self, metadata_df: pd.DataFrame) -> int:
+        """
+        Legt noch nicht bekannte Sensoren in 'sensor_metadata' an.
+
+        :param metadata_df: DataFrame mit 'sensor_id' und optional den übrigen
+                            Spalten von 'sensor_metadata' (auch mehrerer Boxen).
+        :type metadata_df: pd.DataFrame
+        :return: Anzahl neu angelegter Sensoren.
+        :rtype: int
+        """
+
+        if metadata_df is None or metadata_df.empty:
+            return 0
+
+        df: pd.DataFrame = (
+            metadata_df.reindex(columns=SENSOR_METADATA_INSERT_COLUMNS)
+            .drop_duplicates("sensor_id")
+            .astype(object)
+        )
+        records: list[dict] = df.where(df.notna(), None).to_dict("records")
+        statement = (
+            insert(SensorMetadata)
+            .on_conflict_do_nothing(index_elements=["sensor_id"])
+            .returning(SensorMetadata.sensor_id)
+        )
+        with self.db_con.get_session()() as session:
+            inserted: list[str] = list(session.scalars(statement, records))
+            session.commit()
+        return len(inserted)
+
+    def get_sensor_keys(self, sensors_df: pd.DataFrame) -> dict[str, int]:
+        """
+        Gibt die Schlüssel der Sensoren zurück und legt unbekannte Sensoren an.
+
+        :param sensors_df: DataFrame mit 'sensor_id' und optional den übrigen
+                           Spalten von 'sensor_metadata' (z.B. Messwerte).
+        :type sensors_df: pd.DataFrame
+        :return: Dictionary mit Sensor-ID als Schlüssel und sensor_key als Wert.
+        :rtype: dict[str, int]
+        """
+
+        sensor_ids: list[str] = list(pd.unique(sensors_df["sensor_id"].dropna()))
+        with self._lock:
+            missing: list[str] = [
+                sensor_id for sensor_id in sensor_ids if sensor_id not in self._keys
+            ]
+            if missing:
+                new_sensors: int = self.insert_metadata(
+                    sensors_df[sensors_df["sensor_id"].isin(missing)]
+                )
+                if new_sensors:
+                    logger.info("Registered {} new sensors.", new_sensors)
+                with self.db_con.get_session()() as session:
+                    self._keys.update(
+                        session.execute(
+                            select(
+                                SensorMetadata.sensor_id, SensorMetadata.sensor_key
+                            ).where(SensorMetadata.sensor_id.in_(missing))
+                        )
+                        .tuples()
+                        .all()
+                    )
+            return {sensor_id: self._keys[sensor_id] for sensor_id in sensor_ids}
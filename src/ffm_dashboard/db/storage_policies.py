@@ -0,0 +1,350 @@
+"""Verwaltung der TimescaleDB-Speicherrichtlinien (Chunks, Kompression, Retention)."""
+
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from timeit import default_timer as timer
+from typing import Final, Self
+
+import pandas as pd
+import yaml
+from loguru import logger
+from sqlalchemy import Connection, text
+
+from src.ffm_dashboard.db import DbCon, SensorData, SensorDataDaily, SensorDataHourly
+
+STORAGE_POLICIES_CONFIG_PATH: Final = (
+    Path(__file__).parent / "config/storage_policies.yaml"
+)
+"""Standardpfad der Konfiguration der Speicherrichtlinien."""
+
+ORDER_BY_PATTERN: Final = re.compile(
+    r"^(?P<column>\w+)(\s+(ASC|DESC))?$", re.IGNORECASE
+)
+"""Erlaubte Form einer Sortierangabe für die Kompression (Spalte [ASC|DESC])."""
+
+CONTINUOUS_AGGREGATES: Final = [
+    SensorDataHourly.__tablename__,
+    SensorDataDaily.__tablename__,
+]
+"""Continuous Aggregates über 'sensor_data' (siehe init.sql)."""
+
+
+@dataclass
+class StoragePolicies:
+    """
+    Speicherrichtlinien einer Hypertable.
+
+    - chunk_time_interval: Zeitraum eines Chunks (z.B. '30 days')
+    - compression_enabled: Ob ältere Chunks komprimiert werden
+    - segment_by: Spalte, nach der die komprimierten Daten segmentiert werden
+    - order_by: Sortierung innerhalb eines Segments (z.B. 'timestamp DESC')
+    - compress_after: Alter, ab dem ein Chunk komprimiert wird
+    - retention_enabled: Ob alte Rohdaten gelöscht werden
+    - drop_after: Alter, ab dem ein Chunk gelöscht wird
+    """
+
+    chunk_time_interval: str = "30 days"
+    compression_enabled: bool = True
+    segment_by: str = "sensor_key"
+    order_by: str = "timestamp DESC"
+    compress_after: str = "7 days"
+    retention_enabled: bool = False
+    drop_after: str = "2 years"
+
+    @classmethod
+    def from_yaml(cls, config_path: Path = STORAGE_POLICIES_CONFIG_PATH) -> Self:
+        """
+        Liest die Speicherrichtlinien aus einer YAML-Datei. Fehlende Einträge
+        erhalten die Standardwerte.
+
+        :param config_path: Pfad zur YAML-Konfigurationsdatei.
+        :type config_path: pathlib.Path
+        :return: Die Speicherrichtlinien.
+        :rtype: StoragePolicies
+        """
+
+        with config_path.open("r") as f:
+            config: dict = yaml.safe_load(f) or {}
+
+        defaults = cls()
+        compression: dict = config.get("compression", {})
+        retention: dict = config.get("retention", {})
+        return cls(
+            chunk_time_interval=config.get(
+                "chunk_time_interval", defaults.chunk_time_interval
+            ),
+            compression_enabled=compression.get(
+                "enabled", defaults.compression_enabled
+            ),
+            segment_by=compression.get("segment_by", defaults.segment_by),
+            order_by=compression.get("order_by", defaults.order_by),
+            compress_after=compression.get("compress_after", defaults.compress_after),
+            retention_enabled=retention.get("enabled", defaults.retention_enabled),
+            drop_after=retention.get("drop_after", defaults.drop_after),
+        )
+
+
+class StoragePolicyService:
+    """
+    Wendet die Speicherrichtlinien auf die Hypertable 'sensor_data' an und zeigt
+    den aktuellen Stand an.
+
+    Alle Schritte sind idempotent: Richtlinien werden entfernt und mit den
+    konfigurierten Werten neu angelegt. Die Segmentierung und Sortierung der
+    Kompression wird nur gesetzt, solange noch kein Chunk komprimiert ist, da
+    TimescaleDB sie danach nicht mehr ändern kann.
+
+    :param db_con: Datenbankverbindung.
+    :type db_con: DbCon
+    :param policies: Die anzuwendenden Speicherrichtlinien.
+    :type policies: StoragePolicies
+    """
+
+    def __init__(self, db_con: DbCon, policies: StoragePolicies) -> None:
+        self.db_con = db_con
+        self.policies = policies
+        self.table_name: str = SensorData.__tablename__
+
+    def is_timescaledb_available(self, connection: Connection) -> bool:
+        """
+        Prüft, ob die TimescaleDB-Extension installiert ist.
+
+        :param connection: Aktive Datenbankverbindung.
+        :type connection: sqlalchemy.Connection
+        :return: True, wenn TimescaleDB installiert ist, sonst False.
+        :rtype: bool
+        """
+
+        return bool(
+            connection.scalar(
+                text("SELECT count(*) FROM pg_extension WHERE extname = 'timescaledb'")
+            )
+        )
+
+    def _validate_columns(self) -> tuple[str, str]:
+        """
+        Prüft die Spaltenangaben der Kompression gegen die Spalten der Tabelle,
+        da sie nicht als Parameter übergeben werden können.
+
+        :return: Tupel aus Segment-Spalte und Sortierangabe.
+        :rtype: tuple[str, str]
+        :raises ValueError: Wenn eine Spalte nicht zur Tabelle gehört.
+        """
+
+        columns: list[str] = [column.name for column in SensorData.__table__.columns]
+        order_by_match: re.Match | None = ORDER_BY_PATTERN.match(
+            self.policies.order_by.strip()
+        )
+        if self.policies.segment_by not in columns:
+            raise ValueError(f"Unknown segment_by column '{self.policies.segment_by}'.")
+        if order_by_match is None or order_by_match["column"] not in columns:
+            raise ValueError(f"Invalid order_by '{self.policies.order_by}'.")
+        return self.policies.segment_by, self.policies.order_by.strip()
+
+    def apply(self) -> bool:
+        """
+        Setzt Chunk-Intervall, Kompression und Retention der Hypertable.
+
+        :return: True, wenn die Richtlinien angewendet wurden, False ohne TimescaleDB.
+        :rtype: bool
+        """
+
+        segment_by, order_by = self._validate_columns()
+        table: dict[str, str] = {"table": self.table_name}
+        with self.db_con.engine.begin() as connection:
+            if not self.is_timescaledb_available(connection):
+                logger.warning(
+                    "TimescaleDB is not installed, skipping storage policies."
+                )
+                return False
+
+            connection.execute(
+                text(
+                    "SELECT set_chunk_time_interval(:table, CAST(:interval AS INTERVAL))"
+                ),
+                {**table, "interval": self.policies.chunk_time_interval},
+            )
+            logger.info(
+                "Chunk time interval of '{}' set to {}.",
+                self.table_name,
+                self.policies.chunk_time_interval,
+            )
+
+            connection.execute(
+                text("SELECT remove_compression_policy(:table, if_exists => true)"),
+                table,
+            )
+            if self.policies.compression_enabled:
+                if self._count_compressed_chunks(connection) == 0:
+                    connection.execute(
+                        text(
+                            f"ALTER TABLE {self.table_name} SET ("
+                            "timescaledb.compress, "
+                            f"timescaledb.compress_segmentby = '{segment_by}', "
+                            f"timescaledb.compress_orderby = '{order_by}')"
+                        )
+                    )
+                else:
+                    logger.info(
+                        "'{}' already has compressed chunks, keeping its "
+                        "segment_by/order_by settings.",
+                        self.table_name,
+                    )
+                connection.execute(
+                    text(
+                        "SELECT add_compression_policy("
+                        ":table, compress_after => CAST(:after AS INTERVAL))"
+                    ),
+                    {**table, "after": self.policies.compress_after},
+                )
+                logger.info(
+                    "Compressing chunks of '{}' older than {} (segment by {}, order by {}).",
+                    self.table_name,
+                    self.policies.compress_after,
+                    segment_by,
+                    order_by,
+                )
+
+            connection.execute(
+                text("SELECT remove_retention_policy(:table, if_exists => true)"),
+                table,
+            )
+            if self.policies.retention_enabled:
+                connection.execute(
+                    text(
+                        "SELECT add_retention_policy("
+                        ":table, drop_after => CAST(:after AS INTERVAL))"
+                    ),
+                    {**table, "after": self.policies.drop_after},
+                )
+                logger.info(
+                    "Dropping chunks of '{}' older than {}.",
+                    self.table_name,
+                    self.policies.drop_after,
+                )
+        return True
+
+    def refresh_continuous_aggregates(self, since: datetime | None = None) -> bool:
+        """
+        Aktualisiert die Continuous Aggregates für Messwerte, die außerhalb des
+        Fensters der Refresh-Policies (letzte 3 Tage) geschrieben wurden: ohne
+        ``since`` über den gesamten Zeitraum (z.B. nach einem Import historischer
+        Daten), mit ``since`` ab dem Bucket des frühesten neuen Messwerts (z.B.
+        nach dem Catch-Up einer längeren Downtime). Bei aktiver Retention beginnt
+        der Zeitraum frühestens bei ``drop_after``, damit die Aggregate bereits
+        gelöschter Rohdaten erhalten bleiben.
+
+        :param since: Frühester neu geschriebener Zeitstempel (mit Zeitzone);
+                      None aktualisiert den gesamten Zeitraum.
+        :type since: datetime | None
+        :return: True, wenn die Aggregate aktualisiert wurden, False ohne TimescaleDB.
+        :rtype: bool
+        """
+
+        # Nur vollständig im Fenster liegende Buckets werden aktualisiert, daher
+        # beginnt es einen Tag (größter Bucket) vor dem frühesten Messwert
+        window_starts: list[str] = []
+        if since is not None:
+            window_starts.append("CAST(:since AS TIMESTAMPTZ) - INTERVAL '1 day'")
+        if self.policies.retention_enabled:
+            window_starts.append("now() - CAST(:drop_after AS INTERVAL)")
+        window_start: str = (
+            f"GREATEST({', '.join(window_starts)})" if window_starts else "NULL"
+        )
+        # CALL refresh_continuous_aggregate darf nicht in einer Transaktion laufen
+        with self.db_con.engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as connection:
+            if not self.is_timescaledb_available(connection):
+                logger.warning(
+                    "TimescaleDB is not installed, skipping continuous aggregates."
+                )
+                return False
+            for aggregate in CONTINUOUS_AGGREGATES:
+                start = timer()
+                connection.execute(
+                    text(
+                        "CALL refresh_continuous_aggregate("
+                        f":aggregate, {window_start}, NULL)"
+                    ),
+                    {
+                        "aggregate": aggregate,
+                        "since": since,
+                        "drop_after": self.policies.drop_after,
+                    },
+                )
+                logger.info(
+                    "Refreshed continuous aggregate '{}' in {:.1f} s.",
+                    aggregate,
+                    timer() - start,
+                )
+        return True
+
+    def _count_compressed_chunks(self, connection: Connection) -> int:
+        """
+        Zählt die bereits komprimierten Chunks der Hypertable.
+
+        :param connection: Aktive Datenbankverbindung.
+        :type connection: sqlalchemy.Connection
+        :return: Anzahl komprimierter Chunks.
+        :rtype: int
+        """
+
+        return connection.scalar(
+            text(
+                "SELECT count(*) FROM timescaledb_information.chunks "
+                "WHERE hypertable_name = :table AND is_compressed"
+            ),
+            {"table": self.table_name},
+        )
+
+    def inspect(self) -> dict[str, pd.DataFrame]:
+        """
+        Liest den aktuellen Stand der Speicherrichtlinien aus der Datenbank.
+
+        :return: DataFrames für 'dimensions' (Chunk-Intervall), 'jobs'
+                 (Kompressions-, Retention- und Refresh-Richtlinien), 'chunks'
+                 (Anzahl und Zeitraum je Kompressionsstatus) und 'compression'
+                 (Größe vor und nach der Kompression). Ohne TimescaleDB ein
+                 leeres Dictionary.
+        :rtype: dict[str, pd.DataFrame]
+        """
+
+        queries: dict[str, str] = {
+            "dimensions": (
+                "SELECT column_name, time_interval "
+                "FROM timescaledb_information.dimensions "
+                "WHERE hypertable_name = :table"
+            ),
+            "jobs": (
+                "SELECT job_id, proc_name, hypertable_name, schedule_interval, config "
+                "FROM timescaledb_information.jobs "
+                "WHERE hypertable_name = :table "
+                "OR proc_name = 'policy_refresh_continuous_aggregate' "
+                "ORDER BY job_id"
+            ),
+            "chunks": (
+                "SELECT is_compressed, count(*) AS chunks, "
+                "min(range_start) AS range_start, max(range_end) AS range_end "
+                "FROM timescaledb_information.chunks "
+                "WHERE hypertable_name = :table GROUP BY is_compressed"
+            ),
+            "compression": (
+                "SELECT total_chunks, number_compressed_chunks, "
+                "pg_size_pretty(before_compression_total_bytes) AS before_compression, "
+                "pg_size_pretty(after_compression_total_bytes) AS after_compression "
+                "FROM hypertable_compression_stats(:table)"
+            ),
+        }
+        with self.db_con.engine.connect() as connection:
+            if not self.is_timescaledb_available(connection):
+                logger.warning("TimescaleDB is not installed.")
+                return {}
+            return {
+                name: pd.read_sql(
+                    text(query), connection, params={"table": self.table_name}
+                )
+                for name, query in queries.items()
+            }
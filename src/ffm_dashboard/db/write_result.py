@@ -0,0 +1,37 @@
+"""Ergebnis eines Schreibvorgangs in die Tabelle 'sensor_data'."""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class WriteResult:
+    """
+    Ergebnis eines Schreibvorgangs in die Tabelle 'sensor_data'.
+
+    - inserted: Anzahl neu geschriebener Datensätze
+    - skipped: Anzahl bereits vorhandener Datensätze (ON CONFLICT DO NOTHING)
+    - invalid: Anzahl bei der Validierung verworfener Datensätze
+    - earliest_inserted: Frühester neu geschriebener Zeitstempel (None, wenn
+      nichts geschrieben wurde oder er nicht ermittelt wird)
+    """
+
+    inserted: int = 0
+    skipped: int = 0
+    invalid: int = 0
+    earliest_inserted: datetime | None = None
+
+    def __add__(self, other: "WriteResult") -> "WriteResult":
+        """Summiert die Ergebnisse zweier Schreibvorgänge."""
+
+        earliest: list[datetime] = [
+            timestamp
+            for timestamp in (self.earliest_inserted, other.earliest_inserted)
+            if timestamp is not None
+        ]
+        return WriteResult(
+            self.inserted + other.inserted,
+            self.skipped + other.skipped,
+            self.invalid + other.invalid,
+            min(earliest, default=None),
+        )
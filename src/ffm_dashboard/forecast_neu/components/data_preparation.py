@@ -2,6 +2,9 @@
 
 import numpy as np
 import pandas as pd
+import polars as pl
+
+from src.ffm_dashboard.utils.polars_engine import use_polars
 
 # class DataPreprocessor:
 #     def __init__(self, df: pd.DataFrame) -> None:
@@ -47,11 +50,14 @@ class MultiStepPreprocessor:
     :type df: pd.DataFrame
     :param horizon: Anzahl der Zeitschritte in die Zukunft, für die Vorhersageziele erzeugt werden sollen.  # pylint: disable=line-too-long
     :type horizon: int
+    :param polars: Features mit Polars statt pandas berechnen; None liest ``USE_POLARS``.
+    :type polars: bool | None
     """
 
-    def __init__(self, df: pd.DataFrame, horizon: int = 30):
+    def __init__(self, df: pd.DataFrame, horizon: int = 30, polars: bool | None = None):
         self.df = df.copy().set_index("timestamp").sort_index()
         self.horizon = horizon
+        self.polars = use_polars(polars)
 
     def prepare_for_training(self) -> pd.DataFrame:
         """
@@ -67,6 +73,9 @@ class MultiStepPreprocessor:
         :rtype: pd.DataFrame
         """
 
+        if self.polars:
+            return self._prepare_for_training_polars()
+
         df = self.df
 
         # Features
@@ -88,6 +97,43 @@ class MultiStepPreprocessor:
 
         return df_feat.dropna()
 
+    def _prepare_for_training_polars(self) -> pd.DataFrame:
+        """
+        Berechnet dieselben Features und Targets wie ``prepare_for_training`` als
+        Lazy-Query in Polars. Alle Spalten werden in einem Schritt parallel
+        berechnet; das Ergebnis wird wieder als pandas DataFrame mit
+        'timestamp'-Index zurückgegeben.
+
+        :return: Vorverarbeiteter DataFrame mit Features und Zielwerten.
+        :rtype: pd.DataFrame
+        """
+
+        measurement: pl.Expr = pl.col("measurement")
+        hour: pl.Expr = pl.col("timestamp").dt.hour()
+        month: pl.Expr = pl.col("timestamp").dt.month()
+        df_feat: pl.DataFrame = (
+            pl.from_pandas(self.df.reset_index())
+            .lazy()
+            .with_columns(
+                sin_hour=(2 * np.pi * (hour / 24)).sin(),
+                cos_hour=(2 * np.pi * (hour / 24)).cos(),
+                sin_month=(2 * np.pi * (month / 12)).sin(),
+                cos_month=(2 * np.pi * (month / 12)).cos(),
+                lag_1=measurement.shift(1),
+                lag_6=measurement.shift(6),
+                lag_20=measurement.shift(20),
+                rolling_mean_20=measurement.rolling_mean(window_size=20),
+                rolling_std_20=measurement.rolling_std(window_size=20),
+            )
+            .with_columns(
+                measurement.shift(-i).alias(f"target_t+{i}")
+                for i in range(1, self.horizon + 1)
+            )
+            .drop_nulls()
+            .collect()
+        )
+        return df_feat.to_pandas().set_index("timestamp")
+
     def prepare_latest_for_prediction(self) -> pd.DataFrame:
         """
         Bereitet den letzten bekannten Datenpunkt für die Vorhersage vor.
@@ -1,6 +1,26 @@
 """Modul für Util-Funktionen/Klassen."""
 
 from src.ffm_dashboard.utils.dash_helpers import get_icon, get_infobox
+from src.ffm_dashboard.utils.downsampling import (
+    DEFAULT_MAX_PLOT_POINTS,
+    DownsamplingMethod,
+    downsample,
+)
+from src.ffm_dashboard.utils.polars_engine import use_polars
 from src.ffm_dashboard.utils.sensor_data_validation_model import SensorDataModel
+from src.ffm_dashboard.utils.sensor_data_validator import (
+    SensorDataValidationResult,
+    validate_sensor_data,
+)
 
-__all__: list[str] = ["SensorDataModel", "get_icon", "get_infobox"]
+__all__: list[str] = [
+    "DEFAULT_MAX_PLOT_POINTS",
+    "DownsamplingMethod",
+    "SensorDataModel",
+    "SensorDataValidationResult",
+    "downsample",
+    "get_icon",
+    "get_infobox",
+    "use_polars",
+    "validate_sensor_data",
+]
@@ -0,0 +1,132 @@
+"""Reduktion von Zeitreihen auf eine feste Punktanzahl für die Plots."""
+
+from enum import Enum
+from typing import Final
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_MAX_PLOT_POINTS: Final = 2000
+"""Standardanzahl an Punkten je Zeitreihe eines Plots."""
+
+
+class DownsamplingMethod(Enum):
+    """
+    Verfahren zur Reduktion einer Zeitreihe.
+
+    - LTTB: Largest-Triangle-Three-Buckets, erhält die visuelle Form der Kurve
+    - MIN_MAX: Minimum und Maximum je Bucket, erhält alle Spitzen (bei
+      Aggregaten aus deren Minimal- und Maximalwerten je Bucket)
+    """
+
+    LTTB = "lttb"
+    MIN_MAX = "min_max"
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Wählt mit Largest-Triangle-Three-Buckets die Punkte aus, die die Form der
+    Kurve am besten erhalten. Erster und letzter Punkt bleiben immer erhalten,
+    dazwischen wird je Bucket der Punkt mit der größten Dreiecksfläche zum zuvor
+    gewählten Punkt und zum Mittelwert des nächsten Buckets gewählt.
+
+    :param x: Aufsteigend sortierte x-Werte (z.B. Zeitstempel in ns).
+    :type x: np.ndarray
+    :param y: Zugehörige y-Werte ohne NaN.
+    :type y: np.ndarray
+    :param max_points: Maximale Anzahl an Punkten (mindestens 3).
+    :type max_points: int
+    :return: Aufsteigende Indizes der ausgewählten Punkte.
+    :rtype: np.ndarray
+    """
+
+    num_rows: int = len(x)
+    if max_points >= num_rows or max_points < 3:
+        return np.arange(num_rows)
+
+    # Relativ zum ersten Punkt, damit Zeitstempel in ns als float genau bleiben
+    x = (x - x[0]).astype(np.float64)
+    y = y.astype(np.float64)
+    # max_points - 2 Buckets zwischen erstem und letztem Punkt
+    edges: np.ndarray = np.linspace(1, num_rows - 1, max_points - 1).astype(np.int64)
+    counts: np.ndarray = np.diff(edges)
+    avg_x: np.ndarray = np.add.reduceat(x[: edges[-1]], edges[:-1]) / counts
+    avg_y: np.ndarray = np.add.reduceat(y[: edges[-1]], edges[:-1]) / counts
+    next_x: np.ndarray = np.append(avg_x[1:], x[-1])
+    next_y: np.ndarray = np.append(avg_y[1:], y[-1])
+
+    indices: np.ndarray = np.empty(max_points, dtype=np.int64)
+    indices[0], indices[-1] = 0, num_rows - 1
+    selected: int = 0
+    for bucket, (start, end) in enumerate(zip(edges[:-1], edges[1:])):
+        area: np.ndarray = np.abs(
+            (x[selected] - next_x[bucket]) * (y[start:end] - y[selected])
+            - (x[selected] - x[start:end]) * (next_y[bucket] - y[selected])
+        )
+        selected = start + int(np.argmax(area))
+        indices[bucket + 1] = selected
+    return indices
+
+
+def min_max_indices(y: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Wählt je Bucket den kleinsten und größten Wert aus (vollständig
+    vektorisiert). Erster und letzter Punkt bleiben erhalten.
+
+    :param y: y-Werte ohne NaN in zeitlicher Reihenfolge.
+    :type y: np.ndarray
+    :param max_points: Maximale Anzahl an Punkten (mindestens 4).
+    :type max_points: int
+    :return: Aufsteigende Indizes der ausgewählten Punkte.
+    :rtype: np.ndarray
+    """
+
+    num_rows: int = len(y)
+    if max_points >= num_rows or max_points < 4:
+        return np.arange(num_rows)
+
+    num_buckets: int = (max_points - 2) // 2
+    bucket: np.ndarray = np.arange(num_rows) * num_buckets // num_rows
+    # Innerhalb eines Buckets nach Wert sortiert: erster = Minimum, letzter = Maximum
+    order: np.ndarray = np.lexsort((y, bucket))
+    starts: np.ndarray = np.searchsorted(bucket, np.arange(num_buckets))
+    ends: np.ndarray = np.append(starts[1:], num_rows) - 1
+    return np.unique(np.concatenate(([0, num_rows - 1], order[starts], order[ends])))
+
+
+def downsample(
+    df: pd.DataFrame,
+    max_points: int = DEFAULT_MAX_PLOT_POINTS,
+    method: DownsamplingMethod = DownsamplingMethod.LTTB,
+    x: str = "timestamp",
+    y: str = "measurement",
+) -> pd.DataFrame:
+    """
+    Reduziert eine nach ``x`` sortierte Zeitreihe auf höchstens ``max_points``
+    Zeilen. Zeilen ohne Messwert werden dabei verworfen.
+
+    :param df: DataFrame mit der Zeitreihe.
+    :type df: pd.DataFrame
+    :param max_points: Maximale Anzahl an Zeilen.
+    :type max_points: int
+    :param method: Verfahren der Reduktion.
+    :type method: DownsamplingMethod
+    :param x: Spalte mit den Zeitstempeln.
+    :type x: str
+    :param y: Spalte mit den Messwerten.
+    :type y: str
+    :return: DataFrame mit den ausgewählten Zeilen.
+    :rtype: pd.DataFrame
+    """
+
+    if len(df) <= max_points:
+        return df
+
+    df = df[df[y].notna()]
+    y_values: np.ndarray = df[y].to_numpy(dtype=np.float64)
+    if method is DownsamplingMethod.MIN_MAX:
+        indices: np.ndarray = min_max_indices(y_values, max_points)
+    else:
+        x_values: np.ndarray = df[x].to_numpy(dtype="datetime64[ns]").astype(np.int64)
+        indices = lttb_indices(x_values, y_values, max_points)
+    return df.iloc[indices]
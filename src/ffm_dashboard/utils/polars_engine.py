@@ -0,0 +1,25 @@
+"""Umschaltung zwischen pandas und Polars für rechenintensive Transformationen."""
+
+import os
+from typing import Final
+
+USE_POLARS_ENV: Final = "USE_POLARS"
+"""Umgebungsvariable, die den Polars-Pfad aktiviert (true/1/yes)."""
+
+
+def use_polars(enabled: bool | None = None) -> bool:
+    """
+    Entscheidet, ob eine Transformation mit Polars statt pandas ausgeführt wird.
+    Polars wertet die Schritte lazy aus und verteilt sie auf alle Kerne
+    (begrenzbar über ``POLARS_MAX_THREADS``); die Ergebnisse werden als pandas
+    DataFrame zurückgegeben.
+
+    :param enabled: Explizite Auswahl des Aufrufers; None liest ``USE_POLARS``.
+    :type enabled: bool | None
+    :return: True, wenn Polars verwendet werden soll.
+    :rtype: bool
+    """
+
+    if enabled is not None:
+        return enabled
+    return os.environ.get(USE_POLARS_ENV, "").strip().lower() in ("1", "true", "yes")
@@ -0,0 +1,100 @@
+"""Spaltenweise Validierung der Sensor-Daten (Regeln wie ``SensorDataModel``)."""
+
+from dataclasses import dataclass
+from typing import Final
+
+import numpy as np
+import pandas as pd
+
+REQUIRED_COLUMNS: Final = ["timestamp", "box_id", "sensor_id", "measurement"]
+"""Spalten, die für einen gültigen Messwert gesetzt sein müssen."""
+
+OPTIONAL_COLUMNS: Final = ["unit", "sensor_type", "icon", "title"]
+"""Spalten, die leer sein dürfen."""
+
+REJECTION_REASON_COLUMN: Final = "reason"
+"""Spalte mit dem Ablehnungsgrund im Bericht der verworfenen Zeilen."""
+
+
+@dataclass
+class SensorDataValidationResult:
+    """
+    Ergebnis der Validierung eines DataFrames mit Sensor-Daten.
+
+    - data: Gültige Zeilen mit bereinigten Datentypen
+    - mask: Boolesche Maske der gültigen Zeilen (in Reihenfolge der Eingabe)
+    - rejected: Verworfene Zeilen mit dem ersten verletzten Kriterium in 'reason'
+    """
+
+    data: pd.DataFrame
+    mask: np.ndarray
+    rejected: pd.DataFrame
+
+    @property
+    def invalid_count(self) -> int:
+        """Anzahl der verworfenen Zeilen."""
+
+        return len(self.rejected)
+
+    def rejection_summary(self) -> dict[str, int]:
+        """
+        Zählt die verworfenen Zeilen je Ablehnungsgrund.
+
+        :return: Anzahl der Zeilen je Grund.
+        :rtype: dict[str, int]
+        """
+
+        return self.rejected[REJECTION_REASON_COLUMN].value_counts().to_dict()
+
+
+def validate_sensor_data(
+    data: pd.DataFrame, now: pd.Timestamp | None = None
+) -> SensorDataValidationResult:
+    """
+    Prüft Sensor-Daten spaltenweise statt Zeile für Zeile.
+
+    Zeitstempel werden nach UTC umgewandelt (naive Zeitpunkte gelten als UTC),
+    Messwerte in Zahlen. Eine Zeile ist gültig, wenn Zeitstempel, Box-ID,
+    Sensor-ID und ein endlicher Messwert vorhanden sind und der Zeitstempel in
+    der Vergangenheit liegt. Fehlende Spalten gelten als leer.
+
+    :param data: DataFrame mit den Spalten der Tabelle 'sensor_data'.
+    :type data: pd.DataFrame
+    :param now: Vergleichszeitpunkt für Zeitstempel in der Zukunft (Standard: jetzt).
+    :type now: pd.Timestamp | None
+    :return: Gültige Zeilen, Maske und Bericht der verworfenen Zeilen.
+    :rtype: SensorDataValidationResult
+    """
+
+    columns: list[str] = REQUIRED_COLUMNS + OPTIONAL_COLUMNS
+    df: pd.DataFrame = data.reindex(columns=columns).astype(
+        {column: object for column in columns if column not in data.columns}
+    )
+    df["timestamp"] = pd.to_datetime(
+        df["timestamp"], utc=True, errors="coerce", format="ISO8601"
+    )
+    df["measurement"] = pd.to_numeric(df["measurement"], errors="coerce").astype(
+        "float64"
+    )
+    if now is None:
+        now = pd.Timestamp.now(tz="UTC")
+
+    # Reihenfolge bestimmt den gemeldeten Grund, falls mehrere Regeln verletzt sind
+    rules: dict[str, pd.Series] = {
+        "timestamp missing or invalid": df["timestamp"].isna(),
+        "timestamp in the future": df["timestamp"] >= now,
+        "box_id missing": df["box_id"].isna(),
+        "sensor_id missing": df["sensor_id"].isna(),
+        "measurement missing or not finite": ~np.isfinite(df["measurement"]),
+    }
+    reasons: np.ndarray = np.select(
+        [rule.to_numpy(dtype=bool, na_value=False) for rule in rules.values()],
+        list(rules),
+        default="",
+    )
+    mask: np.ndarray = reasons == ""
+
+    rejected: pd.DataFrame = data[~mask].assign(
+        **{REJECTION_REASON_COLUMN: reasons[~mask]}
+    )
+    return SensorDataValidationResult(data=df[mask], mask=mask, rejected=rejected)
@@ -0,0 +1,76 @@
+"""Verwaltung der TimescaleDB-Speicherrichtlinien der Messwerte."""
+
+import argparse
+from pathlib import Path
+
+import pandas as pd
+from loguru import logger
+
+from src.ffm_dashboard.db import DbCon, StoragePolicies, StoragePolicyService
+from src.ffm_dashboard.db.storage_policies import STORAGE_POLICIES_CONFIG_PATH
+
+
+def apply_policies(config_path: Path = STORAGE_POLICIES_CONFIG_PATH):
+    """
+    Wendet Chunk-Intervall, Kompression und Retention aus der Konfiguration an.
+
+    :param config_path: Pfad zur YAML-Konfiguration der Speicherrichtlinien.
+    :type config_path: Path
+    """
+
+    policies = StoragePolicies.from_yaml(config_path)
+    if StoragePolicyService(DbCon(), policies).apply():
+        logger.info("Speicherrichtlinien angewendet: {}", policies)
+
+
+def refresh_aggregates(config_path: Path = STORAGE_POLICIES_CONFIG_PATH):
+    """
+    Aktualisiert die Continuous Aggregates über den gesamten Zeitraum.
+
+    :param config_path: Pfad zur YAML-Konfiguration der Speicherrichtlinien.
+    :type config_path: Path
+    """
+
+    policies = StoragePolicies.from_yaml(config_path)
+    StoragePolicyService(DbCon(), policies).refresh_continuous_aggregates()
+
+
+def inspect_policies():
+    """
+    Gibt Chunk-Intervall, Richtlinien-Jobs, Chunks und Kompressionsrate aus.
+    """
+
+    policies = StoragePolicies()
+    with pd.option_context("display.max_columns", None, "display.width", 200):
+        for name, df in StoragePolicyService(DbCon(), policies).inspect().items():
+            print(f"\n== {name} ==")
+            print(df.to_string(index=False) if not df.empty else "(leer)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Verwaltet Speicherrichtlinien und Aggregate der Tabelle sensor_data"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    apply_parser = subparsers.add_parser(
+        "apply", help="Speicherrichtlinien aus der Konfiguration anwenden"
+    )
+    refresh_parser = subparsers.add_parser(
+        "refresh", help="Stündliche und tägliche Aggregate vollständig aktualisieren"
+    )
+    subparsers.add_parser("inspect", help="Aktuelle Speicherrichtlinien anzeigen")
+    for config_parser in (apply_parser, refresh_parser):
+        config_parser.add_argument(
+            "--config",
+            type=Path,
+            default=STORAGE_POLICIES_CONFIG_PATH,
+            help="YAML-Konfiguration der Speicherrichtlinien",
+        )
+    args = parser.parse_args()
+
+    if args.command == "apply":
+        apply_policies(args.config)
+    elif args.command == "refresh":
+        refresh_aggregates(args.config)
+    else:
+        inspect_policies()
@@ -0,0 +1,171 @@
+"""Prüfung der Ausführungspläne der Plot-Abfragen (EXPLAIN).
+
+Die Rohdaten-Abfrage aus ``SensorDataQueryService.build_plot_query`` muss
+
+- den Zeitraum über den Index ``(sensor_key, timestamp)`` auswerten (ein Cast
+  der Spalte auf ``date`` wäre nur als Filter auswertbar) und
+- mit TimescaleDB nur die Chunks lesen, die den Zeitraum überschneiden.
+
+Benötigt eine erreichbare Datenbank (``config.yaml`` oder die Datei aus der
+Umgebungsvariable ``TEST_DB_CONFIG``), sonst werden die Tests übersprungen; die
+Prüfung des Chunk-Ausschlusses zusätzlich TimescaleDB. Geschrieben und
+anschließend wieder gelöscht werden nur Messwerte der Sensoren mit der Box-ID
+``TEST_BOX_ID`` aus dem Jahr 2000, damit die Chunks nur Testdaten enthalten.
+
+Aufruf: ``uv run pytest tests/test_plot_query_plans.py``
+"""
+
+import os
+from collections.abc import Iterator
+from datetime import date
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from src.ffm_dashboard.db import DbCon, QueryPlan, SensorData, explain
+from src.ffm_dashboard.db.query_plan import CHUNK_PREFIX
+from src.ffm_dashboard.db.sensor_data_db_service import (
+    SensorDataQueryService,
+    day_range,
+)
+
+TEST_DB_CONFIG_ENV = "TEST_DB_CONFIG"
+TEST_BOX_ID = "test-plot-query-plans"
+NUM_SENSORS = 2
+DATA_RANGE = (date(2000, 1, 1), date(2000, 6, 30))
+PLOT_RANGE = (date(2000, 3, 10), date(2000, 3, 11))
+
+
+@pytest.fixture(scope="module")
+def db_con() -> DbCon:
+    """Datenbankverbindung; überspringt die Tests ohne erreichbare Datenbank."""
+
+    config_path: str | None = os.environ.get(TEST_DB_CONFIG_ENV)
+    db_con = DbCon(config_path=Path(config_path)) if config_path else DbCon()
+    try:
+        with db_con.engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    except OperationalError:
+        pytest.skip("database is not reachable")
+    return db_con
+
+
+@pytest.fixture(scope="module")
+def sensor_keys(db_con: DbCon) -> Iterator[list[int]]:
+    """Legt die Testsensoren mit Messwerten im Abstand von drei Minuten an."""
+
+    params: dict = {
+        "box_id": TEST_BOX_ID,
+        "num": NUM_SENSORS,
+        "start": DATA_RANGE[0],
+        "end": DATA_RANGE[1],
+    }
+    delete_test_rows(db_con)
+    with db_con.engine.begin() as connection:
+        keys: list[int] = connection.scalars(
+            text(
+                "INSERT INTO sensor_metadata "
+                "(sensor_id, box_id, unit, sensor_type, icon, title) "
+                "SELECT :box_id || '-' || i, :box_id, '°C', 'HDC1080', "
+                "'osem-thermometer', 'Temperatur' FROM generate_series(1, :num) i "
+                "RETURNING sensor_key"
+            ),
+            params,
+        ).all()
+        connection.execute(
+            text(
+                "INSERT INTO sensor_data (timestamp, measurement, sensor_key) "
+                "SELECT ts, 20 + 5 * random(), sensor_key "
+                "FROM generate_series(CAST(:start AS TIMESTAMPTZ), "
+                "CAST(:end AS TIMESTAMPTZ), interval '3 minutes') ts, "
+                "sensor_metadata WHERE box_id = :box_id"
+            ),
+            params,
+        )
+    with db_con.engine.connect().execution_options(
+        isolation_level="AUTOCOMMIT"
+    ) as connection:
+        connection.execute(text(f"ANALYZE {SensorData.__tablename__}"))
+    yield keys
+    delete_test_rows(db_con)
+
+
+def delete_test_rows(db_con: DbCon) -> None:
+    """Löscht alle von den Tests geschriebenen Messwerte und Sensoren."""
+
+    with db_con.engine.begin() as connection:
+        connection.execute(
+            text(
+                "DELETE FROM sensor_data WHERE sensor_key IN "
+                "(SELECT sensor_key FROM sensor_metadata WHERE box_id = :box_id)"
+            ),
+            {"box_id": TEST_BOX_ID},
+        )
+        connection.execute(
+            text("DELETE FROM sensor_metadata WHERE box_id = :box_id"),
+            {"box_id": TEST_BOX_ID},
+        )
+
+
+def count_chunks(db_con: DbCon, from_date: date, to_date: date) -> int | None:
+    """
+    Zählt die Chunks von 'sensor_data', die den Zeitraum überschneiden.
+
+    :return: Anzahl der Chunks, None ohne TimescaleDB.
+    :rtype: int | None
+    """
+
+    start, end = day_range(from_date, to_date)
+    with db_con.engine.connect() as connection:
+        if not connection.scalar(
+            text("SELECT count(*) FROM pg_extension WHERE extname = 'timescaledb'")
+        ):
+            return None
+        return connection.scalar(
+            text(
+                "SELECT count(*) FROM timescaledb_information.chunks "
+                "WHERE hypertable_name = :table "
+                "AND range_start < :end AND range_end > :start"
+            ),
+            {"table": SensorData.__tablename__, "start": start, "end": end},
+        )
+
+
+def explain_raw_plot_query(db_con: DbCon, sensor_keys: list[int]) -> QueryPlan:
+    """Plan der Plot-Abfrage über ``PLOT_RANGE`` (liest die Rohdaten)."""
+
+    query = SensorDataQueryService.build_plot_query(sensor_keys, list(PLOT_RANGE))
+    assert query.get_final_froms()[0].name == SensorData.__tablename__
+    return explain(db_con, query)
+
+
+def test_raw_plot_query_uses_time_range_in_index(
+    db_con: DbCon, sensor_keys: list[int]
+) -> None:
+    """Der Zeitraum ist Teil der Index-Bedingung, ohne sequenziellen Scan."""
+
+    plan: QueryPlan = explain_raw_plot_query(db_con, sensor_keys)
+
+    assert not plan.has_seq_scan(SensorData.__tablename__)
+    assert not plan.has_seq_scan(CHUNK_PREFIX)
+    assert any("timestamp" in condition for condition in plan.index_conditions), (
+        plan.index_conditions
+    )
+
+
+def test_raw_plot_query_reads_only_overlapping_chunks(
+    db_con: DbCon, sensor_keys: list[int]
+) -> None:
+    """Mit TimescaleDB werden nur die Chunks des Zeitraums gelesen."""
+
+    overlapping: int | None = count_chunks(db_con, *PLOT_RANGE)
+    if overlapping is None:
+        pytest.skip("TimescaleDB is not installed")
+    total: int = count_chunks(db_con, *DATA_RANGE)
+    assert overlapping < total, "test data must span more chunks than the range"
+
+    plan: QueryPlan = explain_raw_plot_query(db_con, sensor_keys)
+
+    assert 0 < len(plan.chunks) <= overlapping, plan.chunks